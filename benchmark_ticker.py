@@ -0,0 +1,655 @@
+"""
+Sports Ticker - PC Benchmark Script
+Times the emulator's fetch/parse/render paths against mock_espn_server.py, a
+local stand-in for the ESPN API, so results are repeatable and don't depend on
+real network latency.
+
+Install requirements:
+    pip install RGBMatrixEmulator Pillow requests
+
+Run:
+    python benchmark_ticker.py fetch
+    python benchmark_ticker.py parse
+"""
+
+import os
+import sys
+import json
+import time
+
+import emulator_ticker as ticker
+import mock_espn_server
+
+# Bytes per displayio.Palette entry on CircuitPython (_displayio_color_t:
+# rgb888, cached color, colorspace bytes, transparent flag)
+PALETTE_ENTRY_BYTES = 12
+
+# Simulated per-league round trip (seconds). The college slates are the slow ones.
+FETCH_LATENCY = {
+    "nfl": 0.25, "mlb": 0.20, "nhl": 0.20, "nba": 0.25,
+    "cfb": 0.90, "cbb": 0.80, "chk": 0.30,
+}
+
+
+def game_fields(games):
+    """Games as plain tuples, for comparing two parses."""
+    return [tuple(getattr(game, name) for name in game.__slots__) for game in games]
+
+
+def point_ticker_at(server):
+    """Aim the emulator's scoreboard URLs at a mock_espn_server instance."""
+    base = mock_espn_server.base_url(server)
+    ticker.SPORT_URLS[:] = [
+        f"{base}/{sport}/{ticker.espn_league_slugs[league]}/scoreboard"
+        for sport, league in zip(ticker.sport_names, ticker.sport_leagues)
+    ]
+
+
+def bench_fetch(rounds=3):
+    """Compare sequential vs concurrent refresh_games()."""
+    config = mock_espn_server.MockConfig()
+    config.league_latency = FETCH_LATENCY
+    server = mock_espn_server.start_server(config)
+    point_ticker_at(server)
+
+    timings = {}
+    for concurrent in (False, True):
+        ticker.fetch_concurrent = concurrent
+        best = None
+        for _ in range(rounds):
+            start = time.perf_counter()
+            ticker.refresh_games(force=True)
+            elapsed = time.perf_counter() - start
+            games = ticker.current_games()
+            best = elapsed if best is None else min(best, elapsed)
+        timings["concurrent" if concurrent else "sequential"] = (best, len(games))
+
+    server.shutdown()
+    print(f"\n{'=' * 50}")
+    print(f"  FETCH ({len(ticker.SPORT_URLS)} leagues, best of {rounds})")
+    print(f"{'=' * 50}")
+    for name, (best, count) in timings.items():
+        print(f"  {name:>10}: {best * 1000:7.0f} ms  ({count} games)")
+    print(f"  speedup: {timings['sequential'][0] / timings['concurrent'][0]:.1f}x")
+
+
+def bench_stream(events=300, chunk_size=512):
+    """Peak memory and time: resp.json()-style parse vs espn_stream on a big CFB slate."""
+    import gc
+    import tracemalloc
+    import espn_stream
+
+    payload = json.dumps(mock_espn_server.make_scoreboard("cfb", events)).encode()
+
+    def full_parse():
+        data = json.loads(payload)
+        return [ticker.parse_game(event, 4) for event in data.get("events", [])]
+
+    def stream_parse():
+        games = []
+        parser = espn_stream.ScoreboardParser(lambda event: games.append(ticker.parse_game(event, 4)))
+        for start in range(0, len(payload), chunk_size):
+            parser.feed(payload[start:start + chunk_size])
+        parser.close()
+        return games
+
+    results = {}
+    for name, parse in (("json", full_parse), ("stream", stream_parse)):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        games = parse()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results[name] = (peak, elapsed, games)
+
+    assert game_fields(results["json"][2]) == game_fields(results["stream"][2]), "stream parser disagrees with json"
+    print(f"\n{'=' * 50}")
+    print(f"  STREAM PARSE ({events} events, {len(payload) / 1024:.0f}KB payload)")
+    print(f"{'=' * 50}")
+    for name, (peak, elapsed, games) in results.items():
+        print(f"  {name:>6}: peak {peak / 1024:8.1f} KB   {elapsed * 1000:7.1f} ms  ({len(games)} games)")
+    print(f"  peak memory: {results['json'][0] / results['stream'][0]:.0f}x lower when streaming")
+
+
+def bench_parse(events=300, refreshes=20, changed=0.1):
+    """Parse cost per refresh on a big CFB slate, with and without the parse cache.
+
+    Each refresh bumps the score of a changed fraction of the live games,
+    roughly what a 30s poll of a college Saturday looks like.
+    """
+    import random
+
+    league_idx = ticker.sport_leagues.index("cfb")
+    base = mock_espn_server.make_scoreboard("cfb", events)["events"]
+    rng = random.Random(0)
+    slates = []
+    current = json.loads(json.dumps(base))
+    for _ in range(refreshes):
+        current = json.loads(json.dumps(current))
+        live = [e for e in current if e["status"]["type"]["name"] == "STATUS_IN_PROGRESS"]
+        for event in rng.sample(live, max(1, int(len(live) * changed))):
+            competitor = event["competitions"][0]["competitors"][rng.randrange(2)]
+            competitor["score"] = str(int(competitor["score"]) + 3)
+        slates.append(current)
+
+    def uncached(slate):
+        return [ticker.parse_game(event, league_idx) for event in slate]
+
+    def cached(slate):
+        return ticker.parse_events(slate, league_idx)
+
+    results = {}
+    for name, parse in (("uncached", uncached), ("cached", cached)):
+        ticker.parse_cache.clear()
+        parse(base)  # Warm up - the first poll always parses everything
+        start = time.perf_counter()
+        for slate in slates:
+            games = parse(slate)
+        results[name] = ((time.perf_counter() - start) / refreshes, games)
+
+    assert game_fields(results["uncached"][1]) == game_fields(results["cached"][1]), "parse cache returned stale games"
+    print(f"\n{'=' * 50}")
+    print(f"  PARSE ({events} events, {changed:.0%} of live games change per refresh)")
+    print(f"{'=' * 50}")
+    for name, (per_refresh, games) in results.items():
+        print(f"  {name:>8}: {per_refresh * 1000:6.2f} ms per refresh  ({len(games)} games)")
+    print(f"  speedup: {results['uncached'][0] / results['cached'][0]:.1f}x")
+
+
+def bench_records(events=300):
+    """Heap per game: the old 12-key dict vs the slotted Game record."""
+    import gc
+    import tracemalloc
+
+    league_idx = ticker.sport_leagues.index("cfb")
+    slate = mock_espn_server.make_scoreboard("cfb", events)["events"]
+    games = [ticker.parse_game(event, league_idx) for event in slate]
+
+    def as_dict(game):
+        # What parse_game returned before the Game record
+        return {
+            "id": game.id,
+            "league": ticker.league_display_names.get("cfb"),
+            "league_idx": game.league_idx,
+            "home_team": game.home_team,
+            "away_team": game.away_team,
+            "home_score": game.home_score,
+            "away_score": game.away_score,
+            "status": game.status,
+            "is_final": game.is_final,
+            "is_live": game.is_live,
+            "is_scheduled": game.is_scheduled,
+            "start": game.start,
+        }
+
+    def as_record(game):
+        return ticker.Game(game.id, game.league_idx, game.state, game.home_team, game.away_team,
+                           game.home_score, game.away_score, game.status, game.start)
+
+    # The field strings are shared by both, so only the container (plus the
+    # record's score_text) is counted - the part the representation changes.
+    results = {}
+    for name, build in (("dict", as_dict), ("Game", as_record)):
+        gc.collect()
+        tracemalloc.start()
+        built = [build(game) for game in games]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[name] = size / len(built)
+        del built
+
+    print(f"\n{'=' * 50}")
+    print(f"  GAME RECORD MEMORY ({events} CFB games, CPython)")
+    print(f"{'=' * 50}")
+    for name, per_game in results.items():
+        print(f"  {name:>5}: {per_game:6.0f} bytes per game")
+    print(f"  saving: {1 - results['Game'] / results['dict']:.0%}")
+
+
+def sample_games(leagues=("nfl", "mlb", "nhl", "nba")):
+    """Parsed games from the mock scoreboards, using the real logo abbreviations."""
+    games = []
+    for league in leagues:
+        league_idx = ticker.sport_leagues.index(league)
+        for event in mock_espn_server.make_scoreboard(league)["events"]:
+            games.append(ticker.parse_game(event, league_idx))
+    return games
+
+
+def bench_render(frames=200):
+    """Time per rendered game card: no caches, the logo cache, then the logo
+    and frame caches. Checks every cached frame against a fresh draw."""
+    games = sample_games()
+    pushed = []
+    ticker.matrix.SetImage = lambda image, *args, **kwargs: pushed.append(image)  # Time the drawing, not the push
+
+    results = {}
+    saved_sizes = ticker.logo_cache_size, ticker.frame_cache_size
+    configs = (("uncached", 0, 0), ("logos", saved_sizes[0], 0), ("frames", saved_sizes[0], saved_sizes[1]))
+    for name, logo_size, frame_size in configs:
+        ticker.logo_cache_size, ticker.frame_cache_size = logo_size, frame_size
+        ticker.logo_cache.clear()
+        ticker.frame_cache.clear()
+        ticker.frame_keys.clear()
+        ticker.card_bases.clear()
+        ticker.logo_cache_hits = ticker.logo_cache_misses = 0
+        ticker.frame_cache_hits = ticker.frame_cache_misses = 0
+        del pushed[:]
+        start = time.perf_counter()
+        for frame in range(frames):
+            ticker.render_game(games[frame % len(games)])
+        results[name] = ((time.perf_counter() - start) / frames, ticker.logo_cache_stats(), ticker.frame_cache_stats())
+        if not logo_size:
+            assert not ticker.logo_cache, "logo cache kept entries with logo_cache_size 0"
+    ticker.logo_cache_size, ticker.frame_cache_size = saved_sizes
+
+    for frame, image in enumerate(pushed):
+        expected = ticker.draw_game(games[frame % len(games)])
+        assert image.tobytes() == expected.tobytes(), f"cached frame {frame} differs from a fresh draw"
+
+    print(f"\n{'=' * 50}")
+    print(f"  RENDER ({frames} frames over {len(games)} games)")
+    print(f"{'=' * 50}")
+    for name, (per_frame, logo_stats, frame_stats) in results.items():
+        print(f"  {name:>8}: {per_frame * 1000:6.3f} ms per frame  "
+              f"(logos {logo_stats['hits']}/{logo_stats['misses']}, "
+              f"frames {frame_stats['hits']}/{frame_stats['misses']} hits/misses)")
+    print(f"  speedup: logo cache {results['uncached'][0] / results['logos'][0]:.1f}x, "
+          f"+ frame cache {results['uncached'][0] / results['frames'][0]:.1f}x")
+    print(f"  all {frames} cached frames identical to a fresh draw")
+
+
+def bench_regions(updates=10):
+    """Live score and clock updates: full card redraws vs redrawing only the
+    regions that changed. Checks every region-only card against a full draw."""
+    games = [game for game in sample_games(ticker.sport_leagues) if game.is_live]
+    rounds = []
+    for update in range(updates):
+        changed = []
+        for game in games:
+            home_score = game.home_score
+            if update % 3 == 2:
+                home_score = str(int(home_score) + 1)  # A score every third update, clock ticks between
+            changed.append(ticker.Game(game.id, game.league_idx, game.state, game.home_team, game.away_team,
+                                       home_score, game.away_score, f"{12 - update}:00 - 2nd", game.start))
+        games = changed
+        rounds.append(changed)
+
+    def run(with_regions):
+        ticker.card_bases.clear()
+        for game in rounds[0]:
+            ticker.draw_card(ticker.game_card(game), game.id)
+        ticker.card_full_draws = ticker.card_partial_draws = ticker.card_pixels_touched = 0
+        frames = []
+        start = time.perf_counter()
+        for update, changed in enumerate(rounds[1:], 1):
+            for game in changed:
+                game_id = game.id if with_regions else None
+                if update % 3 == 2:
+                    frames.append(ticker.draw_card(ticker.alert_card(game), game_id))
+                frames.append(ticker.draw_card(ticker.game_card(game), game_id))
+        return (time.perf_counter() - start) / len(frames), ticker.card_draw_stats(), frames
+
+    results = {"full": run(False), "regions": run(True)}
+    for full, partial in zip(results["full"][2], results["regions"][2]):
+        assert full.tobytes() == partial.tobytes(), "region-only card differs from a full draw"
+
+    frame_pixels = ticker.DISPLAY_WIDTH * ticker.DISPLAY_HEIGHT
+    print(f"\n{'=' * 50}")
+    print(f"  REGIONS ({len(games)} live games, {updates - 1} updates each)")
+    print(f"{'=' * 50}")
+    for name, (per_draw, stats, frames) in results.items():
+        print(f"  {name:>7}: {per_draw * 1000:6.3f} ms per card, {stats['pixels_per_draw']:6.0f} of "
+              f"{frame_pixels} pixels touched ({stats['full']} full, {stats['partial']} regions only)")
+    print(f"  speedup: {results['full'][0] / results['regions'][0]:.1f}x")
+    print(f"  all {len(results['regions'][2])} region-only cards identical to a full draw")
+
+
+def legacy_draw_text(draw, x, y, text, color):
+    """The original text path: measure with getbbox(), draw with draw.text()."""
+    bbox = ticker.pil_font.getbbox(text)
+    draw.text((x, y), text, fill=color, font=ticker.pil_font)
+    return bbox[2] - bbox[0]
+
+
+def card_strings(games):
+    """(text, color) for every string a game card draws."""
+    strings = []
+    for game in games:
+        strings += [(game.league, (255, 255, 0)), (game.home_team, (255, 255, 255)),
+                    (game.away_team, (255, 255, 255)), (game.score_text, game.score_color),
+                    (game.status, game.status_color)]
+    return strings
+
+
+def bench_text(frames=200):
+    """Text cost per game card: getbbox() + draw.text() vs the glyph atlas,
+    cold and warm. Checks every string, and every pair of printable
+    characters, against draw.text()."""
+    from PIL import Image, ImageDraw
+
+    games = sample_games(ticker.sport_leagues)
+    strings = card_strings(games)
+    per_card = len(strings) // len(games)
+    canvas = Image.new("RGB", (ticker.DISPLAY_WIDTH, ticker.DISPLAY_HEIGHT), (0, 0, 0))
+    draw = ImageDraw.Draw(canvas)
+
+    def run(draw_text):
+        start = time.perf_counter()
+        for frame in range(frames):
+            offset = frame % len(games) * per_card
+            for text, color in strings[offset:offset + per_card]:
+                draw_text(draw, 10, 20, text, color)
+        return (time.perf_counter() - start) / frames
+
+    def atlas_text(draw, x, y, text, color):
+        ticker.draw_text(draw, x, y, text, color)
+        return ticker.text_width(text)
+
+    ticker.glyph_atlas.clear()
+    ticker.text_cache.clear()
+    results = {"draw.text": run(legacy_draw_text)}
+    start = time.perf_counter()
+    for text, color in strings:
+        ticker.text_width(text)
+    cold = (time.perf_counter() - start) / len(games)
+    results["atlas"] = run(atlas_text)
+    stats = ticker.text_cache_stats()
+
+    printable = [chr(code) for code in range(32, 127)]
+    checks = [text for text, _ in strings] + [a + b for a in printable for b in printable]
+    fallbacks = 0
+    for text in checks:
+        expected = Image.new("RGB", (80, 16), (20, 40, 60))
+        actual = expected.copy()
+        width = legacy_draw_text(ImageDraw.Draw(expected), 8, 1, text, (255, 200, 0))
+        ticker.draw_text(ImageDraw.Draw(actual), 8, 1, text, (255, 200, 0))
+        assert actual.tobytes() == expected.tobytes(), f"{text!r} differs from draw.text()"
+        assert ticker.text_width(text) == width, f"{text!r} width differs from getbbox()"
+        if ticker.layout_text(text)[0] is None:
+            fallbacks += 1
+
+    print(f"\n{'=' * 50}")
+    print(f"  TEXT ({frames} cards, {per_card} strings each, {len(games)} games)")
+    print(f"{'=' * 50}")
+    for name, per_frame in results.items():
+        print(f"  {name:>9}: {per_frame * 1000:6.3f} ms of text per card")
+    print(f"  atlas cold: {cold * 1000:6.3f} ms per card to lay out "
+          f"{len(set(strings))} distinct strings from {stats['glyphs']} glyphs")
+    print(f"  speedup: {results['draw.text'] / results['atlas']:.1f}x")
+    print(f"  {len(checks)} strings identical to draw.text() ({fallbacks} drawn with it)")
+
+
+def legacy_process_logo(logo_path, size):
+    """The original per-pixel getpixel/putpixel logo processing, kept as the
+    golden reference for ticker.process_team_logo."""
+    from PIL import Image
+
+    logo = Image.open(logo_path)
+    if logo.mode == "P":
+        palette = logo.getpalette()
+        pixel_indices = []
+        for y in range(logo.height):
+            for x in range(logo.width):
+                pixel_indices.append(logo.getpixel((x, y)))
+
+        corners = [
+            pixel_indices[0],
+            pixel_indices[logo.width - 1],
+            pixel_indices[(logo.height - 1) * logo.width],
+            pixel_indices[(logo.height - 1) * logo.width + logo.width - 1],
+        ]
+        bg_index = max(set(corners), key=corners.count)
+
+        max_channel = 0
+        for idx in set(pixel_indices):
+            if idx != bg_index:
+                max_channel = max(max_channel, palette[idx * 3], palette[idx * 3 + 1], palette[idx * 3 + 2])
+
+        if max_channel > 0 and max_channel < 80:
+            brightness_scale = 200.0 / max_channel
+        elif max_channel > 0 and max_channel < 150:
+            brightness_scale = 255.0 / max_channel
+        else:
+            brightness_scale = 1.0
+
+        logo_rgb = Image.new("RGB", logo.size, (0, 0, 0))
+        for y in range(logo.height):
+            for x in range(logo.width):
+                idx = pixel_indices[y * logo.width + x]
+                if idx == bg_index:
+                    logo_rgb.putpixel((x, y), (0, 0, 0))
+                else:
+                    r = min(255, int(palette[idx * 3] * brightness_scale))
+                    g = min(255, int(palette[idx * 3 + 1] * brightness_scale))
+                    b = min(255, int(palette[idx * 3 + 2] * brightness_scale))
+                    logo_rgb.putpixel((x, y), (r, g, b))
+        logo = logo_rgb
+    elif logo.mode == "RGBA":
+        background = Image.new("RGB", logo.size, (0, 0, 0))
+        background.paste(logo, mask=logo.split()[3])
+        logo = background
+    else:
+        logo = logo.convert("RGB")
+    return logo.resize((size, size), Image.NEAREST)
+
+
+def shipped_logos():
+    """(league_idx, abbr, path) for every logo under sport_logos/team*_logos."""
+    logos = []
+    for league_idx, folder in enumerate(ticker.logo_folders):
+        folder_path = os.path.join(ticker.LOGO_BASE_PATH, folder)
+        if not os.path.isdir(folder_path):
+            continue
+        for name in sorted(os.listdir(folder_path)):
+            if name.lower().endswith(".bmp"):
+                logos.append((league_idx, name[:-4], os.path.join(folder_path, name)))
+    return logos
+
+
+def bench_logos(sizes=(24, 32)):
+    """Golden check + timing: per-pixel logo processing vs the baked logos.
+
+    Checks both the baked atlas and baking straight from the .bmp, and fails
+    if any shipped logo comes out different by even one pixel.
+    """
+    from PIL import Image
+    import logo_atlas
+
+    logos = shipped_logos()
+    mismatches = []
+    timings = {"per-pixel": 0.0, "baked": 0.0}
+    for size in sizes:
+        for league_idx, abbr, path in logos:
+            start = time.perf_counter()
+            expected = legacy_process_logo(path, size)
+            timings["per-pixel"] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            actual = ticker.process_team_logo(abbr, league_idx, size)
+            timings["baked"] += time.perf_counter() - start
+
+            rebaked = logo_atlas.bake_logo(Image.open(path), size).convert("RGB")
+            for result in (actual, rebaked):
+                if result is None or result.mode != expected.mode or result.tobytes() != expected.tobytes():
+                    mismatches.append(f"{ticker.logo_folders[league_idx]}/{abbr}.bmp @ {size}px")
+                    break
+
+    count = len(logos) * len(sizes)
+    print(f"\n{'=' * 50}")
+    print(f"  LOGO PROCESSING ({len(logos)} logos x {len(sizes)} sizes)")
+    print(f"{'=' * 50}")
+    for name, total in timings.items():
+        print(f"  {name:>9}: {total * 1000:8.0f} ms total  {total / count * 1000:6.2f} ms per logo")
+    print(f"  speedup: {timings['per-pixel'] / timings['baked']:.1f}x")
+    if mismatches:
+        print(f"  GOLDEN CHECK FAILED for {len(mismatches)} logos:")
+        for mismatch in mismatches[:20]:
+            print(f"    {mismatch}")
+        sys.exit(1)
+    print(f"  golden check: all {count} outputs pixel-identical")
+
+
+def bench_atlas(rounds=3):
+    """Cold-load every shipped logo at every display size: bake from each
+    team's BMP at runtime vs read the baked atlas for the league.
+
+    Checks the atlas hands back exactly the pixels and palette of a runtime bake.
+    """
+    from PIL import Image
+    import logo_atlas
+
+    logos = shipped_logos()
+    folders = sorted({league_idx for league_idx, _, _ in logos})
+    sizes = logo_atlas.DISPLAY_SIZES
+    atlas_paths = {}
+    for league_idx in folders:
+        folder_path = os.path.join(ticker.LOGO_BASE_PATH, ticker.logo_folders[league_idx])
+        for size in sizes:
+            path = logo_atlas.atlas_path(logo_atlas.display_folder(folder_path, size))
+            if not os.path.exists(path):
+                logo_atlas.bake_folder(folder_path, sizes)
+                logo_atlas.build_atlas(logo_atlas.display_folder(folder_path, size))
+            atlas_paths[(league_idx, size)] = path
+
+    def from_bmps():
+        images = []
+        for size in sizes:
+            for league_idx, abbr, path in logos:
+                images.append(logo_atlas.bake_logo(Image.open(path), size))
+        return images
+
+    def from_mapped_atlas():
+        images = []
+        atlases = {key: logo_atlas.MappedAtlas(path) for key, path in atlas_paths.items()}
+        for size in sizes:
+            for league_idx, abbr, _ in logos:
+                images.append(atlases[(league_idx, size)].image(abbr))
+        return images
+
+    def from_seek_atlas():
+        # What code.py does on the board: binary search the index, read one record
+        atlases = {key: logo_atlas.AtlasFile(path) for key, path in atlas_paths.items()}
+        pixels = []
+        for size in sizes:
+            for league_idx, abbr, _ in logos:
+                atlas = atlases[(league_idx, size)]
+                pixel_buf = bytearray(atlas.width * atlas.height)
+                atlas.read(abbr, bytearray(logo_atlas.PALETTE_SIZE), pixel_buf)
+                pixels.append(pixel_buf)
+        for atlas in atlases.values():
+            atlas.close()
+        return pixels
+
+    results = {}
+    for name, load in (("bake bmps", from_bmps), ("mmap atlas", from_mapped_atlas), ("seek atlas", from_seek_atlas)):
+        best = None
+        for _ in range(rounds):
+            start = time.perf_counter()
+            loaded = load()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = (best, loaded)
+
+    baked = results["bake bmps"][1]
+    for source, mapped, seeked in zip(baked, results["mmap atlas"][1], results["seek atlas"][1]):
+        assert mapped.mode == source.mode and mapped.tobytes() == source.tobytes(), "atlas pixels differ"
+        assert source.mode != "P" or mapped.getpalette() == source.getpalette(), "atlas palette differs"
+        assert bytes(seeked) == source.tobytes(), "seek reader pixels differ"
+
+    count = len(logos) * len(sizes)
+    print(f"\n{'=' * 50}")
+    print(f"  LOGO ATLAS ({len(logos)} logos x {len(sizes)} sizes in {len(folders)} leagues, best of {rounds})")
+    print(f"{'=' * 50}")
+    for name, (best, _) in results.items():
+        print(f"  {name:>10}: {best * 1000:7.1f} ms  ({best / count * 1e6:5.0f} us per logo)")
+    print(f"  speedup (mmap): {results['bake bmps'][0] / results['mmap atlas'][0]:.1f}x")
+
+
+def bench_palette():
+    """Per-logo palettes vs one shared palette per league, for the board's 32px
+    atlas: palette RAM per frame (two logos) and the color error it costs."""
+    import math
+    import tempfile
+    import logo_atlas
+
+    size = logo_atlas.BOARD_SIZE
+    print(f"\n{'=' * 50}")
+    print(f"  SHARED PALETTE ({size}px board atlases)")
+    print(f"{'=' * 50}")
+    print(f"  {'folder':<12} {'logos':>5} {'per-logo':>9} {'shared':>7} {'mean err':>9} {'PSNR':>7}  worst")
+
+    totals = {"logos": 0, "colors": 0, "squared": 0.0, "absolute": 0, "samples": 0}
+    with tempfile.TemporaryDirectory() as tmp:
+        for folder in ticker.logo_folders:
+            folder_path = os.path.join(ticker.LOGO_BASE_PATH, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            variant_path = logo_atlas.display_folder(folder_path, size)
+            if not os.path.isdir(variant_path):
+                logo_atlas.bake_folder(folder_path)
+            own_path, count = logo_atlas.build_atlas(variant_path, os.path.join(tmp, "own.atlas"))
+            shared_path, _ = logo_atlas.build_atlas(variant_path, os.path.join(tmp, "shared.atlas"), shared_palette=True)
+            own = logo_atlas.MappedAtlas(own_path)
+            shared = logo_atlas.MappedAtlas(shared_path)
+
+            colors = 0
+            squared = 0.0
+            absolute = 0
+            worst = (0.0, "")
+            for abbr in sorted(own.offsets):
+                colors += own.record(abbr)[0]
+                expected = own.image(abbr).convert("RGB").tobytes()
+                actual = shared.image(abbr).convert("RGB").tobytes()
+                diffs = [abs(a - b) for a, b in zip(expected, actual)]
+                logo_squared = sum(d * d for d in diffs)
+                squared += logo_squared
+                absolute += sum(diffs)
+                worst = max(worst, (logo_squared / len(diffs), abbr))
+            shared_colors = shared.record(next(iter(shared.offsets)))[0]
+            own.close()
+            shared.close()
+
+            samples = count * size * size * 3
+            mse = squared / samples
+            psnr = 10 * math.log10(255 ** 2 / mse) if mse else float("inf")
+            print(f"  {folder:<12} {count:>5} {colors / count:>9.0f} {shared_colors:>7} "
+                  f"{absolute / samples:>9.2f} {psnr:>6.1f}dB  {worst[1]}")
+            totals["logos"] += count
+            totals["colors"] += colors
+            totals["squared"] += squared
+            totals["absolute"] += absolute
+            totals["samples"] += samples
+
+    per_logo = totals["colors"] / totals["logos"]
+    per_frame_own = 2 * per_logo * PALETTE_ENTRY_BYTES
+    shared_once = 256 * PALETTE_ENTRY_BYTES
+    mse = totals["squared"] / totals["samples"]
+    print(f"  palette RAM per frame: {per_frame_own:.0f} bytes per-logo -> 0 shared "
+          f"(+{shared_once} bytes once per league, {PALETTE_ENTRY_BYTES} bytes per entry)")
+    print(f"  color error: mean {totals['absolute'] / totals['samples']:.2f}/255 per channel, "
+          f"PSNR {10 * math.log10(255 ** 2 / mse):.1f}dB over {totals['logos']} logos")
+
+
+BENCHMARKS = {
+    "fetch": bench_fetch,
+    "stream": bench_stream,
+    "parse": bench_parse,
+    "records": bench_records,
+    "render": bench_render,
+    "text": bench_text,
+    "regions": bench_regions,
+    "logos": bench_logos,
+    "atlas": bench_atlas,
+    "palette": bench_palette,
+}
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark '{name}'. Choose from: {', '.join(BENCHMARKS)}")
+            sys.exit(1)
+        BENCHMARKS[name]()
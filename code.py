@@ -8,6 +8,7 @@ import os
 import gc
 import ssl
 import time
+import asyncio
 import wifi
 import socketpool
 import adafruit_requests
@@ -15,13 +16,16 @@ import adafruit_display_text.label
 import board
 import terminalio
 import displayio
+import bitmaptools
 import framebufferio
 import rgbmatrix
 import microcontroller
 from adafruit_ticks import ticks_ms, ticks_add, ticks_diff
 from adafruit_datetime import datetime, timedelta
 import neopixel
-import digitalio
+import keypad
+import espn_stream
+import logo_atlas
 
 displayio.release_displays()
 
@@ -97,26 +101,35 @@ league_modes = [
 current_league_mode = 0
 my_teams_active = False  # DOWN button toggles this
 
-# Setup buttons (built-in on MatrixPortal S3)
-button_up = digitalio.DigitalInOut(board.BUTTON_UP)
-button_up.direction = digitalio.Direction.INPUT
-button_up.pull = digitalio.Pull.UP
-
-button_down = digitalio.DigitalInOut(board.BUTTON_DOWN)
-button_down.direction = digitalio.Direction.INPUT
-button_down.pull = digitalio.Pull.UP
-
-# Debounce tracking
-last_button_time = 0
-DEBOUNCE_MS = 300  # Minimum milliseconds between button presses
+# Setup buttons (built-in on MatrixPortal S3, active LOW with pull-up).
+# keypad scans them in the background every 20ms, debounces them and
+# queues timestamped events, so a press during a fetch or an alert waits
+# in the queue instead of being missed.
+KEY_UP = 0
+KEY_DOWN = 1
+buttons = keypad.Keys((board.BUTTON_UP, board.BUTTON_DOWN),
+                      value_when_pressed=False, pull=True, max_events=16)
+button_event = keypad.Event()  # Reused for every event read from the queue
 
 # Time between ESPN API calls for score refresh (seconds)
-# Uses the fast interval when any game is live, slow interval otherwise
-fetch_interval_live = 30   # 30 seconds when games are in progress
-fetch_interval_idle = 300  # 5 minutes when no live games
+# Each league is polled on its own schedule: fast only while that league
+# has a live game, slow when it is idle, and very slow in its off-season.
+fetch_interval_live = 30         # 30 seconds when the league has a game in progress
+fetch_interval_idle = 300        # 5 minutes when the league has no live games
+fetch_interval_offseason = 3600  # 1 hour when the league has no games listed
+fetch_prestart_lead = 600        # Poll fast starting 10 minutes before a scheduled start
 
 # Time to display each game (seconds)
 display_interval = 5  # 5 seconds per game
+mode_display_ms = 1500  # How long the mode banner stays up after a button press
+
+# Scoreboards are read in chunks of this many bytes and only the fields the
+# ticker shows are kept (see espn_stream.py), so big college slates fit in RAM.
+stream_chunk_size = 512
+
+# RAM for recently used logos, so the teams in the rotation are read from
+# flash once instead of every time they're shown (~1.8KB per logo).
+logo_cache_bytes = 64 * 1024
 
 # ============================================================
 #  MATRIX PANEL CONFIGURATION
@@ -186,12 +199,17 @@ context = ssl.create_default_context()
 pool = socketpool.SocketPool(wifi.radio)
 requests = adafruit_requests.Session(pool, context)
 
+# ESPN API base URL. Add ESPN_BASE_URL to settings.toml to point the board at
+# mock_espn_server.py on your PC instead (e.g. "http://192.168.1.20:8765/apis/site/v2/sports").
+espn_base_url = os.getenv("ESPN_BASE_URL") or "https://site.api.espn.com/apis/site/v2/sports"
+print(f"ESPN API: {espn_base_url}")
+
 # Builds URL used for API call to include all leagues in sports_leagues list.
 SPORT_URLS = []
 for i in range(len(sport_leagues)):
     league = sport_leagues[i]
     espn_slug = espn_league_slugs[league]
-    url = f"https://site.api.espn.com/apis/site/v2/sports/{sport_names[i]}/{espn_slug}/scoreboard"
+    url = f"{espn_base_url}/{sport_names[i]}/{espn_slug}/scoreboard"
     SPORT_URLS.append(url)
     print(f"Added URL for {league_display_names[league]}")
 
@@ -230,6 +248,50 @@ def convert_date_format(date_str, tz_info):
         print(f"Date conversion error: {e}")
         return "TBD"
 
+# Days since 1970-01-01 for a calendar date (proleptic Gregorian).
+# Done by hand so it behaves the same on every port, whatever its time.mktime epoch.
+def days_from_civil(year, month, day):
+    if month <= 2:
+        year -= 1
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+# Convert an ESPN UTC date (e.g. "2025-01-18T00:30Z") to epoch seconds, or None.
+def parse_start_time(date_str):
+    try:
+        days = days_from_civil(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        return days * 86400 + int(date_str[11:13]) * 3600 + int(date_str[14:16]) * 60
+    except Exception:
+        return None
+
+# Convert an HTTP Date header (e.g. "Sat, 18 Jan 2025 00:30:00 GMT") to epoch seconds, or None.
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+          "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+def parse_http_date(date_str):
+    try:
+        parts = date_str.split()
+        day = int(parts[1])
+        month = MONTHS.index(parts[2]) + 1
+        year = int(parts[3])
+        hour, minute, second = [int(p) for p in parts[4].split(":")]
+        return days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second
+    except Exception:
+        return None
+
+# The board has no real-time clock, so UTC "now" is taken from the Date header
+# of the last ESPN response and advanced with ticks_ms().
+server_time = None   # epoch seconds from the last Date header
+server_ticks = 0     # ticks_ms() when server_time was read
+
+def utc_now():
+    if server_time is None:
+        return None
+    return server_time + ticks_diff(ticks_ms(), server_ticks) // 1000
+
 # Get the logo folder index for a league.
 def get_league_index(league):
     try:
@@ -237,52 +299,408 @@ def get_league_index(league):
     except ValueError:
         return 0
 
-# Fetch all games from all leagues and return a list of game data
-def fetch_all_games():
-    all_games = []
+# ============================================================
+#  TEAM FILTER
+#  Keyed by league, so BOS in my_teams["nhl"] doesn't also pick up
+#  the Celtics and Red Sox.
+# ============================================================
+# Team filter per league: {league_idx: set of abbreviations}.
+# Leagues missing from it show every team.
+def build_team_filter():
+    result = {}
+    if my_teams_active:
+        for league, teams in my_teams.items():
+            if teams and league in sport_leagues:
+                result[sport_leagues.index(league)] = set(teams)
+    elif filter_teams:
+        for league_idx in range(len(sport_leagues)):
+            result[league_idx] = set(filter_teams)
+    return result
+
+team_filter = build_team_filter()
+
+# True if any of teams passes the team filter for this league.
+def team_filter_allows(league_idx, teams):
+    wanted = team_filter.get(league_idx)
+    if wanted is None:
+        return True
+    for team in teams:
+        if team in wanted:
+            return True
+    return False
 
-    for league_idx, url in enumerate(SPORT_URLS):
-        league = sport_leagues[league_idx]
+# ============================================================
+#  PARSE CACHE
+#  Most events on a big slate don't change between polls, so a game
+#  is only re-parsed when one of the fields parse_game reads changes.
+# ============================================================
+parse_cache = {}  # league_idx -> {event id: (fingerprint, game)}
+
+# The raw fields parse_game depends on: (name, detail, date, teams, scores).
+def event_fingerprint(event):
+    status_type = event["status"]["type"]
+    competitors = event["competitions"][0]["competitors"]
+    teams = []
+    scores = []
+    for c in competitors:
+        teams.append(c["team"]["abbreviation"])
+        scores.append(c.get("score"))
+    return (status_type.get("name"), status_type.get("shortDetail"), event.get("date"),
+            tuple(teams), tuple(scores))
+
+# Parse one event, reusing the game from old_cache if its fingerprint
+# hasn't changed. Games that parse are recorded in new_cache.
+def parse_game_cached(event, league_idx, old_cache, new_cache):
+    event_id = event.get("id")
+    try:
+        fingerprint = event_fingerprint(event)
+    except (KeyError, IndexError, TypeError):
+        fingerprint = None
+    cached = old_cache.get(event_id)
+    if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+        game = cached[1]
+    else:
+        game = parse_game(event, league_idx)
+    if game and event_id is not None and fingerprint is not None:
+        new_cache[event_id] = (fingerprint, game)
+    return game
+
+# ============================================================
+#  GAME STATE
+#  Games are kept by ESPN event id across refreshes (so MLB
+#  doubleheaders don't collide). Each league refresh is turned into
+#  typed deltas, and alerts, polling speed and the display rotation
+#  work from those instead of rescanning whole game lists.
+# ============================================================
+DELTA_ADDED = "added"      # New game on the scoreboard
+DELTA_REMOVED = "removed"  # Game dropped off the scoreboard
+DELTA_SCORE = "score"      # Either score changed
+DELTA_STATUS = "status"    # Scheduled -> live, live -> final, ...
+DELTA_DETAIL = "detail"    # Same status, new clock/detail text
+
+# Games for every fetched league, keyed by event id. Also indexed by league
+# (in scoreboard order), by (league, team) and by (league, state), so live
+# checks, summaries and team lookups never scan the whole slate.
+class GameStore:
+    def __init__(self):
+        self.games = {}       # event id -> game
+        self.league_ids = {}  # league_idx -> event ids in scoreboard order
+        self.team_ids = {}    # (league_idx, team) -> set of event ids
+        self.state_ids = {}   # (league_idx, state) -> set of event ids
+
+    def _index(self, game):
+        for key in ((game.league_idx, game.home_team), (game.league_idx, game.away_team)):
+            if key not in self.team_ids:
+                self.team_ids[key] = set()
+            self.team_ids[key].add(game.id)
+        key = (game.league_idx, game.state)
+        if key not in self.state_ids:
+            self.state_ids[key] = set()
+        self.state_ids[key].add(game.id)
+
+    def _unindex(self, game):
+        for index, key in (
+            (self.team_ids, (game.league_idx, game.home_team)),
+            (self.team_ids, (game.league_idx, game.away_team)),
+            (self.state_ids, (game.league_idx, game.state)),
+        ):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(game.id)
+                if not ids:
+                    del index[key]
+
+    def update_league(self, league_idx, games):
+        """Replace one league's games. Returns a list of (kind, game, old_game)."""
+        deltas = []
+        new_ids = []
+        for game in games:
+            game_id = game.id
+            new_ids.append(game_id)
+            old = self.games.get(game_id)
+            self.games[game_id] = game
+            if old is None:
+                self._index(game)
+                deltas.append((DELTA_ADDED, game, None))
+                continue
+            if old is game:
+                continue  # Reused from the parse cache - nothing changed
+            self._unindex(old)
+            self._index(game)
+            if old.state != game.state:
+                deltas.append((DELTA_STATUS, game, old))
+            if old.home_score != game.home_score or old.away_score != game.away_score:
+                deltas.append((DELTA_SCORE, game, old))
+            elif old.state == game.state and old.status != game.status:
+                deltas.append((DELTA_DETAIL, game, old))
+
+        kept = set(new_ids)
+        for game_id in self.league_ids.get(league_idx, []):
+            if game_id not in kept:
+                old = self.games.pop(game_id)
+                self._unindex(old)
+                deltas.append((DELTA_REMOVED, old, old))
+        self.league_ids[league_idx] = new_ids
+        return deltas
+
+    def league_games(self, league_idx):
+        return [self.games[game_id] for game_id in self.league_ids.get(league_idx, [])]
+
+    def team_games(self, league_idx, team):
+        return [self.games[game_id] for game_id in self.team_ids.get((league_idx, team), ())]
+
+    def state_games(self, league_idx, state):
+        return [self.games[game_id] for game_id in self.state_ids.get((league_idx, state), ())]
+
+    def ordered_ids(self, league_idxs):
+        """Event ids across leagues, in league order then scoreboard order."""
+        ids = []
+        for league_idx in league_idxs:
+            ids.extend(self.league_ids.get(league_idx, []))
+        return ids
+
+    def count(self, league_idxs, state):
+        total = 0
+        for league_idx in league_idxs:
+            total += len(self.state_ids.get((league_idx, state), ()))
+        return total
+
+    def live_count(self, league_idxs):
+        return self.count(league_idxs, GAME_LIVE)
+
+    def summary(self, league_idx):
+        """(total, live, final, scheduled) for one league."""
+        return (
+            len(self.league_ids.get(league_idx, ())),
+            self.count((league_idx,), GAME_LIVE),
+            self.count((league_idx,), GAME_FINAL),
+            self.count((league_idx,), GAME_SCHEDULED),
+        )
+
+store = GameStore()
+
+# ============================================================
+#  PER-LEAGUE POLLING
+#  Each league keeps its own next-due time, so one live NHL game
+#  doesn't make us re-download idle MLB/NFL/college scoreboards.
+# ============================================================
+league_next_due = {}  # league_idx -> ticks_ms() when the league is due again
+
+# Seconds until a league should be polled again, based on its games.
+def league_poll_delay(league_idx, now):
+    if not store.league_ids.get(league_idx):
+        return fetch_interval_offseason
+    if store.count((league_idx,), GAME_LIVE):
+        return fetch_interval_live
+
+    # Ramp up shortly before the next scheduled start
+    if now is not None:
+        next_start = None
+        for g in store.state_games(league_idx, GAME_SCHEDULED):
+            if g.start is not None:
+                if next_start is None or g.start < next_start:
+                    next_start = g.start
+        if next_start is not None:
+            until_ramp = next_start - fetch_prestart_lead - now
+            return min(fetch_interval_idle, max(fetch_interval_live, until_ramp))
+    return fetch_interval_idle
+
+# League indexes allowed by the current league filter.
+def active_league_idxs():
+    return [i for i in range(len(sport_leagues))
+            if not filter_leagues or sport_leagues[i] in filter_leagues]
+
+# Milliseconds until the next active league is due for a refresh (0 if one is due now).
+def next_fetch_ms():
+    now_ticks = ticks_ms()
+    wait = fetch_interval_offseason * 1000
+    for league_idx in active_league_idxs():
+        due = league_next_due.get(league_idx)
+        if due is None:
+            return 0
+        wait = min(wait, ticks_diff(due, now_ticks))
+    return max(wait, 0)
+
+# Fetch one league's scoreboard. Returns every game - filters are applied
+# when the rotation is built, so a filter change doesn't need a re-fetch.
+# Yields to the other tasks after every chunk of the scoreboard.
+async def fetch_league(league_idx):
+    global server_time, server_ticks
+    league = sport_leagues[league_idx]
+
+    games = []
+    old_cache = parse_cache.get(league_idx, {})
+    new_cache = {}
+
+    def on_event(event):
+        try:
+            game = parse_game_cached(event, league_idx, old_cache, new_cache)
+            if game:
+                games.append(game)
+        except Exception as e:
+            print(f"  Error parsing game: {e}")
 
-        # Skip leagues not in filter (if filter is set)
-        if filter_leagues and league not in filter_leagues:
-            print(f"Skipping {league.upper()} (filtered out)")
+    resp = requests.get(SPORT_URLS[league_idx])
+    try:
+        header_time = parse_http_date(resp.headers.get("date", ""))
+        if header_time is not None:
+            server_time = header_time
+            server_ticks = ticks_ms()
+
+        # Stream the scoreboard instead of resp.json() - never holds the whole document
+        parser = espn_stream.ScoreboardParser(on_event)
+        for chunk in resp.iter_content(chunk_size=stream_chunk_size):
+            parser.feed(chunk)
+            await asyncio.sleep(0)
+        parser.close()
+    finally:
+        resp.close()
+
+    # Only swap the cache in once the whole scoreboard arrived; events that
+    # left the scoreboard fall out here.
+    parse_cache[league_idx] = new_cache
+    print(f"  Found {parser.count} {league.upper()} games")
+    return games
+
+# Refresh the leagues that are due (or every active league if force).
+# Each league's deltas go to the rotation and alerts as soon as it's in,
+# before the other tasks get to run again.
+async def refresh_games(force=False):
+    now_ticks = ticks_ms()
+
+    for league_idx in active_league_idxs():
+        league = sport_leagues[league_idx]
+        due = league_next_due.get(league_idx)
+        if not force and due is not None and ticks_diff(now_ticks, due) < 0:
             continue
 
         print(f"Fetching {league.upper()} games...")
         pixel.fill((0, 0, 255))  # Blue while fetching
 
         try:
-            resp = requests.get(url)
-            data = resp.json()
-            resp.close()
-
-            events = data.get("events", [])
-            print(f"  Found {len(events)} {league.upper()} games")
-
-            for event in events:
-                try:
-                    game = parse_game(event, league_idx)
-                    if game:
-                        # Apply team filter
-                        if filter_teams and game["home_team"] not in filter_teams and game["away_team"] not in filter_teams:
-                            continue
-                        all_games.append(game)
-                except Exception as e:
-                    print(f"  Error parsing game: {e}")
-                    continue
-
+            games = await fetch_league(league_idx)
+            apply_deltas(store.update_league(league_idx, games))
+            games = None
+            poll_delay = league_poll_delay(league_idx, utc_now())
         except Exception as e:
             print(f"  Error fetching {league.upper()}: {e}")
-            continue
+            poll_delay = fetch_interval_live  # Keep old games, retry soon
 
+        league_next_due[league_idx] = ticks_add(now_ticks, int(poll_delay * 1000))
+        total, live, final, scheduled = store.summary(league_idx)
+        print(f"  {league.upper()}: {total} games ({live} live, {final} final, {scheduled} scheduled), "
+              f"next refresh in {int(poll_delay)}s")
         gc.collect()
 
     pixel.fill((0, 0, 0))  # Turn off LED
-    print(f"Total games after filtering: {len(all_games)}")
-    return all_games
+    print(f"Total games after filtering: {len(visible_ids())}")
+
+# True if a game passes the current league and team filters.
+def game_visible(game):
+    if filter_leagues and sport_leagues[game.league_idx] not in filter_leagues:
+        return False
+    return team_filter_allows(game.league_idx, (game.home_team, game.away_team))
+
+# Event ids that pass the current filters, in league then scoreboard order.
+# The store always holds every game from the last fetch, so a filter change
+# is just this lookup - no trip back to ESPN.
+def visible_ids():
+    ids = []
+    for league_idx in active_league_idxs():
+        league_ids = store.league_ids.get(league_idx, [])
+        wanted = team_filter.get(league_idx)
+        if wanted is None:
+            ids.extend(league_ids)
+            continue
+        matched = set()
+        for team in wanted:
+            matched.update(store.team_ids.get((league_idx, team), ()))
+        if matched:
+            for game_id in league_ids:
+                if game_id in matched:
+                    ids.append(game_id)
+    return ids
+
+# Rebuild the display rotation only when games were added or removed,
+# keeping the game that was up next in place. Returns (rotation, game_index).
+def update_rotation(rotation, game_index, deltas):
+    if rotation:
+        reorder = False
+        for kind, game, old in deltas:
+            if kind == DELTA_ADDED or kind == DELTA_REMOVED:
+                reorder = True
+                break
+        if not reorder:
+            return rotation, game_index
+    next_id = rotation[game_index] if game_index < len(rotation) else None
+    rotation = visible_ids()
+    if next_id in rotation:
+        return rotation, rotation.index(next_id)
+    return rotation, 0
+
+# ============================================================
+#  GAME RECORD
+# ============================================================
+# Game states, packed into one small int per game
+GAME_SCHEDULED = 0
+GAME_LIVE = 1
+GAME_FINAL = 2
+GAME_OTHER = 3  # Postponed, canceled, delayed...
+
+GAME_STATES = {
+    "STATUS_SCHEDULED": GAME_SCHEDULED,
+    "STATUS_IN_PROGRESS": GAME_LIVE,
+    "STATUS_FINAL": GAME_FINAL,
+}
+
+LEAGUE_NAMES = [league_display_names.get(league, league.upper()) for league in sport_leagues]
+
+# One game. The score text and label colors are worked out once at parse
+# time, so building the display does no formatting.
+class Game:
+    __slots__ = (
+        "id", "league_idx", "state", "home_team", "away_team",
+        "home_score", "away_score", "status", "start",
+        "score_text", "score_color", "status_color",
+    )
+
+    def __init__(self, game_id, league_idx, state, home_team, away_team,
+                 home_score, away_score, status, start):
+        self.id = game_id
+        self.league_idx = league_idx
+        self.state = state
+        self.home_team = home_team
+        self.away_team = away_team
+        self.home_score = home_score
+        self.away_score = away_score
+        self.status = status
+        self.start = start
+
+        if state == GAME_SCHEDULED:
+            self.score_text = "VS"
+            self.score_color = font_color
+        else:
+            self.score_text = f"{home_score} - {away_score}"
+            self.score_color = 0x00FF00 if state == GAME_LIVE else font_color  # Green if live
+        self.status_color = 0xFF0000 if state == GAME_LIVE else font_color  # Red if live
+
+    @property
+    def league(self):
+        return LEAGUE_NAMES[self.league_idx]
 
-# Parse a single game event into a display-friendly dictionary.
+    @property
+    def is_live(self):
+        return self.state == GAME_LIVE
+
+    @property
+    def is_final(self):
+        return self.state == GAME_FINAL
+
+    @property
+    def is_scheduled(self):
+        return self.state == GAME_SCHEDULED
+
+# Parse a single game event into a Game.
 def parse_game(event, league_idx):
     try:
         competition = event["competitions"][0]
@@ -319,147 +737,309 @@ def parse_game(event, league_idx):
         else:
             display_status = status_detail if status_detail else "SCHEDULED"
 
-        return {
-            "league": league_display_names.get(sport_leagues[league_idx], sport_leagues[league_idx].upper()),
-            "league_idx": league_idx,
-            "home_team": home_team,
-            "away_team": away_team,
-            "home_score": str(home_score),
-            "away_score": str(away_score),
-            "status": display_status,
-            "is_final": status_name == "STATUS_FINAL",
-            "is_live": status_name == "STATUS_IN_PROGRESS",
-            "is_scheduled": status_name == "STATUS_SCHEDULED",
-        }
+        game_id = event.get("id") or f"{sport_leagues[league_idx]}-{home_team}-{away_team}-{game_date}"
+
+        return Game(
+            game_id, league_idx, GAME_STATES.get(status_name, GAME_OTHER),
+            home_team, away_team, str(home_score), str(away_score),
+            display_status, parse_start_time(game_date),
+        )
     except Exception as e:
         print(f"Parse error: {e}")
         return None
 
-# Build a displayio Group for a single game
-def build_game_display(game):
-    group = displayio.Group()
+# ============================================================
+#  LOGOS
+#  /team*_logos_32.atlas (baked and packed by get_team_logos.py on
+#  your PC) holds a league's logos already display-ready: background
+#  black, dark logos brightened, 32x32. A logo is found with a binary
+#  search of the atlas index and read with one seek - no per-team
+#  file open on the flash filesystem and no color work here. Teams
+#  missing from the atlas (or boards without atlas files) fall back
+#  to the unprocessed .bmp files.
+#  An atlas packed with --shared-palette has one palette for the
+#  whole league: it's built once and every logo shares it, instead
+#  of a new Palette per logo on screen.
+#  Which .bmp files exist is listed once at startup, so a team with
+#  no logo at all costs no failed file open. Recently shown logos
+#  are kept in a fixed budget of RAM (logo_cache_bytes).
+# ============================================================
+LOGO_SIZE = 32
+logo_atlases = {}  # league_idx -> AtlasFile, or None if there isn't one
+logo_palettes = {}  # league_idx -> shared displayio.Palette
+logo_palette_buf = bytearray(logo_atlas.PALETTE_SIZE)
+logo_files = {}  # league_idx -> abbreviations with a .bmp in the league's folder
+logos_missing = set()  # (league_idx, team) with no logo anywhere, already reported
+
+# Set the first `colors` entries of a Palette from the RGB triples in buf.
+def fill_palette(palette, buf, colors):
+    for i in range(colors):
+        palette[i] = (buf[i * 3] << 16) | (buf[i * 3 + 1] << 8) | buf[i * 3 + 2]
+    return palette
+
+# A displayio Palette from the first `colors` RGB triples in buf.
+def make_palette(buf, colors):
+    return fill_palette(displayio.Palette(colors), buf, colors)
+
+# The atlas for a league, opened on first use.
+def league_atlas(league_idx):
+    if league_idx not in logo_atlases:
+        atlas = None
+        try:
+            folder = logo_atlas.display_folder("/" + logo_folders[league_idx], LOGO_SIZE)
+            atlas = logo_atlas.AtlasFile(logo_atlas.atlas_path(folder))
+        except OSError:
+            pass  # No atlas on the drive - use the .bmp files
+        except ValueError as e:
+            print(f"Bad logo atlas: {e}")
+        if atlas is not None and atlas.shared_palette:
+            colors = atlas.read_palette(logo_palette_buf)
+            logo_palettes[league_idx] = make_palette(logo_palette_buf, colors)
+        logo_atlases[league_idx] = atlas
+    return logo_atlases[league_idx]
+
+# List the .bmp logos in every league's folder.
+def build_logo_index():
+    for league_idx, folder in enumerate(logo_folders):
+        teams = set()
+        try:
+            for name in os.listdir("/" + folder):
+                if name.endswith(".bmp"):
+                    teams.add(name[:-4])
+        except OSError:
+            pass  # No .bmp folder on the drive - atlas only
+        logo_files[league_idx] = teams
+    print(f"Logo index: {sum(len(teams) for teams in logo_files.values())} .bmp logos")
+
+# One logo kept in RAM: pixels and palette read from the atlas, or an
+# OnDiskBitmap and its TileGrid for a team that's only in a .bmp. The
+# buffers are allocated once and reused by whichever logo takes the
+# entry next.
+class CachedLogo:
+    def __init__(self):
+        self.pixels = bytearray(LOGO_SIZE * LOGO_SIZE)
+        self.palette = bytearray(logo_atlas.PALETTE_SIZE)
+        self.colors = 0
+        self.bitmap = None
+        self.tile_grid = None
+        self.slot = None  # LogoSlot the tile_grid is in, if any
+
+LOGO_ENTRY_BYTES = LOGO_SIZE * LOGO_SIZE + logo_atlas.PALETTE_SIZE
+logo_cache = {}  # (league_idx, team) -> CachedLogo
+logo_cache_order = []  # cached keys, least recently used first
+logo_cache_free = [CachedLogo() for _ in range(max(logo_cache_bytes // LOGO_ENTRY_BYTES, 1))]
+logo_cache_hits = 0
+logo_flash_reads = 0
+
+# A team's logo, from the cache or read from flash into a cache entry.
+# None if the team has no logo.
+def cached_logo(league_idx, team):
+    global logo_cache_hits, logo_flash_reads
+    key = (league_idx, team)
+    entry = logo_cache.get(key)
+    if entry is not None:
+        logo_cache_order.remove(key)
+        logo_cache_order.append(key)
+        logo_cache_hits += 1
+        return entry
+    if key in logos_missing:
+        return None
 
-    league_idx = game["league_idx"]
-    folder = logo_folders[league_idx]
+    if not logo_cache_free:
+        logo_cache_free.append(logo_cache.pop(logo_cache_order.pop(0)))
+    entry = logo_cache_free.pop()
+    entry.bitmap = None
+    entry.tile_grid = None
+    entry.slot = None
+
+    found = None
+    atlas = league_atlas(league_idx)
+    if atlas is not None and atlas.width == LOGO_SIZE and atlas.height == LOGO_SIZE:
+        shared = league_idx in logo_palettes
+        logo_flash_reads += 1
+        found = atlas.read(team, None if shared else entry.palette, entry.pixels)
+    if found is not None:
+        entry.colors = found[0]
+    elif team in logo_files.get(league_idx, ()):
+        logo_flash_reads += 1
+        try:
+            entry.bitmap = displayio.OnDiskBitmap(f"/{logo_folders[league_idx]}/{team}.bmp")
+            entry.tile_grid = displayio.TileGrid(entry.bitmap, pixel_shader=entry.bitmap.pixel_shader)
+        except Exception as e:
+            entry.bitmap = None
+            print(f"Can't load logo {team}: {e}")
+    if found is None and entry.bitmap is None:
+        logo_cache_free.append(entry)
+        logos_missing.add(key)
+        print(f"No logo for {team}")
+        return None
 
-    # Load team logos
-    try:
-        home_logo_path = f"/{folder}/{game['home_team']}.bmp"
-        home_bitmap = displayio.OnDiskBitmap(home_logo_path)
-        home_grid = displayio.TileGrid(home_bitmap, pixel_shader=home_bitmap.pixel_shader, x=4, y=4)
-        group.append(home_grid)
-    except Exception as e:
-        print(f"Can't load home logo {game['home_team']}: {e}")
+    logo_cache[key] = entry
+    logo_cache_order.append(key)
+    return entry
 
-    try:
-        away_logo_path = f"/{folder}/{game['away_team']}.bmp"
-        away_bitmap = displayio.OnDiskBitmap(away_logo_path)
-        away_grid = displayio.TileGrid(away_bitmap, pixel_shader=away_bitmap.pixel_shader, x=92, y=4)
-        group.append(away_grid)
-    except Exception as e:
-        print(f"Can't load away logo {game['away_team']}: {e}")
-
-    # League label at top center
-    league_label = adafruit_display_text.label.Label(
-        terminalio.FONT,
-        color=0xFFFF00,  # Yellow
-        text=game["league"]
-    )
-    league_label.anchor_point = (0.5, 0.0)
-    league_label.anchored_position = (DISPLAY_WIDTH // 2, 2)
-    group.append(league_label)
-
-    # Team abbreviations below logos
-    home_abbr = adafruit_display_text.label.Label(
-        terminalio.FONT,
-        color=font_color,
-        text=game["home_team"]
-    )
-    home_abbr.anchor_point = (0.5, 0.0)
-    home_abbr.anchored_position = (20, 38)
-    group.append(home_abbr)
-
-    away_abbr = adafruit_display_text.label.Label(
-        terminalio.FONT,
-        color=font_color,
-        text=game["away_team"]
-    )
-    away_abbr.anchor_point = (0.5, 0.0)
-    away_abbr.anchored_position = (108, 38)
-    group.append(away_abbr)
-
-    # Score or VS in center
-    if game["is_scheduled"]:
-        score_text = "VS"
-        score_color = font_color
+# ============================================================
+#  DISPLAY SCENE
+#  One scene is built at startup and kept for good: the game card
+#  (two logo slots and five labels) and an overlay with two message
+#  labels for the startup, no-games and mode screens. Showing a game
+#  or an alert only sets label text and colors and copies logos into
+#  the slots, instead of building a new Group, Labels and TileGrids
+#  every 5 seconds - less churn on the heap, so it doesn't fragment
+#  into a MemoryError reset. Each update logs the pixels it touched;
+#  displayio only redraws the areas that changed.
+# ============================================================
+SCREEN_PIXELS = DISPLAY_WIDTH * DISPLAY_HEIGHT
+
+# One logo position on the card. Atlas logos are copied into the slot's
+# own bitmap and palette; a .bmp fallback logo's TileGrid comes from the
+# logo cache and is swapped into the slot. Either way a new logo
+# allocates nothing.
+class LogoSlot:
+    def __init__(self, x, y):
+        self.group = displayio.Group(x=x, y=y)
+        self.bitmap = displayio.Bitmap(LOGO_SIZE, LOGO_SIZE, 256)
+        self.palette = displayio.Palette(256)
+        self.tile_grid = displayio.TileGrid(self.bitmap, pixel_shader=self.palette)
+        self.group.append(self.tile_grid)
+        self.shown = None  # (league_idx, team) in the slot
+
+    # Empty the slot, putting its own TileGrid back.
+    def clear(self):
+        self.group[0] = self.tile_grid
+        self.group.hidden = True
+        self.shown = None
+
+    # Show a team's logo, or leave the slot empty if there's none. Returns
+    # the pixels touched.
+    def show(self, league_idx, team):
+        if self.shown == (league_idx, team) and not self.group.hidden:
+            return 0
+        self.shown = None
+        self.group.hidden = True
+        logo = cached_logo(league_idx, team)
+        if logo is None:
+            return 0
+        if logo.tile_grid is not None:
+            # A TileGrid can only be in one group: take it back from the
+            # other slot if that one still shows this team.
+            holder = logo.slot
+            if holder is not None and holder is not self and holder.group[0] is logo.tile_grid:
+                holder.clear()
+            logo.slot = self
+            tile_grid = logo.tile_grid
+        else:
+            bitmaptools.arrayblit(self.bitmap, logo.pixels)
+            shared = logo_palettes.get(league_idx)
+            if shared is None:
+                fill_palette(self.palette, logo.palette, logo.colors)
+            self.tile_grid.pixel_shader = shared or self.palette
+            tile_grid = self.tile_grid
+        if self.group[0] is not tile_grid:
+            self.group[0] = tile_grid  # Re-adding the one already there raises
+        self.shown = (league_idx, team)
+        self.group.hidden = False
+        return LOGO_SIZE * LOGO_SIZE
+
+# A text label on the scene, anchored at (x, y).
+def scene_label(group, anchor_point, x, y):
+    label = adafruit_display_text.label.Label(terminalio.FONT, color=font_color, text="")
+    label.anchor_point = anchor_point
+    label.anchored_position = (x, y)
+    group.append(label)
+    return label
+
+# Pixels a label covers on screen.
+def label_pixels(label):
+    _, _, width, height = label.bounding_box
+    return width * height
+
+# Set a label's text and color if they changed. Returns the pixels touched.
+def set_label(label, text, color):
+    if label.text == text and label.color == color:
+        return 0
+    touched = label_pixels(label)  # Old text is cleared...
+    label.text = text
+    label.color = color
+    return touched + label_pixels(label)  # ...and the new text drawn
+
+scene = displayio.Group()
+card = displayio.Group()
+overlay = displayio.Group()
+scene.append(card)
+scene.append(overlay)
+
+home_logo = LogoSlot(4, 4)
+away_logo = LogoSlot(92, 4)
+card.append(home_logo.group)
+card.append(away_logo.group)
+title_label = scene_label(card, (0.5, 0.0), DISPLAY_WIDTH // 2, 2)  # League, or GOAL!/SCORE!
+home_label = scene_label(card, (0.5, 0.0), 20, 38)  # Team abbreviations below logos
+away_label = scene_label(card, (0.5, 0.0), 108, 38)
+score_label = scene_label(card, (0.5, 0.5), DISPLAY_WIDTH // 2, 24)  # Score or VS in center
+status_label = scene_label(card, (0.5, 1.0), DISPLAY_WIDTH // 2, DISPLAY_HEIGHT - 2)  # Status at bottom
+
+message_title = scene_label(overlay, (0.5, 0.5), DISPLAY_WIDTH // 2, 20)
+message_subtitle = scene_label(overlay, (0.5, 0.5), DISPLAY_WIDTH // 2, 40)
+
+card.hidden = True
+display.root_group = scene
+
+# Fill the card in place with a game. Returns the pixels touched.
+def show_card(game, title, title_color, score_color, status_color):
+    touched = 0
+    for slot, team in ((home_logo, game.home_team), (away_logo, game.away_team)):
+        try:
+            touched += slot.show(game.league_idx, team)
+        except Exception as e:
+            print(f"Can't load logo {team}: {e}")
+
+    touched += set_label(title_label, title, title_color)
+    touched += set_label(home_label, game.home_team, font_color)
+    touched += set_label(away_label, game.away_team, font_color)
+    touched += set_label(score_label, game.score_text, score_color)
+    touched += set_label(status_label, game.status, status_color)
+
+    if card.hidden or not overlay.hidden:
+        touched = SCREEN_PIXELS  # Coming back from a message or a blank flash
+    card.hidden = False
+    overlay.hidden = True
+    return touched
+
+# Put a game on the display.
+def show_game(game):
+    touched = show_card(game, game.league, 0xFFFF00, game.score_color, game.status_color)
+    print(f"  {touched} of {SCREEN_PIXELS} pixels touched")
+
+# Show one or two lines of text over a blank screen. One line is centered,
+# two sit at y=20 and y=40.
+def show_message(title, title_color, subtitle=None, subtitle_color=font_color):
+    card.hidden = True
+    if subtitle is None:
+        message_title.anchored_position = (DISPLAY_WIDTH // 2, DISPLAY_HEIGHT // 2)
+        message_subtitle.hidden = True
     else:
-        score_text = f"{game['home_score']} - {game['away_score']}"
-        score_color = 0x00FF00 if game["is_live"] else font_color  # Green if live
-
-    score_label = adafruit_display_text.label.Label(
-        terminalio.FONT,
-        color=score_color,
-        text=score_text
-    )
-    score_label.anchor_point = (0.5, 0.5)
-    score_label.anchored_position = (DISPLAY_WIDTH // 2, 24)
-    group.append(score_label)
-
-    # Status at bottom
-    status_label = adafruit_display_text.label.Label(
-        terminalio.FONT,
-        color=0xFF0000 if game["is_live"] else font_color,  # Red if live
-        text=game["status"]
-    )
-    status_label.anchor_point = (0.5, 1.0)
-    status_label.anchored_position = (DISPLAY_WIDTH // 2, DISPLAY_HEIGHT - 2)
-    group.append(status_label)
+        message_title.anchored_position = (DISPLAY_WIDTH // 2, 20)
+        set_label(message_subtitle, subtitle, subtitle_color)
+        message_subtitle.hidden = False
+    set_label(message_title, title, title_color)
+    overlay.hidden = False
 
-    return group
+# Blank the screen (alert flashes)
+def show_blank():
+    card.hidden = True
+    overlay.hidden = True
 
 # Display a startup message
 def show_startup():
-    group = displayio.Group()
-
-    title = adafruit_display_text.label.Label(
-        terminalio.FONT,
-        color=0xFFFF00,
-        text="SPORTS TICKER"
-    )
-    title.anchor_point = (0.5, 0.5)
-    title.anchored_position = (DISPLAY_WIDTH // 2, 20)
-    group.append(title)
-
-    subtitle = adafruit_display_text.label.Label(
-        terminalio.FONT,
-        color=font_color,
-        text="Loading..."
-    )
-    subtitle.anchor_point = (0.5, 0.5)
-    subtitle.anchored_position = (DISPLAY_WIDTH // 2, 40)
-    group.append(subtitle)
-
-    display.root_group = group
+    show_message("SPORTS TICKER", 0xFFFF00, "Loading...")
 
 # Display a message if no games are found
 def show_no_games():
-    group = displayio.Group()
-
-    msg = adafruit_display_text.label.Label(
-        terminalio.FONT,
-        color=font_color,
-        text="NO GAMES TODAY"
-    )
-    msg.anchor_point = (0.5, 0.5)
-    msg.anchored_position = (DISPLAY_WIDTH // 2, DISPLAY_HEIGHT // 2)
-    group.append(msg)
-
-    display.root_group = group
+    show_message("NO GAMES TODAY", font_color)
 
 # Display the current filter mode briefly on screen
 def show_mode():
-    group = displayio.Group()
-
     mode = league_modes[current_league_mode]
     mode_text = mode["name"]
     if my_teams_active:
@@ -470,29 +1050,11 @@ def show_mode():
     else:
         teams_text = "ALL TEAMS"
 
-    title = adafruit_display_text.label.Label(
-        terminalio.FONT,
-        color=0xFFFF00,
-        text=mode_text
-    )
-    title.anchor_point = (0.5, 0.5)
-    title.anchored_position = (DISPLAY_WIDTH // 2, 20)
-    group.append(title)
-
-    subtitle = adafruit_display_text.label.Label(
-        terminalio.FONT,
-        color=0x00FF00,
-        text=teams_text
-    )
-    subtitle.anchor_point = (0.5, 0.5)
-    subtitle.anchored_position = (DISPLAY_WIDTH // 2, 40)
-    group.append(subtitle)
-
-    display.root_group = group
+    show_message(mode_text, 0xFFFF00, teams_text, 0x00FF00)
 
 # Apply current button mode to the filter settings
 def apply_filters():
-    global filter_leagues, filter_teams
+    global filter_leagues, filter_teams, team_filter
     mode = league_modes[current_league_mode]
     filter_leagues = mode["leagues"]
 
@@ -510,40 +1072,44 @@ def apply_filters():
                 filter_teams.extend(league_teams)
     else:
         filter_teams = []
+    team_filter = build_team_filter()
 
     print(f"Filter mode: {mode['name']} | Teams: {', '.join(filter_teams) if filter_teams else 'ALL'}")
 
-# Check for button presses (returns True if filters changed)
+# Handle every queued button press. Each press applies in order, so two
+# quick UP presses move two modes. Returns the timestamp of the first
+# press handled, or None if there were none.
 def check_buttons():
-    global current_league_mode, my_teams_active, last_button_time
-    current = ticks_ms()
-
-    # Debounce check
-    if ticks_diff(current, last_button_time) < DEBOUNCE_MS:
-        return False
-
-    changed = False
-
-    # UP button - cycle league modes (buttons are active LOW with pull-up)
-    if not button_up.value:
-        current_league_mode = (current_league_mode + 1) % len(league_modes)
-        last_button_time = current
-        changed = True
-        print(f"UP pressed -> {league_modes[current_league_mode]['name']}")
-
-    # DOWN button - toggle my teams on/off
-    if not button_down.value:
-        my_teams_active = not my_teams_active
-        last_button_time = current
-        changed = True
-        print(f"DOWN pressed -> {'MY TEAMS' if my_teams_active else 'ALL TEAMS'}")
-
-    if changed:
+    global current_league_mode, my_teams_active
+    pressed_at = None
+    while buttons.events.get_into(button_event):
+        if not button_event.pressed:
+            continue  # Releases don't do anything
+        if pressed_at is None:
+            pressed_at = button_event.timestamp
+
+        # UP button - cycle league modes
+        if button_event.key_number == KEY_UP:
+            current_league_mode = (current_league_mode + 1) % len(league_modes)
+            print(f"UP pressed -> {league_modes[current_league_mode]['name']}")
+
+        # DOWN button - toggle my teams on/off
+        elif button_event.key_number == KEY_DOWN:
+            my_teams_active = not my_teams_active
+            print(f"DOWN pressed -> {'MY TEAMS' if my_teams_active else 'ALL TEAMS'}")
+
+    # overflowed is read-only and only resets on clear(); the queue is
+    # empty by now, so clearing it drops nothing more
+    if buttons.events.overflowed:
+        print("Button events dropped (queue full)")
+        buttons.events.clear()
+
+    if pressed_at is not None:
         apply_filters()
-        show_mode()
-        time.sleep(1.5)  # Show mode briefly
+        cancel_alerts()
+        show_mode()  # Stays up until the display task shows the next game
 
-    return changed
+    return pressed_at
 
 print("=" * 40)
 print("Sports Ticker Starting")
@@ -561,222 +1127,269 @@ print("=" * 40)
 
 # Show startup screen
 show_startup()
+build_logo_index()
 time.sleep(2)
 
-# Initial fetch
-games = fetch_all_games()
-
-if not games:
-    print("No games found on initial fetch")
-    show_no_games()
-    time.sleep(10)
-    games = fetch_all_games()
-
 # Convert intervals to milliseconds
-fetch_interval_live_ms = fetch_interval_live * 1000
-fetch_interval_idle_ms = fetch_interval_idle * 1000
 display_interval_ms = display_interval * 1000
 
 # Check if any games are currently live
-def any_games_live(game_list):
-    return any(g["is_live"] for g in game_list)
-
-# Set initial fetch interval based on whether games are live
-fetch_interval_ms = fetch_interval_live_ms if any_games_live(games) else fetch_interval_idle_ms
+def any_games_live():
+    return store.live_count(active_league_idxs()) > 0
 
-# Initialize timers
-fetch_clock = ticks_ms()
-display_clock = ticks_ms()
+# Display rotation: event ids in display order, and the one up next
+rotation = []
 game_index = 0
 
+# Bring the rotation and alerts up to date with one league refresh's deltas.
+def apply_deltas(deltas):
+    global rotation, game_index
+    queue_alerts(score_alerts(deltas))
+    # Only re-order the rotation if games came or went
+    rotation, game_index = update_rotation(rotation, game_index, deltas)
+
 # ============================================================
 #  SCORE CHANGE ALERTS
 #  Detects goals/runs/scores in NHL, NFL, MLB and flashes an alert.
 #  Basketball is excluded (too many baskets).
 # ============================================================
 alert_leagues = ["NHL", "MLB", "NFL", "NCAAF", "NCAAH"]
-previous_scores = {}  # key: "LEAGUE-HOME-AWAY", value: (home_score, away_score)
-
-def get_game_key(game):
-    return f"{game['league']}-{game['home_team']}-{game['away_team']}"
-
-def detect_score_changes(old_games, new_games):
-    """Compare old vs new scores. Returns list of games where score changed."""
-    # Build lookup from old games
-    old_lookup = {}
-    for g in old_games:
-        if g["is_live"] and g["league"] in alert_leagues:
-            old_lookup[get_game_key(g)] = (g["home_score"], g["away_score"])
 
+def score_alerts(deltas):
+    """Pick the live games whose score changed out of a refresh's deltas."""
     changed = []
-    for g in new_games:
-        if not g["is_live"]:
+    for kind, game, old in deltas:
+        if kind != DELTA_SCORE or not game.is_live or game.league not in alert_leagues:
             continue
-        if g["league"] not in alert_leagues:
+        if not game_visible(game):
             continue
-        key = get_game_key(g)
-        new_score = (g["home_score"], g["away_score"])
-        if key in old_lookup and old_lookup[key] != new_score:
-            print(f"  SCORE CHANGE: {g['away_team']} @ {g['home_team']} "
-                  f"{old_lookup[key][0]}-{old_lookup[key][1]} -> {new_score[0]}-{new_score[1]}")
-            changed.append(g)
+        print(f"  SCORE CHANGE: {game.away_team} @ {game.home_team} "
+              f"{old.home_score}-{old.away_score} -> {game.home_score}-{game.away_score}")
+        changed.append(game)
     return changed
 
-def build_alert_display(game):
-    """Build a score alert display with GOAL!/SCORE! header."""
-    group = displayio.Group()
-
-    league_idx = game["league_idx"]
-    folder = logo_folders[league_idx]
-
-    # Load team logos
-    try:
-        home_bitmap = displayio.OnDiskBitmap(f"/{folder}/{game['home_team']}.bmp")
-        group.append(displayio.TileGrid(home_bitmap, pixel_shader=home_bitmap.pixel_shader, x=4, y=4))
-    except Exception:
-        pass
-    try:
-        away_bitmap = displayio.OnDiskBitmap(f"/{folder}/{game['away_team']}.bmp")
-        group.append(displayio.TileGrid(away_bitmap, pixel_shader=away_bitmap.pixel_shader, x=92, y=4))
-    except Exception:
-        pass
-
-    # Alert text at top
-    if game["league"] in ("NHL", "NCAAH"):
+def show_alert(game):
+    """Fill the card with a score alert: GOAL!/SCORE! header, green score, red status."""
+    if game.league in ("NHL", "NCAAH"):
         alert_text = "GOAL!"
-    elif game["league"] in ("NFL", "NCAAF"):
+    elif game.league in ("NFL", "NCAAF"):
         alert_text = "SCORE!"
     else:
         alert_text = "RUN SCORED!"
+    show_card(game, alert_text, 0xFFFF00, 0x00FF00, 0xFF0000)
+
+# Alerts play from a queue, one step per pass of the main loop, so the
+# buttons and refreshes keep working while they run. The card is filled
+# with the alert once; a flash only hides and shows it again. A game that
+# scores again while it's waiting keeps its place with the newer score.
+# While other alerts are waiting, an alert plays short and a hold is cut
+# short, so a burst of goals doesn't tie up the display. A button press
+# drops them all.
+ALERT_STEPS = ((True, 500), (False, 200), (True, 500), (False, 200), (True, 2500))  # (shown, ms): 3 flashes, then hold
+ALERT_STEPS_SHORT = ((True, 500), (False, 200), (True, 1000))  # more alerts waiting
+
+alert_queue = []  # games waiting for their alert
+alert_game = None  # game whose alert is playing
+alert_steps = ALERT_STEPS
+alert_step = 0
+alert_step_start = 0  # ticks_ms() when the current step started
+alert_wake = asyncio.Event()  # Set when alerts are queued or cancelled
+
+def queue_alerts(games):
+    """Queue score alerts, merging a game that's already waiting."""
+    for game in games:
+        print(f"  ALERT: {game.league} {game.away_team} @ {game.home_team} "
+              f"{game.home_score}-{game.away_score}")
+        for i in range(len(alert_queue)):
+            if alert_queue[i].id == game.id:
+                alert_queue[i] = game
+                break
+        else:
+            alert_queue.append(game)
+    if games:
+        alert_wake.set()
+
+def cancel_alerts():
+    """Stop the playing alert and drop the waiting ones."""
+    global alert_game
+    del alert_queue[:]
+    alert_game = None
+    alert_wake.set()
+
+def alert_step_ms():
+    """How long the current step lasts. Once other alerts are waiting, a
+    hold only lasts as long as a short alert's."""
+    ms = alert_steps[alert_step][1]
+    if alert_step == len(alert_steps) - 1 and alert_queue:
+        ms = min(ms, ALERT_STEPS_SHORT[-1][1])
+    return ms
+
+def run_alerts(now):
+    """Advance the alert animation to `now` (ticks_ms()). Returns True while
+    an alert has the display."""
+    global alert_game, alert_steps, alert_step, alert_step_start
+    if alert_game is not None:
+        if ticks_diff(now, alert_step_start) < alert_step_ms():
+            return True
+        alert_step += 1
+        if alert_step == len(alert_steps):
+            alert_game = None
+
+    if alert_game is None:
+        if not alert_queue:
+            return False
+        alert_game = alert_queue.pop(0)
+        alert_steps = ALERT_STEPS_SHORT if alert_queue else ALERT_STEPS
+        alert_step = 0
+        show_alert(alert_game)
+    elif alert_steps[alert_step][0]:
+        card.hidden = False
+    else:
+        show_blank()  # blank flash
+    alert_step_start = now
+    return True
 
-    alert_label = adafruit_display_text.label.Label(
-        terminalio.FONT, color=0xFFFF00, text=alert_text)
-    alert_label.anchor_point = (0.5, 0.0)
-    alert_label.anchored_position = (DISPLAY_WIDTH // 2, 2)
-    group.append(alert_label)
-
-    # Team abbreviations
-    home_abbr = adafruit_display_text.label.Label(
-        terminalio.FONT, color=font_color, text=game["home_team"])
-    home_abbr.anchor_point = (0.5, 0.0)
-    home_abbr.anchored_position = (20, 38)
-    group.append(home_abbr)
-
-    away_abbr = adafruit_display_text.label.Label(
-        terminalio.FONT, color=font_color, text=game["away_team"])
-    away_abbr.anchor_point = (0.5, 0.0)
-    away_abbr.anchored_position = (108, 38)
-    group.append(away_abbr)
-
-    # Score in bright green
-    score_label = adafruit_display_text.label.Label(
-        terminalio.FONT, color=0x00FF00,
-        text=f"{game['home_score']} - {game['away_score']}")
-    score_label.anchor_point = (0.5, 0.5)
-    score_label.anchored_position = (DISPLAY_WIDTH // 2, 24)
-    group.append(score_label)
-
-    # Status at bottom in red
-    status_label = adafruit_display_text.label.Label(
-        terminalio.FONT, color=0xFF0000, text=game["status"])
-    status_label.anchor_point = (0.5, 1.0)
-    status_label.anchored_position = (DISPLAY_WIDTH // 2, DISPLAY_HEIGHT - 2)
-    group.append(status_label)
-
-    return group
-
-def show_score_alerts(changed_games):
-    """Flash each changed game as an alert, then return to normal cycle."""
-    for game in changed_games:
-        print(f"  ALERT: {game['league']} {game['away_team']} @ {game['home_team']} "
-              f"{game['home_score']}-{game['away_score']}")
-        gc.collect()
-
-        # Flash 3 times
-        for i in range(3):
-            display.root_group = build_alert_display(game)
-            time.sleep(0.5)
-            if i < 2:
-                display.root_group = displayio.Group()  # blank flash
-                time.sleep(0.2)
-
-        # Hold final alert
-        time.sleep(2)
-        gc.collect()
-
-is_live = any_games_live(games)
-print(f"Starting ticker with {len(games)} games")
-print(f"Live games: {'YES' if is_live else 'NO'}")
-print(f"Fetch interval: {fetch_interval_live if is_live else fetch_interval_idle}s, Display interval: {display_interval}s")
-
-# Main loop
-while True:
-    try:
-        current_time = ticks_ms()
-
-        # Time to refresh data from ESPN?
-        if ticks_diff(current_time, fetch_clock) >= fetch_interval_ms:
-            print("Refreshing game data...")
-            gc.collect()
-            new_games = fetch_all_games()
-            fetch_clock = ticks_add(fetch_clock, fetch_interval_ms)
-
-            if new_games:
-                # Detect score changes before updating games list
-                changed = detect_score_changes(games, new_games)
-                games = new_games
-
-                # Flash alerts for any score changes
-                if changed:
-                    show_score_alerts(changed)
-
-                # Keep game_index in bounds but don't reset to 0
-                if game_index >= len(games):
-                    game_index = 0
-            elif not games:
-                show_no_games()
-                fetch_interval_ms = fetch_interval_idle_ms
-                time.sleep(5)
-                continue
-
-            # Switch fetch speed based on live games
-            is_live = any_games_live(games)
-            new_interval = fetch_interval_live_ms if is_live else fetch_interval_idle_ms
-            if new_interval != fetch_interval_ms:
-                if is_live:
-                    print(f"Live game detected! Refreshing every {fetch_interval_live}s")
-                else:
-                    print(f"No live games. Refreshing every {fetch_interval_idle}s")
-                fetch_interval_ms = new_interval
-
-        # Time to show next game?
-        if ticks_diff(current_time, display_clock) >= display_interval_ms:
-            if games:
-                # Build and display current game
-                game = games[game_index]
-                print(f"Showing: {game['league']} - {game['away_team']} @ {game['home_team']}")
-
-                gc.collect()
-                game_group = build_game_display(game)
-                display.root_group = game_group
-
-                # Advance to next game
-                game_index = (game_index + 1) % len(games)
-
-            display_clock = ticks_add(display_clock, display_interval_ms)
-
-        # Small delay to prevent tight loop
-        time.sleep(0.1)
-
-    except MemoryError:
-        print("Memory error - resetting...")
+# ============================================================
+#  TASKS
+#  The main loop is four asyncio tasks that take turns: fetching,
+#  the display rotation, the buttons and the alerts. Each one sleeps
+#  until its own next deadline or until another task wakes it, and a
+#  fetch yields after every chunk of a scoreboard, so the panel and
+#  buttons keep going while a league downloads. (A chunk itself is
+#  still read with a blocking socket call.)
+# ============================================================
+display_due = ticks_ms()  # When the next game goes up
+display_wake = asyncio.Event()  # Set when the next game should go up sooner
+fetch_wake = asyncio.Event()  # Set when the filters change
+rotation_display_ms = 0  # Time spent putting games on screen this pass through the rotation
+
+# Wait until an event is set, or at most timeout_ms. Clears the event.
+async def wait_event(event, timeout_ms=None):
+    if timeout_ms is None:
+        await event.wait()
+    elif timeout_ms > 0:
+        try:
+            await asyncio.wait_for_ms(event.wait(), timeout_ms)
+        except asyncio.TimeoutError:
+            pass
+    else:
+        await asyncio.sleep(0)
+    event.clear()
+
+# Refresh each league when it's due, and any league a filter change
+# brings in right away.
+async def fetch_task():
+    while True:
+        await wait_event(fetch_wake, next_fetch_ms())
+        print("Refreshing game data...")
         gc.collect()
-        time.sleep(5)
-        microcontroller.reset()
+        await refresh_games()
+
+# Step through the rotation, one game every display_interval. Alerts and
+# the mode banner hold it back until they're done.
+async def display_task():
+    global game_index, display_due, rotation_display_ms, logo_flash_reads, logo_cache_hits
+    while True:
+        if alert_game is not None or alert_queue:
+            await wait_event(display_wake)
+            continue
+        wait = ticks_diff(display_due, ticks_ms())
+        if wait > 0:
+            await wait_event(display_wake, wait)
+            continue
 
-    except Exception as e:
-        print(f"Error in main loop: {e}")
-        time.sleep(10)
-        gc.collect()
-        time.sleep(5)
-        microcontroller.reset()
+        if rotation:
+            # Display current game
+            game = store.games[rotation[game_index]]
+            print(f"Showing: {game.league} - {game.away_team} @ {game.home_team}")
+
+            shown_at = ticks_ms()
+            show_game(game)
+            rotation_display_ms += ticks_diff(ticks_ms(), shown_at)
+
+            # Advance to next game
+            game_index = (game_index + 1) % len(rotation)
+            if game_index == 0:
+                print(f"Rotation: {len(rotation)} games in {rotation_display_ms} ms, "
+                      f"{logo_flash_reads} logo reads from flash, {logo_cache_hits} from RAM")
+                rotation_display_ms = 0
+                logo_flash_reads = logo_cache_hits = 0
+        else:
+            show_no_games()  # e.g. MY TEAMS on and none of them playing
+        display_due = ticks_add(ticks_ms(), display_interval_ms)
+
+# Take button presses off the keypad queue. The mode banner goes up
+# straight away and a filter change re-filters the games we already have
+# - only leagues that were filtered out until now go back to ESPN, from
+# the fetch task. Press-to-screen is timed from the keypad timestamp, so
+# it includes any time the press waited behind a chunk read.
+async def buttons_task():
+    global rotation, game_index, display_due
+    while True:
+        pressed_at = check_buttons()
+        if pressed_at is not None:
+            display.refresh()  # Push the banner out now rather than on the next auto-refresh
+            shown_ms = ticks_diff(ticks_ms(), pressed_at)
+            rotation, game_index = update_rotation([], 0, [])
+            print(f"Button to screen in {shown_ms} ms, filters applied in "
+                  f"{ticks_diff(ticks_ms(), pressed_at)} ms ({len(rotation)} games)")
+            fetch_wake.set()
+
+            # Show the first game once the mode banner has been up briefly
+            display_due = ticks_add(ticks_ms(), mode_display_ms)
+            display_wake.set()
+        # keypad has nothing to await, so look every 10ms: a press waits at
+        # most that long (less than keypad's own 20ms scan) before the
+        # banner goes up. The wait is part of the logged press-to-screen time.
+        await asyncio.sleep(0.01)
+
+# Play queued alerts step by step. When they're done the rotation picks
+# up with its next game straight away.
+async def alerts_task():
+    global display_due
+    while True:
+        await wait_event(alert_wake)
+        played = False
+        while run_alerts(ticks_ms()):
+            played = True
+            await wait_event(alert_wake, alert_step_ms() - ticks_diff(ticks_ms(), alert_step_start))
+            if alert_game is None:
+                played = False  # Cancelled by a button - the mode banner has the display
+                break
+        if played:
+            display_due = ticks_ms()
+            display_wake.set()
+
+async def main():
+    global rotation, game_index
+
+    # Initial fetch
+    await refresh_games()
+    if not visible_ids():
+        print("No games found on initial fetch")
+        show_no_games()
+        await asyncio.sleep(10)
+        await refresh_games(force=True)
+    rotation, game_index = update_rotation([], 0, [])
+
+    print(f"Starting ticker with {len(rotation)} games")
+    print(f"Live games: {'YES' if any_games_live() else 'NO'}")
+    print(f"Fetch interval: per league ({fetch_interval_live}s live, {fetch_interval_idle}s idle), Display interval: {display_interval}s")
+
+    await asyncio.gather(fetch_task(), display_task(), buttons_task(), alerts_task())
+
+try:
+    asyncio.run(main())
+
+except MemoryError:
+    print("Memory error - resetting...")
+    gc.collect()
+    time.sleep(5)
+    microcontroller.reset()
+
+except Exception as e:
+    print(f"Error in main loop: {e}")
+    time.sleep(10)
+    gc.collect()
+    time.sleep(5)
+    microcontroller.reset()
@@ -15,13 +15,18 @@ Then open http://localhost:8888 in your browser to see the display.
 import os
 import time
 import threading
+import queue
 import sys
 import requests
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from datetime import datetime, timedelta, timezone
 from PIL import Image, ImageDraw, ImageFont
 
 from RGBMatrixEmulator import RGBMatrix, RGBMatrixOptions
 
+import logo_atlas
+
 # ============================================================
 #  CONFIG - same settings as code.py, edit these to match
 # ============================================================
@@ -85,14 +90,61 @@ league_modes = [
 ]
 current_league_mode = 0
 my_teams_active = False
-button_pressed = False  # Flag for main loop to detect changes
+key_presses = queue.Queue()  # ('u' or 'd', time.perf_counter()) from the keyboard thread
+button_wake = threading.Event()  # Wakes the main loop early when a key is pressed
 
-# Refresh intervals (seconds)
-fetch_interval_live = 30
-fetch_interval_idle = 300
+# Refresh intervals (seconds), tracked separately for each league
+fetch_interval_live = 30         # league has a game in progress
+fetch_interval_idle = 300        # league has games today, none live
+fetch_interval_offseason = 3600  # league has nothing on its scoreboard
+fetch_prestart_lead = 600        # switch to the live interval this long before a start
 
 # Time to display each game (seconds)
 display_interval = 5
+mode_display_time = 1.5  # How long the mode banner shows after a button press
+
+# Fetch all leagues at once (one thread per league) instead of one after another.
+# Each league gets its own deadline, so a slow endpoint only drops that league.
+fetch_concurrent = True
+fetch_timeout = 10  # seconds per league
+
+# Processed logos kept in memory (least recently used are dropped first)
+logo_cache_size = 256  # ~2KB each at 24px
+
+# Finished frames kept in memory, keyed by what's drawn on them
+frame_cache_size = 256  # ~24KB each (128x64 RGB)
+
+# Laid-out text masks kept in memory, one per distinct string drawn
+text_cache_size = 512  # a few hundred bytes each
+
+# Download logos that aren't in sport_logos/ in the background (uses get_team_logos.py)
+logo_fetch_missing = True
+logo_fetch_interval = 2.0  # seconds between downloads
+
+def build_team_filter():
+    """Team filter per league: {league_idx: set of abbreviations}.
+    Leagues missing from it show every team. Keyed by league so BOS in
+    my_teams["nhl"] doesn't also pick up the Celtics and Red Sox."""
+    if my_teams_active:
+        return {
+            sport_leagues.index(league): set(teams)
+            for league, teams in my_teams.items() if teams and league in sport_leagues
+        }
+    if filter_teams:
+        return {league_idx: set(filter_teams) for league_idx in range(len(sport_leagues))}
+    return {}
+
+team_filter = build_team_filter()
+
+def team_filter_allows(league_idx, teams):
+    """True if any of teams passes the team filter for this league."""
+    wanted = team_filter.get(league_idx)
+    if wanted is None:
+        return True
+    for team in teams:
+        if team in wanted:
+            return True
+    return False
 
 # ============================================================
 #  DISPLAY SETUP
@@ -144,8 +196,11 @@ TEAM_COLORS = {
 # ============================================================
 #  ESPN API (same logic as code.py)
 # ============================================================
+# Set ESPN_BASE_URL to point at mock_espn_server.py for offline runs
+ESPN_BASE_URL = os.environ.get("ESPN_BASE_URL", "https://site.api.espn.com/apis/site/v2/sports")
+
 SPORT_URLS = [
-    f"https://site.api.espn.com/apis/site/v2/sports/{sport}/{espn_league_slugs[league]}/scoreboard"
+    f"{ESPN_BASE_URL}/{sport}/{espn_league_slugs[league]}/scoreboard"
     for sport, league in zip(sport_names, sport_leagues)
 ]
 
@@ -162,6 +217,82 @@ def convert_date_format(date_str, tz_info):
     except Exception as e:
         return "TBD"
 
+def parse_start_time(date_str):
+    """Convert an ESPN UTC date (e.g. "2025-01-18T00:30Z") to epoch seconds, or None."""
+    try:
+        dt = datetime.strptime(date_str[:16], "%Y-%m-%dT%H:%M")
+        return dt.replace(tzinfo=timezone.utc).timestamp()
+    except Exception:
+        return None
+
+# ============================================================
+#  GAME RECORD
+# ============================================================
+# Game states, packed into one small int per game
+GAME_SCHEDULED = 0
+GAME_LIVE = 1
+GAME_FINAL = 2
+GAME_OTHER = 3  # Postponed, canceled, delayed...
+
+GAME_STATES = {
+    "STATUS_SCHEDULED": GAME_SCHEDULED,
+    "STATUS_IN_PROGRESS": GAME_LIVE,
+    "STATUS_FINAL": GAME_FINAL,
+}
+
+LEAGUE_NAMES = [league_display_names.get(league, league.upper()) for league in sport_leagues]
+
+COLOR_WHITE = (255, 255, 255)
+COLOR_GREEN = (0, 255, 0)
+COLOR_RED = (255, 0, 0)
+COLOR_DIM = (120, 120, 120)
+
+class Game:
+    """One game. The score text and colors are worked out once here, so
+    rendering does no formatting."""
+
+    __slots__ = (
+        "id", "league_idx", "state", "home_team", "away_team",
+        "home_score", "away_score", "status", "start",
+        "score_text", "score_color", "status_color",
+    )
+
+    def __init__(self, game_id, league_idx, state, home_team, away_team,
+                 home_score, away_score, status, start):
+        self.id = game_id
+        self.league_idx = league_idx
+        self.state = state
+        self.home_team = home_team
+        self.away_team = away_team
+        self.home_score = home_score
+        self.away_score = away_score
+        self.status = status
+        self.start = start
+
+        if state == GAME_SCHEDULED:
+            self.score_text = "VS"
+            self.score_color = COLOR_WHITE
+        else:
+            self.score_text = f"{home_score} - {away_score}"
+            self.score_color = COLOR_GREEN if state == GAME_LIVE else COLOR_WHITE
+        self.status_color = COLOR_RED if state == GAME_LIVE else COLOR_DIM
+
+    @property
+    def league(self):
+        return LEAGUE_NAMES[self.league_idx]
+
+    @property
+    def is_live(self):
+        return self.state == GAME_LIVE
+
+    @property
+    def is_final(self):
+        return self.state == GAME_FINAL
+
+    @property
+    def is_scheduled(self):
+        return self.state == GAME_SCHEDULED
+
 def parse_game(event, league_idx):
     try:
         competition = event["competitions"][0]
@@ -192,141 +323,580 @@ def parse_game(event, league_idx):
         else:
             display_status = status_detail if status_detail else "SCHEDULED"
 
-        return {
-            "league": league_display_names.get(sport_leagues[league_idx], sport_leagues[league_idx].upper()),
-            "league_idx": league_idx,
-            "home_team": home_team,
-            "away_team": away_team,
-            "home_score": str(home_score),
-            "away_score": str(away_score),
-            "status": display_status,
-            "is_final": status_name == "STATUS_FINAL",
-            "is_live": status_name == "STATUS_IN_PROGRESS",
-            "is_scheduled": status_name == "STATUS_SCHEDULED",
-        }
+        game_id = event.get("id") or f"{sport_leagues[league_idx]}-{home_team}-{away_team}-{game_date}"
+        return Game(
+            game_id, league_idx, GAME_STATES.get(status_name, GAME_OTHER),
+            home_team, away_team, str(home_score), str(away_score),
+            display_status, parse_start_time(game_date),
+        )
     except Exception as e:
         return None
 
-def fetch_all_games():
-    all_games = []
-    for league_idx, url in enumerate(SPORT_URLS):
-        league = sport_leagues[league_idx]
-        if filter_leagues and league not in filter_leagues:
-            continue
+# ============================================================
+#  PARSE CACHE
+#  Most events on a big slate don't change between polls, so a game
+#  is only re-parsed when one of the fields parse_game reads changes.
+# ============================================================
+parse_cache = {}  # league_idx -> {event id: (fingerprint, game)}
+
+def event_fingerprint(event):
+    """The raw fields parse_game depends on: (name, detail, date, teams, scores)."""
+    status_type = event["status"]["type"]
+    competitors = event["competitions"][0]["competitors"]
+    return (
+        status_type.get("name"), status_type.get("shortDetail"), event.get("date"),
+        tuple(c["team"]["abbreviation"] for c in competitors),
+        tuple(c.get("score") for c in competitors),
+    )
+
+def parse_events(events, league_idx):
+    """Parse a league's events, reusing games whose fingerprint hasn't changed.
+    Events that left the scoreboard are dropped from the cache."""
+    old_cache = parse_cache.get(league_idx, {})
+    new_cache = {}
+    games = []
+    for event in events:
+        event_id = event.get("id")
+        try:
+            fingerprint = event_fingerprint(event)
+        except (KeyError, IndexError, TypeError):
+            fingerprint = None
+        cached = old_cache.get(event_id)
+        if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+            game = cached[1]
+        else:
+            game = parse_game(event, league_idx)
+        if game:
+            if event_id is not None and fingerprint is not None:
+                new_cache[event_id] = (fingerprint, game)
+            games.append(game)
+    parse_cache[league_idx] = new_cache
+    return games
 
+# ============================================================
+#  GAME STATE
+#  Games are kept by ESPN event id across refreshes (so MLB
+#  doubleheaders don't collide). Each league refresh is turned into
+#  typed deltas, and alerts, polling speed and the display rotation
+#  work from those instead of rescanning whole game lists.
+# ============================================================
+DELTA_ADDED = "added"      # New game on the scoreboard
+DELTA_REMOVED = "removed"  # Game dropped off the scoreboard
+DELTA_SCORE = "score"      # Either score changed
+DELTA_STATUS = "status"    # Scheduled -> live, live -> final, ...
+DELTA_DETAIL = "detail"    # Same status, new clock/detail text
+
+class GameStore:
+    """Games for every fetched league, keyed by event id.
+
+    Also indexed by league (in scoreboard order), by (league, team) and by
+    (league, state), so live checks, summaries and team lookups never scan.
+    """
+
+    def __init__(self):
+        self.games = {}       # event id -> game
+        self.league_ids = {}  # league_idx -> event ids in scoreboard order
+        self.team_ids = {}    # (league_idx, team) -> set of event ids
+        self.state_ids = {}   # (league_idx, state) -> set of event ids
+
+    def _index(self, game):
+        for team in (game.home_team, game.away_team):
+            self.team_ids.setdefault((game.league_idx, team), set()).add(game.id)
+        self.state_ids.setdefault((game.league_idx, game.state), set()).add(game.id)
+
+    def _unindex(self, game):
+        for index, key in (
+            (self.team_ids, (game.league_idx, game.home_team)),
+            (self.team_ids, (game.league_idx, game.away_team)),
+            (self.state_ids, (game.league_idx, game.state)),
+        ):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(game.id)
+                if not ids:
+                    del index[key]
+
+    def update_league(self, league_idx, games):
+        """Replace one league's games. Returns a list of (kind, game, old_game)."""
+        deltas = []
+        new_ids = []
+        for game in games:
+            game_id = game.id
+            new_ids.append(game_id)
+            old = self.games.get(game_id)
+            self.games[game_id] = game
+            if old is None:
+                self._index(game)
+                deltas.append((DELTA_ADDED, game, None))
+                continue
+            if old is game:
+                continue  # Reused from the parse cache - nothing changed
+            self._unindex(old)
+            self._index(game)
+            if old.state != game.state:
+                deltas.append((DELTA_STATUS, game, old))
+            if old.home_score != game.home_score or old.away_score != game.away_score:
+                deltas.append((DELTA_SCORE, game, old))
+            elif old.status != game.status and old.state == game.state:
+                deltas.append((DELTA_DETAIL, game, old))
+
+        kept = set(new_ids)
+        for game_id in self.league_ids.get(league_idx, []):
+            if game_id not in kept:
+                old = self.games.pop(game_id)
+                self._unindex(old)
+                deltas.append((DELTA_REMOVED, old, old))
+        self.league_ids[league_idx] = new_ids
+        return deltas
+
+    def league_games(self, league_idx):
+        return [self.games[game_id] for game_id in self.league_ids.get(league_idx, [])]
+
+    def team_games(self, league_idx, team):
+        return [self.games[game_id] for game_id in self.team_ids.get((league_idx, team), ())]
+
+    def state_games(self, league_idx, state):
+        return [self.games[game_id] for game_id in self.state_ids.get((league_idx, state), ())]
+
+    def ordered_ids(self, league_idxs):
+        """Event ids across leagues, in league order then scoreboard order."""
+        ids = []
+        for league_idx in league_idxs:
+            ids.extend(self.league_ids.get(league_idx, []))
+        return ids
+
+    def count(self, league_idxs, state):
+        return sum(len(self.state_ids.get((league_idx, state), ())) for league_idx in league_idxs)
+
+    def live_count(self, league_idxs):
+        return self.count(league_idxs, GAME_LIVE)
+
+    def summary(self, league_idx):
+        """(total, live, final, scheduled) for one league."""
+        return (
+            len(self.league_ids.get(league_idx, ())),
+            self.count((league_idx,), GAME_LIVE),
+            self.count((league_idx,), GAME_FINAL),
+            self.count((league_idx,), GAME_SCHEDULED),
+        )
+
+store = GameStore()
+
+# ============================================================
+#  PER-LEAGUE POLLING
+#  Each league keeps its own next-due time, so one live NHL game
+#  doesn't make us re-download idle MLB/NFL/college scoreboards.
+# ============================================================
+league_next_due = {}  # league_idx -> time.time() when the league is due again
+
+def league_poll_delay(league_idx, now):
+    """Seconds until a league should be polled again, based on its games."""
+    if not store.league_ids.get(league_idx):
+        return fetch_interval_offseason
+    if store.count((league_idx,), GAME_LIVE):
+        return fetch_interval_live
+
+    # Ramp up shortly before the next scheduled start
+    starts = [g.start for g in store.state_games(league_idx, GAME_SCHEDULED) if g.start is not None]
+    if starts:
+        until_ramp = min(starts) - fetch_prestart_lead - now
+        return min(fetch_interval_idle, max(fetch_interval_live, until_ramp))
+    return fetch_interval_idle
+
+def fetch_league(league_idx):
+    """Fetch and parse one league's scoreboard. Returns (games, event count):
+    every game - filters are applied when the rotation is built, not here.
+    Prints nothing, so concurrent fetches don't interleave their output."""
+    resp = requests.get(SPORT_URLS[league_idx], timeout=fetch_timeout)
+    resp.raise_for_status()
+    data = resp.json()
+    events = data.get("events", [])
+    return parse_events(events, league_idx), len(events)
+
+def fetch_leagues_sequential(league_idxs):
+    """Fetch leagues one after another. Returns {league_idx: games}."""
+    results = {}
+    for league_idx in league_idxs:
+        league = sport_leagues[league_idx]
         print(f"Fetching {league.upper()} games...")
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            events = data.get("events", [])
-            print(f"  Found {len(events)} {league.upper()} events")
-
-            for event in events:
-                game = parse_game(event, league_idx)
-                if game:
-                    if filter_teams and game["home_team"] not in filter_teams and game["away_team"] not in filter_teams:
-                        continue
-                    all_games.append(game)
+            results[league_idx], count = fetch_league(league_idx)
+            print(f"  Found {count} {league.upper()} events")
         except Exception as e:
             print(f"  Error fetching {league.upper()}: {e}")
-            continue
-
-    print(f"Total games after filtering: {len(all_games)}")
-    return all_games
+    return results
+
+# One worker per league; kept alive between refreshes so a timed-out
+# request never holds up the next refresh's shutdown.
+fetch_pool = ThreadPoolExecutor(max_workers=len(SPORT_URLS), thread_name_prefix="fetch")
+
+def fetch_leagues_concurrent(league_idxs):
+    """Fetch leagues in parallel. Returns {league_idx: games}.
+
+    Every league is started at once and given fetch_timeout seconds from
+    that moment. Leagues that fail or miss their deadline are left out.
+    Results are reported from this thread in league order, as they are
+    when fetching one after another.
+    """
+    start = time.time()
+    futures = {}
+    for league_idx in league_idxs:
+        print(f"Fetching {sport_leagues[league_idx].upper()} games...")
+        futures[league_idx] = fetch_pool.submit(fetch_league, league_idx)
+
+    results = {}
+    for league_idx, future in futures.items():
+        league = sport_leagues[league_idx]
+        remaining = max(0.0, start + fetch_timeout - time.time())
+        try:
+            results[league_idx], count = future.result(timeout=remaining)
+            print(f"  Found {count} {league.upper()} events")
+        except FutureTimeout:
+            print(f"  Timed out fetching {league.upper()} after {fetch_timeout}s")
+        except Exception as e:
+            print(f"  Error fetching {league.upper()}: {e}")
+    return results
+
+def active_league_idxs():
+    """League indexes allowed by the current league filter."""
+    return [
+        league_idx for league_idx, league in enumerate(sport_leagues)
+        if not filter_leagues or league in filter_leagues
+    ]
+
+def leagues_due(now):
+    """True if any active league is due for a refresh."""
+    return any(now >= league_next_due.get(i, 0) for i in active_league_idxs())
+
+def refresh_games(force=False):
+    """Refresh the leagues that are due (or all active ones if force).
+    Returns the deltas from every league that was fetched."""
+    now = time.time()
+    league_idxs = [i for i in active_league_idxs() if force or now >= league_next_due.get(i, 0)]
+    if fetch_concurrent:
+        results = fetch_leagues_concurrent(league_idxs)
+    else:
+        results = fetch_leagues_sequential(league_idxs)
 
-def any_games_live(game_list):
-    return any(g["is_live"] for g in game_list)
+    deltas = []
+    for league_idx in league_idxs:
+        league = sport_leagues[league_idx]
+        if league_idx in results:
+            deltas.extend(store.update_league(league_idx, results[league_idx]))
+            poll_delay = league_poll_delay(league_idx, now)
+        else:
+            # Failed or timed out - keep the old games and retry soon
+            poll_delay = fetch_interval_live
+        league_next_due[league_idx] = now + poll_delay
+        total, live, final, scheduled = store.summary(league_idx)
+        print(f"  {league.upper()}: {total} games ({live} live, {final} final, {scheduled} scheduled), "
+              f"next refresh in {poll_delay:.0f}s")
+
+    print(f"Total games after filtering: {len(visible_ids())}")
+    return deltas
+
+def game_visible(game):
+    """True if a game passes the current league and team filters."""
+    league = sport_leagues[game.league_idx]
+    if filter_leagues and league not in filter_leagues:
+        return False
+    return team_filter_allows(game.league_idx, (game.home_team, game.away_team))
+
+def visible_ids():
+    """Event ids that pass the current filters, in league then scoreboard order.
+
+    The store always holds every game from the last fetch, so a filter
+    change is just this lookup - no trip back to ESPN.
+    """
+    ids = []
+    for league_idx in active_league_idxs():
+        league_ids = store.league_ids.get(league_idx, [])
+        wanted = team_filter.get(league_idx)
+        if wanted is None:
+            ids.extend(league_ids)
+            continue
+        matched = set()
+        for team in wanted:
+            matched.update(store.team_ids.get((league_idx, team), ()))
+        if matched:
+            ids.extend(game_id for game_id in league_ids if game_id in matched)
+    return ids
+
+def current_games():
+    """Games that pass the current filters, in sport_leagues order."""
+    return [store.games[game_id] for game_id in visible_ids()]
+
+def update_rotation(rotation, game_index, deltas):
+    """Rebuild the display rotation only when games were added or removed.
+    Keeps the game that was up next in place. Returns (rotation, game_index)."""
+    if rotation and not any(kind == DELTA_ADDED or kind == DELTA_REMOVED for kind, _, _ in deltas):
+        return rotation, game_index
+    next_id = rotation[game_index] if game_index < len(rotation) else None
+    rotation = visible_ids()
+    if next_id in rotation:
+        return rotation, rotation.index(next_id)
+    return rotation, 0
+
+def any_games_live():
+    return store.live_count(active_league_idxs()) > 0
 
 # ============================================================
 #  PIL-BASED DRAWING (renders to Image, then pushes to matrix)
 # ============================================================
+
+# ---- GLYPH ATLAS ----
+# Every card measures and draws five strings, and each draw.text() or
+# getbbox() call has the font lay out and rasterize the whole string again.
+# Instead each character is rasterized once into a glyph mask, and a string's
+# mask is stamped together from its glyphs at their advances. Overlapping
+# glyphs blend the same way the font blends them, so the result is
+# pixel-identical to draw.text(). Finished masks and widths are kept per
+# string (least recently used are dropped first). A string whose advances
+# don't add up to the font's own layout (kerning, fractional advances) is
+# drawn with draw.text() as before.
+glyph_atlas = {}  # char -> (mask or None, x offset, y offset, advance)
+text_cache = OrderedDict()  # text -> (mask or None, x offset, y offset, width)
+text_cache_hits = 0
+text_cache_misses = 0
+
+def load_glyph(char):
+    """Rasterize one character: (mask or None if blank, x offset, y offset, advance)."""
+    entry = glyph_atlas.get(char)
+    if entry is None:
+        x0, y0, x1, y1 = pil_font.getbbox(char)
+        mask = None
+        if x1 > x0 and y1 > y0:
+            mask = Image.new("L", (x1 - x0, y1 - y0), 0)
+            ImageDraw.Draw(mask).text((-x0, -y0), char, fill=255, font=pil_font)
+            if not mask.getbbox():
+                mask = None
+        entry = glyph_atlas[char] = (mask, x0, y0, pil_font.getlength(char))
+    return entry
+
+def layout_text(text):
+    """(mask, x offset, y offset, width) for a string; mask is None if it
+    has to be drawn with draw.text()."""
+    global text_cache_hits, text_cache_misses
+    entry = text_cache.get(text)
+    if entry is not None:
+        text_cache.move_to_end(text)
+        text_cache_hits += 1
+        return entry
+    text_cache_misses += 1
+
+    x0, y0, x1, y1 = pil_font.getbbox(text)
+    mask = Image.new("L", (max(x1 - x0, 1), max(y1 - y0, 1)), 0)
+    pen = 0
+    for char in text:
+        glyph, glyph_x, glyph_y, advance = load_glyph(char)
+        if pen != int(pen):
+            mask = None
+            break
+        if glyph is not None:
+            mask.paste(255, (int(pen) + glyph_x - x0, glyph_y - y0), glyph)
+        pen += advance
+    if mask is not None and pen != pil_font.getlength(text):
+        mask = None
+    entry = text_cache[text] = (mask, x0, y0, x1 - x0)
+    if len(text_cache) > text_cache_size:
+        text_cache.popitem(last=False)
+    return entry
+
+def text_cache_stats():
+    """Hit/miss counters for the laid-out text cache."""
+    return {"hits": text_cache_hits, "misses": text_cache_misses,
+            "cached": len(text_cache), "glyphs": len(glyph_atlas)}
+
 def text_width(text):
     """Get pixel width of text using the PIL font."""
-    bbox = pil_font.getbbox(text)
-    return bbox[2] - bbox[0]
+    return layout_text(text)[3]
+
+def draw_text(draw, x, y, text, color):
+    """Draw text with its layout box at (x, y), same as draw.text()."""
+    mask, dx, dy, _ = layout_text(text)
+    if mask is None:
+        draw.text((x, y), text, fill=color, font=pil_font)
+    else:
+        draw.bitmap((x + dx, y + dy), mask, fill=color)
 
 def draw_text_centered(draw, y, text, color):
     """Draw text horizontally centered."""
     tw = text_width(text)
     x = (DISPLAY_WIDTH - tw) // 2
-    draw.text((x, y), text, fill=color, font=pil_font)
+    draw_text(draw, x, y, text, color)
+
+# ---- LOGO CACHE ----
+# Every frame draws two logos, and an alert draws the same pair three times
+# in a row. Processed, resized logos are kept keyed by (league_idx, abbr, size).
+# Missing or unreadable logos are cached as None so they're only reported once.
+# The missing-logo fetcher swaps entries from its own thread, hence the lock.
+# logo_swaps counts its swaps, so a load that raced one doesn't cache a stale None.
+logo_cache = OrderedDict()
+logo_cache_lock = threading.Lock()
+logo_cache_hits = 0
+logo_cache_misses = 0
+logo_swaps = 0
 
 def load_team_logo(team_abbr, league_idx, size=24):
-    """Load a team's .bmp logo and resize it. Returns a PIL Image or None."""
-    folder = logo_folders[league_idx]
-    logo_path = os.path.join(LOGO_BASE_PATH, folder, f"{team_abbr}.bmp")
+    """Get a processed logo from the cache, loading it on a miss. Returns a PIL Image or None."""
+    global logo_cache_hits, logo_cache_misses
+    key = (league_idx, team_abbr, size)
+    with logo_cache_lock:
+        if key in logo_cache:
+            logo_cache.move_to_end(key)
+            logo_cache_hits += 1
+            return logo_cache[key]
+        logo_cache_misses += 1
+        swaps = logo_swaps
+
+    logo = process_team_logo(team_abbr, league_idx, size)
+    with logo_cache_lock:
+        if logo is None and logo_swaps != swaps:
+            return None  # A logo landed while this loaded - try again next draw
+        if key not in logo_cache:
+            logo_cache[key] = logo
+            if len(logo_cache) > logo_cache_size:
+                logo_cache.popitem(last=False)
+        return logo_cache.get(key, logo)  # With logo_cache_size 0 it's already gone
+
+def logo_cache_stats():
+    """Hit/miss counters for the logo cache."""
+    return {
+        "hits": logo_cache_hits,
+        "misses": logo_cache_misses,
+        "cached": len(logo_cache),
+        "missing": sum(1 for logo in logo_cache.values() if logo is None),
+    }
+
+# ---- LOGO ATLASES ----
+# get_team_logos.py bakes display-ready logos (background black, dark logos
+# brightened, already resized) and packs each league and size into
+# sport_logos/team*_logos_<size>.atlas. It's memory-mapped once, and a logo
+# is a slice of the map - no per-logo processing at runtime. Teams missing
+# from the atlas are baked here from the source .bmp the same way.
+logo_atlases = {}  # (league_idx, size) -> MappedAtlas, or None if there isn't one
+
+def league_atlas(league_idx, size):
+    """The memory-mapped atlas of size x size logos for a league, opened on first use."""
+    key = (league_idx, size)
+    with logo_cache_lock:  # Opened from the render and logo-fetch threads
+        if key not in logo_atlases:
+            folder = os.path.join(LOGO_BASE_PATH, logo_folders[league_idx])
+            path = logo_atlas.atlas_path(logo_atlas.display_folder(folder, size))
+            atlas = None
+            if os.path.exists(path):
+                try:
+                    atlas = logo_atlas.MappedAtlas(path)
+                except (OSError, ValueError) as e:
+                    print(f"  Can't open logo atlas {path}: {e}")
+            logo_atlases[key] = atlas
+        return logo_atlases[key]
+
+def process_team_logo(team_abbr, league_idx, size=24):
+    """Load a team's display-ready logo (baked atlas first, then .bmp). Returns a PIL Image or None."""
     try:
-        logo = Image.open(logo_path)
-
-        if logo.mode == "P":
-            palette = logo.getpalette()  # flat list: [r0, g0, b0, r1, g1, b1, ...]
-            pixel_indices = list(logo.convert("L").getdata())  # just to get count
-            pixel_indices = []
-            for y in range(logo.height):
-                for x in range(logo.width):
-                    pixel_indices.append(logo.getpixel((x, y)))
-
-            # Find background: most common index in corner pixels
-            corners = [
-                pixel_indices[0],
-                pixel_indices[logo.width - 1],
-                pixel_indices[(logo.height - 1) * logo.width],
-                pixel_indices[(logo.height - 1) * logo.width + logo.width - 1],
-            ]
-            bg_index = max(set(corners), key=corners.count)
-
-            # Get all palette colors and find the max brightness of non-bg colors
-            non_bg_colors = []
-            for idx in set(pixel_indices):
-                if idx != bg_index:
-                    r = palette[idx * 3]
-                    g = palette[idx * 3 + 1]
-                    b = palette[idx * 3 + 2]
-                    non_bg_colors.append((r, g, b))
-
-            # Calculate brightness boost if the logo is too dark
-            max_channel = 0
-            for r, g, b in non_bg_colors:
-                max_channel = max(max_channel, r, g, b)
-
-            # If brightest color is below 80, scale everything up
-            if max_channel > 0 and max_channel < 80:
-                brightness_scale = 200.0 / max_channel
-            elif max_channel > 0 and max_channel < 150:
-                brightness_scale = 255.0 / max_channel
-            else:
-                brightness_scale = 1.0
-
-            # Build the output image pixel by pixel
-            logo_rgb = Image.new("RGB", logo.size, (0, 0, 0))
-            for y in range(logo.height):
-                for x in range(logo.width):
-                    idx = pixel_indices[y * logo.width + x]
-                    if idx == bg_index:
-                        # Background = black (transparent on LED)
-                        logo_rgb.putpixel((x, y), (0, 0, 0))
-                    else:
-                        r = min(255, int(palette[idx * 3] * brightness_scale))
-                        g = min(255, int(palette[idx * 3 + 1] * brightness_scale))
-                        b = min(255, int(palette[idx * 3 + 2] * brightness_scale))
-                        logo_rgb.putpixel((x, y), (r, g, b))
-
-            logo = logo_rgb
-
-        elif logo.mode == "RGBA":
-            background = Image.new("RGB", logo.size, (0, 0, 0))
-            background.paste(logo, mask=logo.split()[3])
-            logo = background
+        atlas = league_atlas(league_idx, size)
+        if atlas is not None and team_abbr in atlas:
+            logo = atlas.image(team_abbr)
         else:
-            logo = logo.convert("RGB")
-
-        logo = logo.resize((size, size), Image.NEAREST)
-        return logo
+            logo_path = os.path.join(LOGO_BASE_PATH, logo_folders[league_idx], f"{team_abbr}.bmp")
+            if not os.path.exists(logo_path):
+                request_missing_logo(team_abbr, league_idx)
+                return None
+            logo = logo_atlas.bake_logo(Image.open(logo_path), size)
+        return logo.convert("RGB")
     except Exception as e:
         print(f"  Logo load error for {team_abbr}: {e}")
         return None
 
+# ---- MISSING LOGO FETCHER ----
+# A team with no .bmp (common in NCAAB and NCAAH) is queued for a background
+# thread that downloads and converts it with get_team_logos.py's pipeline,
+# one logo every logo_fetch_interval seconds, then swaps it into the logo
+# cache. Rendering never waits on it - the fallback block shows until the
+# logo lands. A failed download is retried the next time the team is drawn;
+# a team ESPN has no logo for is only tried once per run.
+logo_fetch_queue = queue.Queue()
+logo_fetch_seen = set()  # (league_idx, abbr) already queued
+logo_fetch_thread = None
+
+def request_missing_logo(team_abbr, league_idx):
+    """Queue a missing logo for the background fetcher (once per team)."""
+    global logo_fetch_thread
+    if not logo_fetch_missing:
+        return
+    key = (league_idx, team_abbr)
+    with logo_cache_lock:
+        if key in logo_fetch_seen:
+            return
+        logo_fetch_seen.add(key)
+        if logo_fetch_thread is None:
+            logo_fetch_thread = threading.Thread(target=logo_fetcher, daemon=True, name="logo-fetch")
+            logo_fetch_thread.start()
+    print(f"  No logo for {sport_leagues[league_idx].upper()} {team_abbr} - fetching it in the background")
+    logo_fetch_queue.put(key)
+
+def swap_in_logo(team_abbr, league_idx):
+    """Replace a team's cached placeholders with the logo that just arrived."""
+    global logo_swaps
+    with logo_cache_lock:
+        logo_swaps += 1
+        keys = [key for key in logo_cache if key[0] == league_idx and key[1] == team_abbr]
+    for key in keys:
+        logo = process_team_logo(team_abbr, league_idx, key[2])
+        with logo_cache_lock:
+            if key in logo_cache:
+                logo_cache[key] = logo
+    invalidate_team_frames(team_abbr, league_idx)
+
+def forget_missing_logo(team_abbr, league_idx):
+    """Let a failed fetch be retried: drop the cached placeholders and the queued mark."""
+    with logo_cache_lock:
+        logo_fetch_seen.discard((league_idx, team_abbr))
+        for key in [key for key in logo_cache if key[0] == league_idx and key[1] == team_abbr]:
+            del logo_cache[key]
+
+def logo_fetcher():
+    """Background thread: download queued logos (rate limited) and swap them in."""
+    try:
+        import get_team_logos
+    except ImportError as e:
+        print(f"  Can't fetch missing logos ({e}) - put get_team_logos.py next to this script")
+        return
+
+    session = get_team_logos.make_session(1)
+    team_lists = {}  # league_idx -> {abbr: team}, from ESPN's teams endpoint
+    next_fetch = 0.0
+    while True:
+        league_idx, team_abbr = logo_fetch_queue.get()
+        delay = next_fetch - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        next_fetch = time.monotonic() + logo_fetch_interval
+
+        league = sport_leagues[league_idx]
+        if league_idx not in team_lists:
+            teams = get_team_logos.get_teams(sport_names[league_idx], league, session)
+            if not teams:
+                forget_missing_logo(team_abbr, league_idx)
+                continue
+            team_lists[league_idx] = {team["abbreviation"]: team for team in teams}
+        team = team_lists[league_idx].get(team_abbr)
+        if team is None or not team["logo_url"]:
+            print(f"  ESPN has no logo for {league.upper()} {team_abbr}")
+            continue
+
+        output_dir = os.path.join(LOGO_BASE_PATH, logo_folders[league_idx])
+        os.makedirs(output_dir, exist_ok=True)
+        status, entry = get_team_logos.download_and_convert_logo(team, output_dir, league, session=session)
+        if status == "failed":
+            forget_missing_logo(team_abbr, league_idx)
+            continue
+        manifest = logo_atlas.read_manifest(output_dir)
+        manifest[team_abbr] = entry
+        logo_atlas.write_manifest(output_dir, manifest)
+        swap_in_logo(team_abbr, league_idx)
+
 def draw_team_logo(draw, img, team_abbr, league_idx, x, y, size=24):
     """Paste a team logo onto the image, or draw a colored fallback block."""
     logo = load_team_logo(team_abbr, league_idx, size)
@@ -342,76 +912,225 @@ def draw_team_logo(draw, img, team_abbr, league_idx, x, y, size=24):
         lw = text_width(letter)
         lx = x + (size - lw) // 2
         ly = y + (size - 10) // 2
-        draw.text((lx, ly), letter, fill=(255, 255, 255), font=pil_font)
-
-def render_game(game):
-    """Render a game to a PIL Image and push it to the matrix."""
-    img = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # Colors
+        draw_text(draw, lx, ly, letter, (255, 255, 255))
+
+# ---- FRAME CACHE ----
+# A game card only changes when something drawn on it changes, so finished
+# frames are kept keyed by exactly those fields and pushed again as-is. A
+# refresh's deltas drop the frames of games that changed or went away, and a
+# logo arriving from the fetcher drops the frames that showed its placeholder.
+# The fetcher thread invalidates too, hence the lock.
+frame_cache = OrderedDict()  # key -> Image
+frame_cache_lock = threading.Lock()
+frame_keys = {}  # game id -> set of frame keys drawn for it
+frame_cache_hits = 0
+frame_cache_misses = 0
+
+BLANK_FRAME = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0))
+
+def cached_frame(key, draw_frame, game_id=None):
+    """The frame for key, drawn with draw_frame() on a miss. Frames are shared - don't draw on them."""
+    global frame_cache_hits, frame_cache_misses
+    with frame_cache_lock:
+        if key in frame_cache:
+            frame_cache.move_to_end(key)
+            frame_cache_hits += 1
+            return frame_cache[key]
+        frame_cache_misses += 1
+
+    img = draw_frame()
+    with frame_cache_lock:
+        frame_cache[key] = img
+        if game_id is not None:
+            frame_keys.setdefault(game_id, set()).add(key)
+        if len(frame_cache) > frame_cache_size:
+            frame_cache.popitem(last=False)
+    return img
+
+def invalidate_frames(deltas):
+    """Drop the cached frames of games that changed or left in a refresh."""
+    with frame_cache_lock:
+        for kind, game, old in deltas:
+            if kind == DELTA_ADDED:
+                continue
+            for key in frame_keys.pop(game.id, ()):
+                frame_cache.pop(key, None)
+            if kind == DELTA_REMOVED:
+                card_bases.pop(game.id, None)
+
+def invalidate_team_frames(team_abbr, league_idx):
+    """Drop the cached frames and card bases that show a team (its logo just changed)."""
+    with frame_cache_lock:
+        for key in [key for key in frame_cache if key[1] == league_idx and team_abbr in key[2:4]]:
+            del frame_cache[key]
+        logo = (league_idx, team_abbr)
+        for game_id in [game_id for game_id, (card, _) in card_bases.items() if logo in card[1:3]]:
+            del card_bases[game_id]
+
+def frame_cache_stats():
+    """Hit/miss counters for the frame cache."""
+    return {"hits": frame_cache_hits, "misses": frame_cache_misses, "cached": len(frame_cache)}
+
+# ---- CARD REGIONS ----
+# Game cards and alerts share one layout, split into fixed regions that
+# don't overlap: the title, the two logos, the two abbreviations, the score
+# band between the logos and the status band. A card is drawn from one input
+# per region. Each game's last card is kept, and when only its score or
+# clock changes the next card is a copy of it with just the changed regions
+# cleared and redrawn. That's identical to drawing the card from scratch as
+# long as everything stays inside its own region, which is checked: text
+# that spills over makes the card a full draw and isn't used as a base.
+REGION_TEXT = 0
+REGION_LOGO = 1
+
+# (box, kind, (x, width, y)) - text is centered in width, logos are width square
+CARD_REGIONS = (
+    ((28, 0, 100, 20), REGION_TEXT, (0, DISPLAY_WIDTH, 1)),                # title
+    ((4, 10, 28, 34), REGION_LOGO, (4, 24, 10)),                           # home logo
+    ((100, 10, 124, 34), REGION_LOGO, (100, 24, 10)),                      # away logo
+    ((0, 36, DISPLAY_WIDTH // 2, 50), REGION_TEXT, (4, 24, 36)),           # home abbreviation
+    ((DISPLAY_WIDTH // 2, 36, DISPLAY_WIDTH, 50), REGION_TEXT, (100, 24, 36)),  # away abbreviation
+    ((28, 20, 100, 34), REGION_TEXT, (0, DISPLAY_WIDTH, 20)),              # score
+    ((0, 50, DISPLAY_WIDTH, DISPLAY_HEIGHT), REGION_TEXT, (0, DISPLAY_WIDTH, DISPLAY_HEIGHT - 12)),  # status
+)
+
+card_bases = OrderedDict()  # game id -> (card, frame) of its last card
+card_full_draws = 0
+card_partial_draws = 0
+card_pixels_touched = 0
+
+def game_card(game):
+    """Region inputs for a game card, in CARD_REGIONS order."""
     white = (255, 255, 255)
-    yellow = (255, 255, 0)
-    green = (0, 255, 0)
-    red = (255, 0, 0)
-    dim = (120, 120, 120)
-
-    # League label at top center
-    draw_text_centered(draw, 1, game["league"], yellow)
-
-    # Team logos
-    draw_team_logo(draw, img, game["home_team"], game["league_idx"], 4, 10, 24)
-    draw_team_logo(draw, img, game["away_team"], game["league_idx"], 100, 10, 24)
-
-    # Team abbreviations below logos
-    home_w = text_width(game["home_team"])
-    draw.text((4 + (24 - home_w) // 2, 36), game["home_team"], fill=white, font=pil_font)
-
-    away_w = text_width(game["away_team"])
-    draw.text((100 + (24 - away_w) // 2, 36), game["away_team"], fill=white, font=pil_font)
-
-    # Score or VS in center
-    if game["is_scheduled"]:
-        score_text = "VS"
-        score_color = white
+    return ((game.league, (255, 255, 0)),
+            (game.league_idx, game.home_team), (game.league_idx, game.away_team),
+            (game.home_team, white), (game.away_team, white),
+            (game.score_text, game.score_color), (game.status, game.status_color))
+
+def alert_card(game):
+    """Region inputs for a score alert: GOAL!/SCORE! header, green score, red status."""
+    if game.league in ("NHL", "NCAAH"):
+        alert_text = "GOAL!"
+    elif game.league in ("NFL", "NCAAF"):
+        alert_text = "SCORE!"
     else:
-        score_text = f"{game['home_score']} - {game['away_score']}"
-        score_color = green if game["is_live"] else white
+        alert_text = "RUN SCORED!"
+    white = (255, 255, 255)
+    return ((alert_text, (255, 255, 0)),
+            (game.league_idx, game.home_team), (game.league_idx, game.away_team),
+            (game.home_team, white), (game.away_team, white),
+            (game.score_text, (0, 255, 0)), (game.status, (255, 0, 0)))
+
+def draw_card_region(draw, img, region, value):
+    """Draw one region's input. Returns False if it drew outside the region."""
+    box, kind, (x, width, y) = region
+    if kind == REGION_LOGO:
+        league_idx, team_abbr = value
+        draw_team_logo(draw, img, team_abbr, league_idx, x, y, width)
+        return True
+
+    text, color = value
+    x += (width - text_width(text)) // 2
+    draw_text(draw, x, y, text, color)
+    mask, dx, dy, _ = layout_text(text)
+    if mask is None:
+        return False
+    # Whatever falls off the screen isn't drawn, so only the on-screen part has to fit
+    x0 = max(x + dx, 0)
+    y0 = max(y + dy, 0)
+    x1 = min(x + dx + mask.width, DISPLAY_WIDTH)
+    y1 = min(y + dy + mask.height, DISPLAY_HEIGHT)
+    return box[0] <= x0 and box[1] <= y0 and x1 <= box[2] and y1 <= box[3]
+
+def draw_card(card, game_id=None):
+    """Draw a card to a new PIL Image. With a game_id, only the regions that
+    changed since that game's last card are redrawn, when it can be."""
+    global card_full_draws, card_partial_draws, card_pixels_touched
+    with frame_cache_lock:
+        base = card_bases.get(game_id)
+
+    img = None
+    if base is not None:
+        base_card, base_img = base
+        img = base_img.copy()
+        draw = ImageDraw.Draw(img)
+        touched = 0
+        for region, value, old in zip(CARD_REGIONS, card, base_card):
+            if value == old:
+                continue
+            x0, y0, x1, y1 = region[0]
+            draw.rectangle([x0, y0, x1 - 1, y1 - 1], fill=(0, 0, 0))
+            if not draw_card_region(draw, img, region, value):
+                img = None
+                break
+            touched += (x1 - x0) * (y1 - y0)
+        if img is not None:
+            card_partial_draws += 1
+            card_pixels_touched += touched
+
+    fits = True
+    if img is None:
+        img = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        for region, value in zip(CARD_REGIONS, card):
+            fits = draw_card_region(draw, img, region, value) and fits
+        card_full_draws += 1
+        card_pixels_touched += DISPLAY_WIDTH * DISPLAY_HEIGHT
+
+    if game_id is not None:
+        with frame_cache_lock:
+            if fits:
+                card_bases[game_id] = (card, img)
+                card_bases.move_to_end(game_id)
+                if len(card_bases) > frame_cache_size:
+                    card_bases.popitem(last=False)
+            else:
+                card_bases.pop(game_id, None)
+    return img
 
-    score_w = text_width(score_text)
-    score_x = (DISPLAY_WIDTH - score_w) // 2
-    draw.text((score_x, 20), score_text, fill=score_color, font=pil_font)
+def card_draw_stats():
+    """Full vs region-only card draws, and pixels drawn per card."""
+    draws = card_full_draws + card_partial_draws
+    return {"full": card_full_draws, "partial": card_partial_draws,
+            "pixels_per_draw": card_pixels_touched / draws if draws else 0}
 
-    # Status at bottom
-    status_color = red if game["is_live"] else dim
-    draw_text_centered(draw, DISPLAY_HEIGHT - 12, game["status"], status_color)
+def render_game(game):
+    """Push a game's card to the matrix, drawing it only if it isn't cached."""
+    key = ("game", game.league_idx, game.home_team, game.away_team, game.score_text, game.status, game.state)
+    matrix.SetImage(cached_frame(key, lambda: draw_card(game_card(game), game.id), game.id))
 
-    # Push image to the matrix
-    matrix.SetImage(img)
+def draw_game(game):
+    """Draw a game card to a new PIL Image."""
+    return draw_card(game_card(game))
 
 def render_message(text):
     """Render a centered message to the matrix."""
-    img = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    draw_text_centered(draw, DISPLAY_HEIGHT // 2 - 5, text, (255, 255, 0))
-    matrix.SetImage(img)
+    def draw_message():
+        img = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw_text_centered(draw, DISPLAY_HEIGHT // 2 - 5, text, (255, 255, 0))
+        return img
+    matrix.SetImage(cached_frame(("message", None, text), draw_message))
 
 def render_mode():
     """Show current filter mode on the display."""
-    img = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0))
-    draw = ImageDraw.Draw(img)
     mode = league_modes[current_league_mode]
     if my_teams_active and filter_teams:
         teams_text = "MY TEAMS"
     else:
         teams_text = "ALL TEAMS"
-    draw_text_centered(draw, 20, mode["name"], (255, 255, 0))
-    draw_text_centered(draw, 38, teams_text, (0, 255, 0))
-    matrix.SetImage(img)
+
+    def draw_mode():
+        img = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw_text_centered(draw, 20, mode["name"], (255, 255, 0))
+        draw_text_centered(draw, 38, teams_text, (0, 255, 0))
+        return img
+    matrix.SetImage(cached_frame(("mode", None, mode["name"], teams_text), draw_mode))
 
 def apply_filters():
     """Apply current button mode to the filter settings."""
-    global filter_leagues, filter_teams
+    global filter_leagues, filter_teams, team_filter
     mode = league_modes[current_league_mode]
     filter_leagues = mode["leagues"]
 
@@ -426,32 +1145,49 @@ def apply_filters():
                 filter_teams.extend(league_teams)
     else:
         filter_teams = []
+    team_filter = build_team_filter()
 
     print(f"Filter mode: {mode['name']} | Teams: {', '.join(filter_teams) if filter_teams else 'ALL'}")
 
 def keyboard_listener():
     """Listen for keyboard input in a background thread.
-    Press 'u' for UP (cycle leagues), 'd' for DOWN (toggle my teams), 'q' to quit."""
-    global current_league_mode, my_teams_active, button_pressed
+    Press 'u' for UP (cycle leagues), 'd' for DOWN (toggle my teams), 'q' to quit.
+    Presses are queued for the main loop, which owns the filter settings."""
     while True:
         try:
-            key = input()
-            if key.lower() == 'u':
-                current_league_mode = (current_league_mode + 1) % len(league_modes)
-                apply_filters()
-                button_pressed = True
-                print(f"UP -> {league_modes[current_league_mode]['name']}")
-            elif key.lower() == 'd':
-                my_teams_active = not my_teams_active
-                apply_filters()
-                button_pressed = True
-                print(f"DOWN -> {'MY TEAMS' if my_teams_active else 'ALL TEAMS'}")
-            elif key.lower() == 'q':
+            key = input().lower()
+            if key in ('u', 'd'):
+                key_presses.put((key, time.perf_counter()))
+                button_wake.set()
+            elif key == 'q':
                 print("Quitting...")
                 os._exit(0)
         except EOFError:
             break
 
+def apply_key_presses():
+    """Apply every queued key press in order, then the filters once.
+    Runs on the main loop, so a refresh never sees half-applied filters.
+    Returns the time.perf_counter() of the first press, or None if there were none."""
+    global current_league_mode, my_teams_active
+    pressed_at = None
+    while True:
+        try:
+            key, at = key_presses.get_nowait()
+        except queue.Empty:
+            break
+        if pressed_at is None:
+            pressed_at = at
+        if key == 'u':
+            current_league_mode = (current_league_mode + 1) % len(league_modes)
+            print(f"UP -> {league_modes[current_league_mode]['name']}")
+        else:
+            my_teams_active = not my_teams_active
+            print(f"DOWN -> {'MY TEAMS' if my_teams_active else 'ALL TEAMS'}")
+    if pressed_at is not None:
+        apply_filters()
+    return pressed_at
+
 # ============================================================
 #  SCORE CHANGE ALERTS
 #  Detects goals/runs/scores in NHL, NFL, MLB and flashes an alert.
@@ -459,91 +1195,96 @@ def keyboard_listener():
 # ============================================================
 alert_leagues = ["NHL", "MLB", "NFL", "NCAAF", "NCAAH"]
 
-def get_game_key(game):
-    return f"{game['league']}-{game['home_team']}-{game['away_team']}"
-
-def detect_score_changes(old_games, new_games):
-    """Compare old vs new scores. Returns list of games where score changed."""
-    old_lookup = {}
-    for g in old_games:
-        if g["is_live"] and g["league"] in alert_leagues:
-            old_lookup[get_game_key(g)] = (g["home_score"], g["away_score"])
-
+def score_alerts(deltas):
+    """Pick the live games whose score changed out of a refresh's deltas."""
     changed = []
-    for g in new_games:
-        if not g["is_live"]:
+    for kind, game, old in deltas:
+        if kind != DELTA_SCORE or not game.is_live or game.league not in alert_leagues:
             continue
-        if g["league"] not in alert_leagues:
+        if not game_visible(game):
             continue
-        key = get_game_key(g)
-        new_score = (g["home_score"], g["away_score"])
-        if key in old_lookup and old_lookup[key] != new_score:
-            print(f"  SCORE CHANGE: {g['away_team']} @ {g['home_team']} "
-                  f"{old_lookup[key][0]}-{old_lookup[key][1]} -> {new_score[0]}-{new_score[1]}")
-            changed.append(g)
+        print(f"  SCORE CHANGE: {game.away_team} @ {game.home_team} "
+              f"{old.home_score}-{old.away_score} -> {game.home_score}-{game.away_score}")
+        changed.append(game)
     return changed
 
-def render_alert(game):
-    """Render a score alert with GOAL!/SCORE! header."""
-    img = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    white = (255, 255, 255)
-    yellow = (255, 255, 0)
-    green = (0, 255, 0)
-    red = (255, 0, 0)
-
-    # Alert text at top
-    if game["league"] in ("NHL", "NCAAH"):
-        alert_text = "GOAL!"
-    elif game["league"] in ("NFL", "NCAAF"):
-        alert_text = "SCORE!"
-    else:
-        alert_text = "RUN SCORED!"
-
-    draw_text_centered(draw, 1, alert_text, yellow)
-
-    # Team logos
-    draw_team_logo(draw, img, game["home_team"], game["league_idx"], 4, 10, 24)
-    draw_team_logo(draw, img, game["away_team"], game["league_idx"], 100, 10, 24)
-
-    # Team abbreviations
-    home_w = text_width(game["home_team"])
-    draw.text((4 + (24 - home_w) // 2, 36), game["home_team"], fill=white, font=pil_font)
-    away_w = text_width(game["away_team"])
-    draw.text((100 + (24 - away_w) // 2, 36), game["away_team"], fill=white, font=pil_font)
-
-    # Score in bright green
-    score_text = f"{game['home_score']} - {game['away_score']}"
-    score_w = text_width(score_text)
-    draw.text(((DISPLAY_WIDTH - score_w) // 2, 20), score_text, fill=green, font=pil_font)
-
-    # Status at bottom
-    draw_text_centered(draw, DISPLAY_HEIGHT - 12, game["status"], red)
-
-    matrix.SetImage(img)
-
-def render_blank():
-    """Render a blank screen for flash effect."""
-    img = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), (0, 0, 0))
-    matrix.SetImage(img)
-
-def show_score_alerts(changed_games):
-    """Flash each changed game as an alert, then return to normal cycle."""
-    for game in changed_games:
-        print(f"  ALERT: {game['league']} {game['away_team']} @ {game['home_team']} "
-              f"{game['home_score']}-{game['away_score']}")
-
-        # Flash 3 times
-        for i in range(3):
-            render_alert(game)
-            time.sleep(0.5)
-            if i < 2:
-                render_blank()
-                time.sleep(0.2)
-
-        # Hold final alert
-        time.sleep(2)
+def alert_frame(game):
+    """A score alert with GOAL!/SCORE! header, drawn only once per score."""
+    key = ("alert", game.league_idx, game.home_team, game.away_team, game.score_text, game.status)
+    return cached_frame(key, lambda: draw_card(alert_card(game), game.id), game.id)
+
+def draw_alert(game):
+    """Draw a score alert to a new PIL Image."""
+    return draw_card(alert_card(game))
+
+# ---- ALERT ANIMATIONS ----
+# Alerts play from a queue, one step at a time from the main loop, so keys
+# and refreshes are still handled while they run. Each alert is drawn once;
+# a flash just swaps it with the blank frame. A game that scores again
+# while it's waiting keeps its place with the newer score. While other
+# alerts are waiting, an alert plays short and a playing alert cuts its
+# hold short, so a burst of goals doesn't tie up the display. A key press
+# drops them all.
+ALERT_STEPS = ((True, 0.5), (False, 0.2), (True, 0.5), (False, 0.2), (True, 2.5))  # (shown, seconds): 3 flashes, then hold
+ALERT_STEPS_SHORT = ((True, 0.5), (False, 0.2), (True, 1.0))  # more alerts waiting
+
+alert_queue = []  # games waiting for their alert
+alert_game = None  # game whose alert is playing
+alert_image = None
+alert_steps = ALERT_STEPS
+alert_step = 0
+alert_step_start = 0.0  # time.monotonic() when the current step started
+alert_step_end = 0.0
+
+def queue_alerts(games):
+    """Queue score alerts, merging a game that's already waiting."""
+    for game in games:
+        print(f"  ALERT: {game.league} {game.away_team} @ {game.home_team} "
+              f"{game.home_score}-{game.away_score}")
+        for i, waiting in enumerate(alert_queue):
+            if waiting.id == game.id:
+                alert_queue[i] = game
+                break
+        else:
+            alert_queue.append(game)
+
+def cancel_alerts():
+    """Stop the playing alert and drop the waiting ones."""
+    global alert_game, alert_image
+    del alert_queue[:]
+    alert_game = alert_image = None
+
+def alert_step_due():
+    """When the playing alert's current step ends. Once other alerts are
+    waiting, a hold only lasts as long as a short alert's."""
+    if alert_step == len(alert_steps) - 1 and alert_queue:
+        return min(alert_step_end, alert_step_start + ALERT_STEPS_SHORT[-1][1])
+    return alert_step_end
+
+def run_alerts(now):
+    """Advance the alert animation to `now` (time.monotonic()).
+    Returns True while an alert has the display."""
+    global alert_game, alert_image, alert_steps, alert_step, alert_step_start, alert_step_end
+    if alert_game is not None:
+        if now < alert_step_due():
+            return True
+        alert_step += 1
+        if alert_step == len(alert_steps):
+            alert_game = alert_image = None
+
+    if alert_game is None:
+        if not alert_queue:
+            return False
+        alert_game = alert_queue.pop(0)
+        alert_image = alert_frame(alert_game)
+        alert_steps = ALERT_STEPS_SHORT if alert_queue else ALERT_STEPS
+        alert_step = 0
+
+    shown, seconds = alert_steps[alert_step]
+    matrix.SetImage(alert_image if shown else BLANK_FRAME)
+    alert_step_start = now
+    alert_step_end = now + seconds
+    return True
 
 # ============================================================
 #  MAIN LOOP
@@ -580,90 +1321,93 @@ if __name__ == "__main__":
     render_message("Loading...")
 
     # Fetch games
-    games = fetch_all_games()
+    refresh_games()
+    rotation, game_index = update_rotation([], 0, [])
 
-    if not games:
+    if not rotation:
         print("No games found")
         render_message("NO GAMES TODAY")
         time.sleep(10)
 
-    # Set initial refresh interval
-    is_live = any_games_live(games) if games else False
-    fetch_interval = fetch_interval_live if is_live else fetch_interval_idle
-    print(f"Starting with {len(games)} games, refresh every {fetch_interval}s")
-
-    game_index = 0
-    last_fetch = time.time()
+    print(f"Starting with {len(rotation)} games, live: {'YES' if any_games_live() else 'NO'}")
 
+    next_game_at = 0.0  # time.monotonic() when the next game is due
     try:
         while True:
             current_time = time.time()
+            button_wake.clear()
 
             # Check if a button was pressed (keyboard input)
-            if button_pressed:
-                button_pressed = False
+            started = time.perf_counter()
+            pressed_at = apply_key_presses()
+            if pressed_at is not None:
+                cancel_alerts()
                 render_mode()
-                time.sleep(1.5)
+                print(f"Key to screen in {(time.perf_counter() - pressed_at) * 1000:.1f} ms")
 
-                # Re-fetch with new filters
-                print("Filters changed, refreshing...")
-                games = fetch_all_games()
+                # Re-filter the games we already have. Only leagues that were
+                # filtered out until now (or are due anyway) go back to ESPN.
+                invalidate_frames(refresh_games())
+                rotation, game_index = update_rotation([], 0, [])
+                elapsed = time.perf_counter() - started
+                print(f"Filters applied in {elapsed * 1000:.0f} ms ({len(rotation)} games)")
 
-                last_fetch = current_time
-                game_index = 0
+                # Leave the mode banner up briefly; another press cuts it short
+                button_wake.wait(max(0.0, mode_display_time - elapsed))
 
-                if not games:
+                if not rotation:
                     render_message("NO GAMES")
-                    time.sleep(2)
-                    continue
-
-                is_live = any_games_live(games)
-                fetch_interval = fetch_interval_live if is_live else fetch_interval_idle
+                    button_wake.wait(2)
+                next_game_at = 0.0
                 continue
 
-            # Time to refresh from ESPN?
-            if current_time - last_fetch >= fetch_interval:
+            # Any league due for a refresh from ESPN?
+            if leagues_due(current_time):
                 print("Refreshing game data...")
-                new_games = fetch_all_games()
-                if new_games:
-                    # Detect score changes before updating
-                    changed = detect_score_changes(games, new_games)
-                    games = new_games
-
-                    # Flash alerts for any score changes
-                    if changed:
-                        show_score_alerts(changed)
-
-                    # Keep game_index in bounds but don't reset to 0
-                    if game_index >= len(games):
-                        game_index = 0
-
-                last_fetch = current_time
-
-                # Adjust refresh speed
-                is_live = any_games_live(games) if games else False
-                new_interval = fetch_interval_live if is_live else fetch_interval_idle
-                if new_interval != fetch_interval:
-                    if is_live:
-                        print(f"Live game detected! Refreshing every {fetch_interval_live}s")
-                    else:
-                        print(f"No live games. Refreshing every {fetch_interval_idle}s")
-                    fetch_interval = new_interval
+                deltas = refresh_games()
+                invalidate_frames(deltas)
 
-            # Display current game
-            if games:
-                game = games[game_index]
-                print(f"Showing: {game['league']} - {game['away_team']} @ {game['home_team']}  "
-                      f"{'[LIVE]' if game['is_live'] else '[FINAL]' if game['is_final'] else ''}")
+                # Queue alerts for any score changes
+                queue_alerts(score_alerts(deltas))
 
-                render_game(game)
+                # Only re-order the rotation if games came or went
+                rotation, game_index = update_rotation(rotation, game_index, deltas)
 
-                game_index = (game_index + 1) % len(games)
+            # Alerts have the display until they're done, then the rotation picks up
+            now = time.monotonic()
+            if run_alerts(now):
+                next_game_at = now
+                wake_at = alert_step_due()
             else:
-                render_message("NO GAMES TODAY")
+                if now >= next_game_at:
+                    # Display current game
+                    if rotation:
+                        game = store.games[rotation[game_index]]
+                        print(f"Showing: {game.league} - {game.away_team} @ {game.home_team}  "
+                              f"{'[LIVE]' if game.is_live else '[FINAL]' if game.is_final else ''}")
+
+                        render_game(game)
+
+                        game_index = (game_index + 1) % len(rotation)
+                    else:
+                        render_message("NO GAMES TODAY")
+                    next_game_at = now + display_interval
+                wake_at = next_game_at
 
-            time.sleep(display_interval)
+            # Sleep until the next game or alert step, or until a key is pressed
+            button_wake.wait(max(0.0, wake_at - time.monotonic()))
 
     except KeyboardInterrupt:
         print("\nStopping ticker...")
+        stats = logo_cache_stats()
+        print(f"Logo cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['cached']} cached ({stats['missing']} missing)")
+        stats = frame_cache_stats()
+        print(f"Frame cache: {stats['hits']} hits, {stats['misses']} misses, {stats['cached']} cached")
+        stats = card_draw_stats()
+        print(f"Card draws: {stats['full']} full, {stats['partial']} regions only, "
+              f"{stats['pixels_per_draw']:.0f} pixels touched per draw")
+        stats = text_cache_stats()
+        print(f"Text cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['cached']} cached ({stats['glyphs']} glyphs)")
         matrix.Clear()
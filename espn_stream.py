@@ -0,0 +1,397 @@
+"""
+ESPN Scoreboard Stream Parser
+Pulls just the fields the ticker uses out of an ESPN scoreboard response as it
+streams in, without ever building the full JSON document in memory.
+
+A college football Saturday can be well over a megabyte of deeply nested JSON.
+resp.json() on the MatrixPortal has to hold all of it as dicts at once, which is
+what runs the board out of memory. This parser reads the response in small chunks
+and only keeps, for each event:
+
+    id, date, status.type.name, status.type.shortDetail,
+    competitions[0].competitors[].team.abbreviation,
+    competitions[0].competitors[].score
+
+Each event is handed to a callback as soon as it closes, shaped like a (tiny)
+ESPN event so parse_game() works on it unchanged. Everything else - links, odds,
+leaders, broadcasts, the league calendar - is scanned past without being stored.
+
+Runs on CircuitPython and regular Python. Copy this file to the root of CIRCUITPY.
+
+Usage:
+    parser = ScoreboardParser(on_event)
+    for chunk in resp.iter_content(chunk_size=512):
+        parser.feed(chunk)
+"""
+
+# Byte values for the JSON characters we care about
+_QUOTE = 34      # "
+_BACKSLASH = 92  # \
+_LBRACE = 123    # {
+_RBRACE = 125    # }
+_LBRACK = 91     # [
+_RBRACK = 93     # ]
+_COMMA = 44      # ,
+_COLON = 58      # :
+_WHITESPACE = (32, 9, 10, 13)
+
+# Containers we descend into (everything else is skipped)
+_ROOT = 0
+_EVENTS = 1
+_EVENT = 2
+_STATUS = 3
+_STATUS_TYPE = 4
+_COMPETITIONS = 5
+_COMPETITION = 6
+_COMPETITORS = 7
+_COMPETITOR = 8
+_TEAM = 9
+
+# Scalars we keep
+_ID = 0
+_DATE = 1
+_STATUS_NAME = 2
+_STATUS_DETAIL = 3
+_SCORE = 4
+_ABBREVIATION = 5
+
+# Parser modes
+_NORMAL = 0
+_STRING = 1
+_SCALAR = 2
+_SKIP = 3
+
+# (container, key) -> child container to descend into
+_OBJECT_ROUTES = {
+    (_ROOT, "events"): _EVENTS,
+    (_EVENT, "status"): _STATUS,
+    (_EVENT, "competitions"): _COMPETITIONS,
+    (_STATUS, "type"): _STATUS_TYPE,
+    (_COMPETITION, "competitors"): _COMPETITORS,
+    (_COMPETITOR, "team"): _TEAM,
+}
+
+# (container, key) -> scalar field to keep
+_SCALAR_ROUTES = {
+    (_EVENT, "id"): _ID,
+    (_EVENT, "date"): _DATE,
+    (_STATUS_TYPE, "name"): _STATUS_NAME,
+    (_STATUS_TYPE, "shortDetail"): _STATUS_DETAIL,
+    (_COMPETITOR, "score"): _SCORE,
+    (_TEAM, "abbreviation"): _ABBREVIATION,
+}
+
+_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+def _decode_string(raw):
+    """Decode the bytes between a pair of JSON quotes."""
+    if _BACKSLASH not in raw:
+        return raw.decode("utf-8")
+    text = raw.decode("utf-8")
+    out = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\" and i + 1 < len(text):
+            code = text[i + 1]
+            if code == "u":
+                out.append(chr(int(text[i + 2:i + 6], 16)))
+                i += 6
+                continue
+            out.append(_ESCAPES.get(code, code))
+            i += 2
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def _decode_scalar(raw):
+    """Decode a bare JSON number or literal."""
+    text = raw.decode("utf-8")
+    if text == "true":
+        return True
+    if text == "false":
+        return False
+    if text == "null":
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+class ScoreboardParser:
+    """Incremental extractor for ESPN scoreboard events.
+
+    feed() can be called with chunks split at any byte. on_event(event) is
+    called once per event with a dict like:
+
+        {"id": "401", "date": "2025-01-18T00:30Z",
+         "status": {"type": {"name": "STATUS_FINAL", "shortDetail": "Final"}},
+         "competitions": [{"competitors": [
+             {"team": {"abbreviation": "BOS"}, "score": "3"},
+             {"team": {"abbreviation": "TOR"}, "score": "2"}]}]}
+    """
+
+    def __init__(self, on_event):
+        self.on_event = on_event
+        self.count = 0          # Events delivered so far
+
+        # Open containers we are tracking: [container, is_object, key, index]
+        self._stack = []
+        self._expect_key = False
+
+        self._mode = _NORMAL
+        self._pieces = []       # Chunks of the string/scalar being read
+        self._keep = False      # Whether the current string/scalar is being stored
+        self._is_key = False    # Whether the current string is an object key
+        self._target = None     # Scalar field the current value goes to
+        self._backslashes = 0   # Trailing backslashes carried over a chunk boundary
+
+        self._skip_depth = 0    # Open brackets inside a skipped value
+        self._skip_string = False
+
+        self._event = None
+        self._competitor = None
+
+    # ---- value routing ----
+
+    def _begin_container(self, container, is_object):
+        if container == _EVENT:
+            self._event = {
+                "status": {"type": {}},
+                "competitions": [{"competitors": []}],
+            }
+        elif container == _COMPETITOR:
+            self._competitor = {"team": {}}
+            self._event["competitions"][0]["competitors"].append(self._competitor)
+        self._stack.append([container, is_object, None, 0])
+        self._expect_key = is_object
+
+    def _end_container(self):
+        container = self._stack.pop()[0]
+        if container == _EVENT:
+            self.count += 1
+            event = self._event
+            self._event = None
+            self.on_event(event)
+        elif container == _COMPETITOR:
+            self._competitor = None
+        self._expect_key = False
+
+    def _route(self, byte):
+        """Decide what to do with a value starting with byte.
+
+        Returns a container code to descend into, a ("scalar", field) tuple
+        for a value to keep, or None to skip it.
+        """
+        if not self._stack:
+            return _ROOT if byte == _LBRACE else None
+        container, is_object, key, index = self._stack[-1]
+
+        if is_object:
+            if byte == _LBRACE or byte == _LBRACK:
+                child = _OBJECT_ROUTES.get((container, key))
+                if child is None:
+                    return None
+                # events/competitions/competitors are arrays, the rest objects
+                wants_array = child in (_EVENTS, _COMPETITIONS, _COMPETITORS)
+                return child if wants_array == (byte == _LBRACK) else None
+            field = _SCALAR_ROUTES.get((container, key))
+            return None if field is None else ("scalar", field)
+
+        # Array elements
+        if byte != _LBRACE:
+            return None
+        if container == _EVENTS:
+            return _EVENT
+        if container == _COMPETITIONS and index == 0:
+            return _COMPETITION
+        if container == _COMPETITORS:
+            return _COMPETITOR
+        return None
+
+    def _store(self, field, value):
+        event = self._event
+        if event is None:
+            return
+        if field == _ID:
+            event["id"] = value
+        elif field == _DATE:
+            event["date"] = value
+        elif field == _STATUS_NAME:
+            event["status"]["type"]["name"] = value
+        elif field == _STATUS_DETAIL:
+            event["status"]["type"]["shortDetail"] = value
+        elif self._competitor is not None:
+            if field == _SCORE:
+                self._competitor["score"] = value
+            elif field == _ABBREVIATION:
+                self._competitor["team"]["abbreviation"] = value
+
+    def _finish_string(self):
+        raw = b"".join(self._pieces)
+        self._pieces = []
+        if self._is_key:
+            self._stack[-1][2] = _decode_string(raw)
+            self._expect_key = False
+        elif self._keep:
+            self._store(self._target, _decode_string(raw))
+        self._mode = _NORMAL
+
+    def _finish_scalar(self):
+        if self._keep:
+            self._store(self._target, _decode_scalar(b"".join(self._pieces)))
+        self._pieces = []
+        self._mode = _NORMAL
+
+    # ---- string scanning ----
+
+    def _scan_string(self, chunk, start):
+        """Find the closing quote of a string that starts at chunk[start].
+
+        Returns its index, or -1 if the string continues into the next chunk.
+        """
+        pos = start
+        while True:
+            end = chunk.find(b'"', pos)
+            if end < 0:
+                # Remember trailing backslashes in case the quote is escaped
+                run = 0
+                i = len(chunk) - 1
+                while i >= start and chunk[i] == _BACKSLASH:
+                    run += 1
+                    i -= 1
+                self._backslashes = run + (self._backslashes if i < start else 0)
+                return -1
+            run = 0
+            i = end - 1
+            while i >= start and chunk[i] == _BACKSLASH:
+                run += 1
+                i -= 1
+            if i < start:
+                run += self._backslashes
+            if run % 2 == 0:
+                self._backslashes = 0
+                return end
+            pos = end + 1
+
+    # ---- main loop ----
+
+    def feed(self, chunk):
+        """Parse the next chunk (bytes) of the response."""
+        i = 0
+        n = len(chunk)
+        while i < n:
+            mode = self._mode
+
+            if mode == _STRING:
+                end = self._scan_string(chunk, i)
+                if end < 0:
+                    if self._keep or self._is_key:
+                        self._pieces.append(chunk[i:])
+                    return
+                if self._keep or self._is_key:
+                    self._pieces.append(chunk[i:end])
+                i = end + 1
+                self._finish_string()
+                continue
+
+            if mode == _SKIP:
+                if self._skip_string:
+                    end = self._scan_string(chunk, i)
+                    if end < 0:
+                        return
+                    self._skip_string = False
+                    i = end + 1
+
+                # Structure between here and the next string. Most of a skipped
+                # value is strings, so jump whole runs with find/count (done in C)
+                # and only walk byte by byte where the value might close.
+                quote = chunk.find(b'"', i)
+                stop = n if quote < 0 else quote
+                if chunk.find(b"}", i, stop) < 0 and chunk.find(b"]", i, stop) < 0:
+                    self._skip_depth += chunk.count(b"{", i, stop) + chunk.count(b"[", i, stop)
+                    i = stop
+                else:
+                    while i < stop:
+                        byte = chunk[i]
+                        i += 1
+                        if byte == _LBRACE or byte == _LBRACK:
+                            self._skip_depth += 1
+                        elif byte == _RBRACE or byte == _RBRACK:
+                            self._skip_depth -= 1
+                            if self._skip_depth == 0:
+                                self._mode = _NORMAL
+                                break
+                    if self._mode != _SKIP:
+                        continue
+                if quote >= 0:
+                    self._skip_string = True
+                    self._backslashes = 0
+                    i = quote + 1
+                continue
+
+            byte = chunk[i]
+
+            if mode == _SCALAR:
+                if byte in _WHITESPACE or byte == _COMMA or byte == _RBRACE or byte == _RBRACK:
+                    self._finish_scalar()
+                    continue  # Let _NORMAL handle the delimiter
+                start = i
+                while i < n and chunk[i] not in _WHITESPACE and chunk[i] not in (_COMMA, _RBRACE, _RBRACK):
+                    i += 1
+                if self._keep:
+                    self._pieces.append(chunk[start:i])
+                continue
+
+            # _NORMAL
+            i += 1
+            if byte in _WHITESPACE or byte == _COLON:
+                continue
+            if byte == _COMMA:
+                if self._stack:
+                    top = self._stack[-1]
+                    if top[1]:
+                        self._expect_key = True
+                    else:
+                        top[3] += 1
+                continue
+            if byte == _RBRACE or byte == _RBRACK:
+                self._end_container()
+                continue
+            if byte == _QUOTE and self._expect_key:
+                self._mode = _STRING
+                self._is_key = True
+                self._keep = False
+                self._backslashes = 0
+                continue
+
+            # Start of a value
+            route = self._route(byte)
+            if byte == _LBRACE or byte == _LBRACK:
+                if route is None:
+                    self._mode = _SKIP
+                    self._skip_depth = 1
+                    self._skip_string = False
+                else:
+                    self._begin_container(route, byte == _LBRACE)
+                continue
+
+            self._keep = route is not None
+            self._target = route[1] if route is not None else None
+            self._is_key = False
+            if byte == _QUOTE:
+                self._mode = _STRING
+                self._backslashes = 0
+            else:
+                self._mode = _SCALAR
+                if self._keep:
+                    self._pieces.append(chunk[i - 1:i])
+
+    def close(self):
+        """Flush a trailing bare scalar (only matters for malformed input)."""
+        if self._mode == _SCALAR:
+            self._finish_scalar()
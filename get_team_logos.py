@@ -5,15 +5,34 @@ Downloads logos for NFL, MLB, NHL, NBA, NCAAF, NCAAB, and NCAAH teams,
 converts them to 32x32 .bmp files named by ESPN abbreviation, and organizes
 them into the correct folders for use with both the LED hardware and the emulator.
 
+Each logo is then baked into its display-ready 24px and 32px versions
+(background black, dark logos brightened) and packed into one atlas per
+league and size, so neither the emulator nor the board processes logos
+at runtime.
+
 Install requirements:
     pip install requests Pillow
 
 Run:
     python get_team_logos.py
 
-To re-download all logos (replace existing):
+Re-runs are incremental: each league folder's manifest.json records every
+logo's source URL, ETag/Last-Modified and source/output hashes, so only logos
+ESPN actually changed are re-downloaded and re-converted, and teams that
+left a league are removed. To re-download and re-convert everything anyway:
     python get_team_logos.py --force
 
+Logos are downloaded on a pool of threads sharing one pooled HTTP session,
+and resized/quantized/baked in a pool of worker processes, so downloads
+don't wait on the CPU work. Tune with:
+    python get_team_logos.py --workers 16      # concurrent downloads (default 8)
+    python get_team_logos.py --processes 2     # conversion processes (default: one per CPU)
+
+To pack each league's 32px (hardware) atlas against one shared palette, so
+the board builds a single displayio.Palette per league instead of one per
+logo on screen:
+    python get_team_logos.py --shared-palette
+
 Output:
     sport_logos/
       team0_logos/   (NFL)
@@ -23,14 +42,22 @@ Output:
       team4_logos/   (CFB)
       team5_logos/   (CBB)
       team6_logos/   (CHK)
+      team0_logos_24/, team0_logos_32/, ...         baked display-ready logos
+      team0_logos_24.atlas, team0_logos_32.atlas, ...  packed baked logos
+    Each source folder gets a manifest.json recording how its logos were baked.
 """
 
 import os
-import sys
+import time
+import hashlib
+import argparse
 import requests
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from PIL import Image, ImageEnhance
 from io import BytesIO
 
+import logo_atlas
+
 # Logo size for LED matrix (32x32 is standard for this project)
 LOGO_SIZE = 32
 
@@ -74,9 +101,17 @@ ESPN_SLUGS = {
     "chk": "mens-college-hockey",
 }
 
+# Set ESPN_BASE_URL to point at mock_espn_server.py for offline runs
+ESPN_BASE_URL = os.environ.get("ESPN_BASE_URL", "https://site.api.espn.com/apis/site/v2/sports")
+
 # College leagues that need higher color depth
 COLLEGE_LEAGUES = {"cfb", "cbb", "chk"}
 
+# Download pipeline
+DOWNLOAD_WORKERS = 8    # Concurrent logo downloads (and pooled connections)
+CONVERT_WORKERS = None  # Conversion processes (None = one per CPU)
+REQUEST_TIMEOUT = 15    # Seconds per HTTP request
+
 
 def get_best_logo_url(logos):
     """Pick the best logo URL from ESPN's logo list.
@@ -116,13 +151,26 @@ def get_best_logo_url(logos):
     return best_url
 
 
-def get_teams(sport, league):
-    """Fetch the team list from ESPN's API."""
+def make_session(pool_size=DOWNLOAD_WORKERS):
+    """A requests Session whose connection pool fits pool_size concurrent downloads."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_teams(sport, league, session=requests):
+    """Fetch the team list from ESPN's API.
+
+    A team listed without a logo URL is still returned, with an empty
+    logo_url, so it isn't mistaken for one that left the league.
+    """
     espn_slug = ESPN_SLUGS.get(league, league)
-    url = f"https://site.api.espn.com/apis/site/v2/sports/{sport}/{espn_slug}/teams?limit=500"
+    url = f"{ESPN_BASE_URL}/{sport}/{espn_slug}/teams?limit=500"
     print(f"  Fetching {league.upper()} team list...")
     try:
-        resp = requests.get(url, timeout=15)
+        resp = session.get(url, timeout=REQUEST_TIMEOUT)
         resp.raise_for_status()
         data = resp.json()
         teams_raw = data.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", [])
@@ -133,11 +181,11 @@ def get_teams(sport, league):
             name = team.get("displayName", "")
             logos = team.get("logos", [])
             logo_url = get_best_logo_url(logos)
-            if abbr and logo_url:
+            if abbr:
                 teams.append({
                     "abbreviation": abbr,
                     "name": name,
-                    "logo_url": logo_url,
+                    "logo_url": logo_url or "",
                 })
         return teams
     except Exception as e:
@@ -145,68 +193,224 @@ def get_teams(sport, league):
         return []
 
 
-def download_and_convert_logo(team, output_dir, league, force=False):
-    """Download a team logo and save it as a 32x32 indexed-color BMP."""
+def convert_logo(content, output_path, league):
+    """Turn downloaded image bytes into a 32x32 indexed-color BMP and bake its
+    display-ready variants. CPU-bound, so it runs in a worker process.
+
+    Returns (manifest entry, palette colors).
+    """
+    # Open image and convert
+    img = Image.open(BytesIO(content))
+
+    # Convert to RGBA first to handle transparency
+    img = img.convert("RGBA")
+
+    # If source image is very small (common for college teams), use NEAREST
+    # for the initial upscale to avoid excessive blur, then use LANCZOS
+    # for the final resize. Otherwise just use LANCZOS directly.
+    src_w, src_h = img.size
+    if max(src_w, src_h) < LOGO_SIZE:
+        # Source is smaller than target — scale up with NEAREST first
+        # to preserve hard edges, then let quantization handle it
+        img = img.resize((LOGO_SIZE, LOGO_SIZE), Image.NEAREST)
+    elif max(src_w, src_h) <= LOGO_SIZE * 2:
+        # Source is close to target size — use LANCZOS but it may blur
+        img = img.resize((LOGO_SIZE, LOGO_SIZE), Image.LANCZOS)
+    else:
+        # Source is larger — LANCZOS downscale gives best quality
+        img = img.resize((LOGO_SIZE, LOGO_SIZE), Image.LANCZOS)
+
+    # Composite onto black background (LED matrix background)
+    background = Image.new("RGB", (LOGO_SIZE, LOGO_SIZE), (0, 0, 0))
+    background.paste(img, mask=img.split()[3])
+
+    # Slight sharpening to counteract resize blur — helps on LED matrix
+    enhancer = ImageEnhance.Sharpness(background)
+    background = enhancer.enhance(1.3)
+
+    # Convert to palette mode (P) to match what CircuitPython expects
+    # College logos need more colors due to detailed mascots/crests
+    num_colors = PALETTE_COLORS_COLLEGE if league in COLLEGE_LEAGUES else PALETTE_COLORS_PRO
+    bmp_img = background.quantize(colors=num_colors, method=Image.Quantize.MEDIANCUT)
+
+    # Save as BMP
+    bmp_img.save(output_path, format="BMP")
+
+    # Bake the display-ready variants from the saved BMP
+    return logo_atlas.bake_variants(output_path), num_colors
+
+
+def run_cpu(convert_pool, func, *args):
+    """Run func in the conversion pool (or right here without one) and wait for it."""
+    if convert_pool is None:
+        return func(*args)
+    return convert_pool.submit(func, *args).result()
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def variants_present(output_dir, abbr):
+    """True if every baked size of a logo is on disk."""
+    return all(
+        os.path.exists(os.path.join(logo_atlas.display_folder(output_dir, size), f"{abbr}.bmp"))
+        for size in logo_atlas.DISPLAY_SIZES
+    )
+
+
+def download_and_convert_logo(team, output_dir, league, force=False, session=requests, convert_pool=None,
+                              previous=None):
+    """Sync one team logo: download it, save it as a 32x32 indexed-color BMP,
+    and bake its display-ready variants - but only if it changed.
+
+    previous is the logo's entry from the folder manifest. If the BMP on disk
+    still matches it, the request is conditional (If-None-Match /
+    If-Modified-Since) and a 304, or a download with the same source hash,
+    leaves the logo alone.
+
+    Returns (status, manifest entry): status is "downloaded", "baked" (only
+    the variants were redone), "unchanged" or "failed". On failure the entry
+    is the previous one, so the manifest doesn't forget the logo.
+
+    Safe to call from several threads at once: the download happens on the
+    calling thread, the conversion in convert_pool.
+    """
     abbr = team["abbreviation"]
     output_path = os.path.join(output_dir, f"{abbr}.bmp")
 
-    # Skip if already downloaded (unless --force)
-    if os.path.exists(output_path) and not force:
-        print(f"    {abbr} - already exists, skipping")
-        return True
+    # Only trust the manifest if the file it describes is still there untouched
+    known = previous
+    if force or not previous or previous.get("url") != team["logo_url"] \
+            or not os.path.exists(output_path) or file_hash(output_path) != previous.get("output_hash"):
+        previous = None
 
-    try:
-        resp = requests.get(team["logo_url"], timeout=15)
-        resp.raise_for_status()
+    headers = {}
+    if previous:
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
 
-        # Open image and convert
-        img = Image.open(BytesIO(resp.content))
-
-        # Convert to RGBA first to handle transparency
-        img = img.convert("RGBA")
-
-        # If source image is very small (common for college teams), use NEAREST
-        # for the initial upscale to avoid excessive blur, then use LANCZOS
-        # for the final resize. Otherwise just use LANCZOS directly.
-        src_w, src_h = img.size
-        if max(src_w, src_h) < LOGO_SIZE:
-            # Source is smaller than target — scale up with NEAREST first
-            # to preserve hard edges, then let quantization handle it
-            img = img.resize((LOGO_SIZE, LOGO_SIZE), Image.NEAREST)
-        elif max(src_w, src_h) <= LOGO_SIZE * 2:
-            # Source is close to target size — use LANCZOS but it may blur
-            img = img.resize((LOGO_SIZE, LOGO_SIZE), Image.LANCZOS)
+    try:
+        resp = session.get(team["logo_url"], headers=headers, timeout=REQUEST_TIMEOUT)
+        if resp.status_code == 304:
+            entry = previous
+            status = "unchanged"
         else:
-            # Source is larger — LANCZOS downscale gives best quality
-            img = img.resize((LOGO_SIZE, LOGO_SIZE), Image.LANCZOS)
-
-        # Composite onto black background (LED matrix background)
-        background = Image.new("RGB", (LOGO_SIZE, LOGO_SIZE), (0, 0, 0))
-        background.paste(img, mask=img.split()[3])
-
-        # Slight sharpening to counteract resize blur — helps on LED matrix
-        enhancer = ImageEnhance.Sharpness(background)
-        background = enhancer.enhance(1.3)
+            resp.raise_for_status()
+            source_hash = hashlib.sha256(resp.content).hexdigest()
+            if previous and previous.get("source_hash") == source_hash:
+                # The server ignored the conditional request, but the image is the same
+                entry = previous
+                status = "unchanged"
+            else:
+                transforms, num_colors = run_cpu(convert_pool, convert_logo, resp.content, output_path, league)
+                entry = dict(transforms, url=team["logo_url"], source_hash=source_hash,
+                             output_hash=file_hash(output_path))
+                status = "downloaded"
+                size_kb = os.path.getsize(output_path) / 1024
+                print(f"    {abbr} - downloaded ({team['name']}) [{size_kb:.1f}KB, {num_colors} colors]")
+            entry = dict(entry, etag=resp.headers.get("ETag"), last_modified=resp.headers.get("Last-Modified"))
+
+        if status == "unchanged":
+            if variants_present(output_dir, abbr):
+                print(f"    {abbr} - unchanged")
+            else:
+                entry = dict(entry, **run_cpu(convert_pool, logo_atlas.bake_variants, output_path))
+                status = "baked"
+                print(f"    {abbr} - unchanged, re-baked")
+        return status, entry
 
-        # Convert to palette mode (P) to match what CircuitPython expects
-        # College logos need more colors due to detailed mascots/crests
-        num_colors = PALETTE_COLORS_COLLEGE if league in COLLEGE_LEAGUES else PALETTE_COLORS_PRO
-        bmp_img = background.quantize(colors=num_colors, method=Image.Quantize.MEDIANCUT)
+    except Exception as e:
+        print(f"    {abbr} - FAILED: {e}")
+        return "failed", known
 
-        # Save as BMP
-        bmp_img.save(output_path, format="BMP")
 
-        size_kb = os.path.getsize(output_path) / 1024
-        print(f"    {abbr} - downloaded ({team['name']}) [{size_kb:.1f}KB, {num_colors} colors]")
-        return True
+def download_league(teams, output_dir, league, force, session, download_pool, convert_pool):
+    """Sync a league's logos concurrently against its folder manifest.
 
-    except Exception as e:
-        print(f"    {abbr} - FAILED: {e}")
+    Returns {abbreviation: manifest entry} and a count for each status.
+    """
+    manifest = logo_atlas.read_manifest(output_dir)
+    futures = [
+        (team["abbreviation"], download_pool.submit(
+            download_and_convert_logo, team, output_dir, league, force, session, convert_pool,
+            manifest.get(team["abbreviation"])))
+        for team in teams if team["logo_url"]
+    ]
+    logos = {}
+    for team in teams:
+        # No logo URL this run: leave whatever logo we already have alone
+        abbr = team["abbreviation"]
+        if not team["logo_url"] and abbr in manifest and os.path.exists(os.path.join(output_dir, f"{abbr}.bmp")):
+            logos[abbr] = manifest[abbr]
+            print(f"    {abbr} - no logo URL from ESPN this run, kept")
+    counts = {"downloaded": 0, "baked": 0, "unchanged": 0, "failed": 0}
+    for abbr, future in futures:
+        status, entry = future.result()
+        counts[status] += 1
+        if entry:
+            logos[abbr] = entry
+    return logos, counts
+
+
+def prune_league(output_dir, teams):
+    """Delete the logos (and baked variants) of teams no longer in the league.
+    Returns the abbreviations removed."""
+    current = {team["abbreviation"] for team in teams}
+    pruned = []
+    for name in sorted(os.listdir(output_dir)):
+        abbr = name[:-4]
+        if not name.lower().endswith(".bmp") or abbr in current:
+            continue
+        for folder in [output_dir] + [logo_atlas.display_folder(output_dir, size) for size in logo_atlas.DISPLAY_SIZES]:
+            path = os.path.join(folder, name)
+            if os.path.exists(path):
+                os.remove(path)
+        print(f"    {abbr} - no longer in the league, removed")
+        pruned.append(abbr)
+    return pruned
+
+
+def keep_departed(output_dir, logos):
+    """With --no-prune, carry over the manifest entries of teams no longer in
+    the league whose logos were left on disk, so the manifest matches the folder."""
+    previous = logo_atlas.read_manifest(output_dir)
+    for name in os.listdir(output_dir):
+        abbr = name[:-4]
+        if name.lower().endswith(".bmp") and abbr not in logos and abbr in previous:
+            logos[abbr] = previous[abbr]
+    return logos
+
+
+def atlas_current(variant_dir, shared_palette):
+    """True if a baked folder's atlas exists, holds every logo in the folder
+    (the emulator adds missing logos on its own) and was packed with the
+    same palette option."""
+    try:
+        atlas = logo_atlas.AtlasFile(logo_atlas.atlas_path(variant_dir))
+    except (OSError, ValueError):
         return False
+    atlas.close()
+    count = len([name for name in os.listdir(variant_dir) if name.lower().endswith(".bmp")])
+    return atlas.shared_palette == shared_palette and atlas.count == count
 
 
 def main():
-    force = "--force" in sys.argv
+    parser = argparse.ArgumentParser(description="Download ESPN team logos for the sports ticker.")
+    parser.add_argument("--force", action="store_true", help="re-download logos even if they haven't changed")
+    parser.add_argument("--shared-palette", action="store_true",
+                        help="pack each league's 32px atlas with one shared palette (less RAM on the board)")
+    parser.add_argument("--no-prune", action="store_true", help="keep logos of teams no longer in a league")
+    parser.add_argument("--workers", type=int, default=DOWNLOAD_WORKERS,
+                        help=f"concurrent downloads (default {DOWNLOAD_WORKERS})")
+    parser.add_argument("--processes", type=int, default=CONVERT_WORKERS,
+                        help="conversion processes (default: one per CPU)")
+    args = parser.parse_args()
+    force = args.force
 
     print("=" * 50)
     print("  SPORTS TICKER - LOGO DOWNLOADER")
@@ -215,12 +419,17 @@ def main():
     print(f"Pro league colors: {PALETTE_COLORS_PRO}")
     print(f"College colors: {PALETTE_COLORS_COLLEGE}")
     print(f"Output: {OUTPUT_BASE}/")
+    print(f"Downloads: {args.workers} at a time, conversion: {args.processes or os.cpu_count()} processes")
     if force:
         print("Mode: FORCE RE-DOWNLOAD (replacing existing logos)")
     print()
 
-    total_downloaded = 0
-    total_failed = 0
+    totals = {"downloaded": 0, "baked": 0, "unchanged": 0, "failed": 0, "pruned": 0}
+    started = time.monotonic()
+
+    session = make_session(args.workers)
+    download_pool = ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="logo")
+    convert_pool = ProcessPoolExecutor(max_workers=args.processes)
 
     for league, sport in SPORTS.items():
         folder = FOLDERS[league]
@@ -231,26 +440,47 @@ def main():
         print(f"  {league.upper()} -> {folder}/")
         print(f"{'=' * 40}")
 
-        teams = get_teams(sport, league)
+        teams = get_teams(sport, league, session)
         if not teams:
             print(f"  No teams found for {league.upper()}")
             continue
 
         print(f"  Found {len(teams)} teams\n")
 
-        for team in teams:
-            result = download_and_convert_logo(team, output_dir, league, force=force)
-            if result:
-                total_downloaded += 1
-            else:
-                total_failed += 1
+        logos, counts = download_league(teams, output_dir, league, force, session, download_pool, convert_pool)
+        if args.no_prune:
+            pruned = []
+            keep_departed(output_dir, logos)
+        else:
+            pruned = prune_league(output_dir, teams)
+        for status, count in counts.items():
+            totals[status] += count
+        totals["pruned"] += len(pruned)
+        logo_atlas.write_manifest(output_dir, logos)
+
+        # Repack the league's atlases only if something in it changed
+        changed = counts["downloaded"] or counts["baked"] or pruned
+        for size in logo_atlas.DISPLAY_SIZES:
+            variant_dir = logo_atlas.display_folder(output_dir, size)
+            shared = args.shared_palette and size == logo_atlas.BOARD_SIZE
+            if os.path.isdir(variant_dir) and (changed or not atlas_current(variant_dir, shared)):
+                logo_atlas.build_atlas(variant_dir, shared_palette=shared)
+
+    download_pool.shutdown()
+    convert_pool.shutdown()
+    session.close()
 
     # Summary
     print(f"\n{'=' * 50}")
     print(f"  DONE")
     print(f"{'=' * 50}")
-    print(f"  Downloaded: {total_downloaded}")
-    print(f"  Failed: {total_failed}")
+    print(f"  Downloaded: {totals['downloaded']}")
+    print(f"  Unchanged: {totals['unchanged']}")
+    if totals["baked"]:
+        print(f"  Re-baked: {totals['baked']}")
+    print(f"  Pruned: {totals['pruned']}")
+    print(f"  Failed: {totals['failed']}")
+    print(f"  Time: {time.monotonic() - started:.1f}s")
 
     print(f"\n  Logo folders:")
     for league, folder in FOLDERS.items():
@@ -263,10 +493,16 @@ def main():
             )
             print(f"    {path}/ - {count} logos ({total_size / 1024:.0f}KB)")
 
+    print(f"\n  Logo atlases:")
+    for name in sorted(os.listdir(OUTPUT_BASE)):
+        if name.endswith(logo_atlas.ATLAS_SUFFIX):
+            path = os.path.join(OUTPUT_BASE, name)
+            print(f"    {path} ({os.path.getsize(path) / 1024:.0f}KB)")
+
     print(f"\nTo use with the emulator:")
     print(f"  Copy the '{OUTPUT_BASE}/' folder into your emulator_ticker/ directory")
     print(f"\nTo use with the hardware:")
-    print(f"  Copy each team*_logos/ folder to the root of your CIRCUITPY drive")
+    print(f"  Copy each team*_logos_32.atlas file (and the team*_logos/ folders as a fallback) to the root of your CIRCUITPY drive")
 
 
 if __name__ == "__main__":
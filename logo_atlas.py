@@ -0,0 +1,490 @@
+"""
+Logo Atlas - one packed file per league instead of hundreds of little BMPs
+Packs every logo in a team*_logos folder into a single <folder>.atlas file
+with a fixed-stride layout, so a logo can be found with a few small reads
+(CircuitPython) or sliced straight out of a memory map (PC) instead of
+opening one file per team. The CFB folder alone is 449 files.
+
+It also bakes the display-ready versions of each logo: background keyed
+to black, dark logos brightened, resized with NEAREST to 24px (emulator)
+and 32px (hardware). Those go in team*_logos_24/ and team*_logos_32/, with
+a manifest.json in the source folder recording what was done to each logo,
+and the atlases are packed from them - so neither target has any per-logo
+work left at runtime beyond copying pixels.
+
+Build (on your PC, needs Pillow):
+    python logo_atlas.py                  # every folder under sport_logos/
+    python logo_atlas.py sport_logos/team2_logos
+    python logo_atlas.py --shared-palette # one palette per league for the board
+
+Copy team*_logos_32.atlas to the root of CIRCUITPY. get_team_logos.py
+bakes and packs everything after downloading.
+
+File layout (little-endian):
+
+    header   16 bytes   magic "LOGA", version u8, flags u8, count u16,
+                        width u16, height u16, stride u32
+    index    count x 16 bytes, sorted by abbreviation:
+                        abbreviation (12 bytes, NUL padded), offset u32
+    records  count x stride bytes, each:
+                        colors u16, kind u8, reserved u8,
+                        palette 256 x RGB (768 bytes),
+                        pixels width x height palette indices, top row first
+
+With FLAG_SHARED_PALETTE set, every record carries the same palette, so a
+reader can build one palette for the whole league and skip the rest.
+
+The reader half of this file runs on CircuitPython and regular Python.
+"""
+
+import struct
+
+MAGIC = b"LOGA"
+VERSION = 1
+HEADER = "<4sBBHHHI"
+HEADER_SIZE = 16
+INDEX_ENTRY = "<12sI"
+INDEX_ENTRY_SIZE = 16
+NAME_SIZE = 12
+RECORD_HEADER = "<HBB"
+RECORD_HEADER_SIZE = 4
+PALETTE_SIZE = 768
+
+# Header flags
+FLAG_SHARED_PALETTE = 0x01  # Every record uses the same palette
+
+# Record kinds
+KIND_PALETTE = 0    # Indexed color, palette holds the colors
+KIND_GRAYSCALE = 1  # Grayscale source, palette is a 0..255 ramp
+
+ATLAS_SUFFIX = ".atlas"
+
+# Baked display sizes: the emulator draws 24px logos, the board 32px
+DISPLAY_SIZES = (24, 32)
+BOARD_SIZE = 32
+MANIFEST_NAME = "manifest.json"
+
+
+def atlas_path(folder_path):
+    """The atlas file that goes with a logo folder (team2_logos -> team2_logos.atlas)."""
+    return folder_path.rstrip("/\\") + ATLAS_SUFFIX
+
+
+def display_folder(folder_path, size):
+    """Where the baked size x size logos for a folder go (team2_logos -> team2_logos_24)."""
+    return folder_path.rstrip("/\\") + "_" + str(size)
+
+
+def _record_offset(count, stride, position):
+    return HEADER_SIZE + count * INDEX_ENTRY_SIZE + position * stride
+
+
+def _pad_name(abbr):
+    name = abbr.encode("ascii")
+    if len(name) > NAME_SIZE:
+        raise ValueError(f"abbreviation too long for atlas: {abbr}")
+    return name + b"\0" * (NAME_SIZE - len(name))
+
+
+# ============================================================
+#  READERS
+# ============================================================
+class AtlasFile:
+    """Seek-based reader. Keeps only the header in RAM - each lookup is a
+    binary search over the on-disk index, then one read of the record."""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        header = self.file.read(HEADER_SIZE)
+        magic, version, self.flags, self.count, self.width, self.height, self.stride = struct.unpack(HEADER, header)
+        if magic != MAGIC or version != VERSION:
+            self.file.close()
+            raise ValueError(f"{path} is not a logo atlas")
+        self._entry = bytearray(INDEX_ENTRY_SIZE)
+        self._record_header = bytearray(RECORD_HEADER_SIZE)
+
+    def close(self):
+        self.file.close()
+
+    @property
+    def shared_palette(self):
+        return bool(self.flags & FLAG_SHARED_PALETTE)
+
+    def read_palette(self, palette_buf):
+        """Read the first record's palette (the league's palette in a shared
+        atlas). Returns the color count, or 0 for an empty atlas."""
+        if not self.count:
+            return 0
+        self.file.seek(_record_offset(self.count, self.stride, 0))
+        self.file.readinto(self._record_header)
+        colors = struct.unpack(RECORD_HEADER, self._record_header)[0]
+        self.file.readinto(palette_buf)
+        return colors
+
+    def find(self, abbr):
+        """Offset of a team's record, or -1 if it isn't in the atlas."""
+        try:
+            name = _pad_name(abbr)
+        except (ValueError, UnicodeError):
+            return -1
+        lo = 0
+        hi = self.count - 1
+        entry = self._entry
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            self.file.seek(HEADER_SIZE + mid * INDEX_ENTRY_SIZE)
+            self.file.readinto(entry)
+            probe = bytes(entry[:NAME_SIZE])
+            if probe == name:
+                return struct.unpack_from("<I", entry, NAME_SIZE)[0]
+            if probe < name:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return -1
+
+    def read(self, abbr, palette_buf, pixel_buf):
+        """Read a logo into caller-owned buffers (768 and width*height bytes).
+        Pass palette_buf=None to skip the palette (shared palette atlases).
+
+        Returns (colors, kind), or None if the team isn't in the atlas.
+        """
+        offset = self.find(abbr)
+        if offset < 0:
+            return None
+        self.file.seek(offset)
+        self.file.readinto(self._record_header)
+        colors, kind, _ = struct.unpack(RECORD_HEADER, self._record_header)
+        if palette_buf is None:
+            self.file.seek(offset + RECORD_HEADER_SIZE + PALETTE_SIZE)
+        else:
+            self.file.readinto(palette_buf)
+        self.file.readinto(pixel_buf)
+        return colors, kind
+
+
+class MappedAtlas:
+    """Memory-mapped reader for the PC. Lookups hit an in-RAM dict, and logo
+    pixels are memoryview slices of the map - nothing is copied until used."""
+
+    def __init__(self, path):
+        import mmap
+
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+        magic, version, self.flags, self.count, self.width, self.height, self.stride = struct.unpack_from(
+            HEADER, self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a logo atlas")
+
+        self.offsets = {}
+        for position in range(self.count):
+            name, offset = struct.unpack_from(INDEX_ENTRY, self.map, HEADER_SIZE + position * INDEX_ENTRY_SIZE)
+            self.offsets[name.rstrip(b"\0").decode("ascii")] = offset
+
+    def __contains__(self, abbr):
+        return abbr in self.offsets
+
+    def record(self, abbr):
+        """(colors, kind, palette view, pixels view) for a team, or None."""
+        offset = self.offsets.get(abbr)
+        if offset is None:
+            return None
+        colors, kind, _ = struct.unpack_from(RECORD_HEADER, self.map, offset)
+        palette_start = offset + RECORD_HEADER_SIZE
+        pixels_start = palette_start + PALETTE_SIZE
+        return (
+            colors, kind,
+            self.view[palette_start:pixels_start],
+            self.view[pixels_start:pixels_start + self.width * self.height],
+        )
+
+    def image(self, abbr):
+        """A team's logo as a PIL Image in its original mode ("P" or "L"), or None."""
+        from PIL import Image
+
+        record = self.record(abbr)
+        if record is None:
+            return None
+        colors, kind, palette, pixels = record
+        size = (self.width, self.height)
+        if kind == KIND_GRAYSCALE:
+            return Image.frombuffer("L", size, pixels, "raw", "L", 0, 1)
+        logo = Image.frombuffer("P", size, pixels, "raw", "P", 0, 1)
+        logo.putpalette(bytes(palette[:colors * 3]))
+        return logo
+
+    def close(self):
+        self.view.release()
+        self.map.close()
+
+
+# ============================================================
+#  BUILDER (PC only)
+# ============================================================
+def shared_palette_image(logos, colors=256):
+    """One palette for a whole set of logos: a median cut over every logo's
+    pixels at once, with black pinned to index 0 so baked backgrounds stay
+    exactly black. Returns a 1x1 "P" image to pass to Image.quantize()."""
+    from PIL import Image
+
+    width, height = logos[0].size
+    sheet = Image.new("RGB", (width * len(logos), height))
+    for position, logo in enumerate(logos):
+        sheet.paste(logo.convert("RGB"), (position * width, 0))
+    quantized = sheet.quantize(colors=colors - 1, method=Image.Quantize.MEDIANCUT)
+    palette = [0, 0, 0] + quantized.getpalette()[:(colors - 1) * 3]
+    palette_image = Image.new("P", (1, 1))
+    palette_image.putpalette(palette)
+    return palette_image
+
+
+def build_atlas(folder_path, output_path=None, shared_palette=False):
+    """Pack every .bmp in folder_path into one atlas. Returns (path, count).
+
+    With shared_palette, every logo is remapped (no dithering) to one palette
+    optimized for the whole folder, instead of keeping its own.
+    """
+    import os
+    from PIL import Image
+
+    output_path = output_path or atlas_path(folder_path)
+    names = sorted(
+        name for name in os.listdir(folder_path)
+        if name.lower().endswith(".bmp")
+    )
+
+    logos = []
+    size = None
+    for name in names:
+        abbr = name[:-4]
+        logo = Image.open(os.path.join(folder_path, name))
+        if size is None:
+            size = logo.size
+        elif logo.size != size:
+            print(f"  {abbr} is {logo.size[0]}x{logo.size[1]}, expected {size[0]}x{size[1]} - skipping")
+            continue
+        logos.append((abbr, logo))
+
+    flags = 0
+    if shared_palette and logos:
+        flags |= FLAG_SHARED_PALETTE
+        palette_image = shared_palette_image([logo for _, logo in logos])
+        logos = [
+            (abbr, logo.convert("RGB").quantize(palette=palette_image, dither=Image.Dither.NONE))
+            for abbr, logo in logos
+        ]
+
+    records = []
+    for abbr, logo in logos:
+        if logo.mode == "L":
+            kind = KIND_GRAYSCALE
+            palette = bytes(value for level in range(256) for value in (level, level, level))
+        else:
+            if logo.mode != "P":
+                logo = logo.convert("RGB").quantize(colors=256)
+            kind = KIND_PALETTE
+            palette = bytes(logo.getpalette()[:PALETTE_SIZE])
+        colors = len(palette) // 3
+        record = struct.pack(RECORD_HEADER, colors, kind, 0) + palette.ljust(PALETTE_SIZE, b"\0") + logo.tobytes()
+        records.append((_pad_name(abbr), record))
+
+    width, height = size or (0, 0)
+    stride = RECORD_HEADER_SIZE + PALETTE_SIZE + width * height
+    count = len(records)
+    records.sort()
+
+    with open(output_path, "wb") as f:
+        f.write(struct.pack(HEADER, MAGIC, VERSION, flags, count, width, height, stride))
+        for position, (name, _) in enumerate(records):
+            f.write(struct.pack(INDEX_ENTRY, name, _record_offset(count, stride, position)))
+        for _, record in records:
+            f.write(record)
+    return output_path, count
+
+
+# ---- DISPLAY BAKING ----
+# The transforms the emulator used to run on every logo load. A source logo
+# keeps its palette; only the palette entries change, so the baked logo is
+# still indexed color and packs into an atlas the same way.
+def display_transforms(logo):
+    """Work out how to make a source logo display-ready. Returns a dict that
+    goes into the folder manifest and can be handed back to bake_logo()."""
+    if logo.mode != "P":
+        return {"mode": logo.mode}
+
+    palette = logo.getpalette()  # flat list: [r0, g0, b0, r1, g1, b1, ...]
+    width, height = logo.size
+
+    # Background: most common index in the corner pixels
+    corners = [
+        logo.getpixel((0, 0)),
+        logo.getpixel((width - 1, 0)),
+        logo.getpixel((0, height - 1)),
+        logo.getpixel((width - 1, height - 1)),
+    ]
+    bg_index = max(set(corners), key=corners.count)
+
+    # Brightest channel among the non-background colors actually used
+    max_channel = 0
+    for _, idx in logo.getcolors(256):
+        if idx != bg_index:
+            max_channel = max(max_channel, palette[idx * 3], palette[idx * 3 + 1], palette[idx * 3 + 2])
+
+    # Very dark logos get scaled up so they show on the panel
+    if max_channel > 0 and max_channel < 80:
+        brightness_scale = 200.0 / max_channel
+    elif max_channel > 0 and max_channel < 150:
+        brightness_scale = 255.0 / max_channel
+    else:
+        brightness_scale = 1.0
+
+    return {
+        "mode": "P",
+        "background_index": bg_index,
+        "background": palette[bg_index * 3:bg_index * 3 + 3],
+        "max_channel": max_channel,
+        "brightness_scale": brightness_scale,
+    }
+
+
+def bake_logo(logo, size, transforms=None):
+    """A display-ready size x size copy of a source logo.
+
+    Palette logos come back in "P" mode with the background entry black and
+    the rest brightened; grayscale logos stay "L"; anything else comes back
+    RGB on black.
+    """
+    from PIL import Image
+
+    transforms = transforms or display_transforms(logo)
+    if logo.mode == "P":
+        palette = logo.getpalette()
+        bg_index = transforms["background_index"]
+        scale = transforms["brightness_scale"]
+        lut = []
+        for idx in range(len(palette) // 3):
+            if idx == bg_index:
+                lut.extend((0, 0, 0))  # Background = black (off on the LEDs)
+            else:
+                for channel in palette[idx * 3:idx * 3 + 3]:
+                    lut.append(min(255, int(channel * scale)))
+        logo = logo.copy()
+        logo.putpalette(lut)
+    elif logo.mode == "RGBA":
+        background = Image.new("RGB", logo.size, (0, 0, 0))
+        background.paste(logo, mask=logo.split()[3])
+        logo = background
+    elif logo.mode != "L":
+        logo = logo.convert("RGB")
+    return logo.resize((size, size), Image.NEAREST)
+
+
+def bake_variants(source_path, sizes=DISPLAY_SIZES):
+    """Write the baked variants of one source .bmp into its size folders.
+    Returns the logo's manifest entry."""
+    import os
+    from PIL import Image
+
+    folder_path, name = os.path.split(source_path)
+    logo = Image.open(source_path)
+    transforms = display_transforms(logo)
+    for size in sizes:
+        output_dir = display_folder(folder_path, size)
+        os.makedirs(output_dir, exist_ok=True)
+        bake_logo(logo, size, transforms).save(os.path.join(output_dir, name), format="BMP")
+    return transforms
+
+
+def read_manifest(folder_path):
+    """The logos recorded in <folder>/manifest.json, or {} if there isn't one."""
+    import json
+    import os
+
+    try:
+        with open(os.path.join(folder_path, MANIFEST_NAME)) as f:
+            return json.load(f).get("logos", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(folder_path, logos, sizes=DISPLAY_SIZES):
+    """Record what was baked from a source folder in <folder>/manifest.json.
+
+    Each logo's entry holds its bake transforms, plus whatever else the
+    caller tracks (get_team_logos.py adds the source URL, ETag and hashes).
+    """
+    import json
+    import os
+
+    manifest = {
+        "version": 1,
+        "sizes": list(sizes),
+        "resample": "nearest",
+        "variants": [os.path.basename(display_folder(folder_path, size)) for size in sizes],
+        "logos": logos,
+    }
+    path = os.path.join(folder_path, MANIFEST_NAME)
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return path
+
+
+def bake_folder(folder_path, sizes=DISPLAY_SIZES):
+    """Bake every .bmp in a source folder and write its manifest. Returns the logo count."""
+    import os
+
+    previous = read_manifest(folder_path)
+    logos = {}
+    for name in sorted(os.listdir(folder_path)):
+        if name.lower().endswith(".bmp"):
+            abbr = name[:-4]
+            transforms = bake_variants(os.path.join(folder_path, name), sizes)
+            logos[abbr] = dict(previous.get(abbr, {}), **transforms)
+    write_manifest(folder_path, logos, sizes)
+    return len(logos)
+
+
+def source_folders(base_path="sport_logos"):
+    """The downloaded team*_logos folders under base_path (not the baked ones)."""
+    import os
+
+    return [
+        os.path.join(base_path, folder)
+        for folder in sorted(os.listdir(base_path))
+        if folder.startswith("team") and folder.endswith("_logos")
+        and os.path.isdir(os.path.join(base_path, folder))
+    ]
+
+
+def build_all(base_path="sport_logos", sizes=DISPLAY_SIZES, shared_palette=False):
+    """Pack an atlas for every baked team*_logos_<size> folder under base_path.
+    shared_palette applies to the board-size atlases only."""
+    import os
+
+    built = []
+    for folder_path in source_folders(base_path):
+        for size in sizes:
+            variant_path = display_folder(folder_path, size)
+            if os.path.isdir(variant_path):
+                built.append(build_atlas(variant_path, shared_palette=shared_palette and size == BOARD_SIZE))
+    return built
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    # Bake from the source folders, then pack the baked folders
+    shared = "--shared-palette" in sys.argv
+    folders = [arg for arg in sys.argv[1:] if not arg.startswith("--")] or source_folders()
+    for folder_path in folders:
+        bake_folder(folder_path)
+    results = [
+        build_atlas(display_folder(folder_path, size), shared_palette=shared and size == BOARD_SIZE)
+        for folder_path in folders
+        for size in DISPLAY_SIZES
+    ]
+    for path, count in results:
+        print(f"  {path} - {count} logos ({os.path.getsize(path) / 1024:.0f}KB)")
@@ -0,0 +1,437 @@
+"""
+Mock ESPN Server - Local stand-in for site.api.espn.com
+Serves scoreboard and teams payloads for all seven leagues so the ticker scripts
+can be run, benchmarked and tested offline, with controllable latency, errors
+and payload sizes.
+
+Payloads come from fixtures/espn/<slug>_scoreboard.json and <slug>_teams.json
+when present (record them with --record). Any fixture that is missing is
+generated from the team abbreviations in sport_logos/, with a mix of live,
+final and scheduled games around the current time.
+
+Run:
+    python mock_espn_server.py                          # http://127.0.0.1:8765
+    python mock_espn_server.py --latency 0.3 --latency cfb=2.0
+    python mock_espn_server.py --error-rate 0.1 --fail chk
+    python mock_espn_server.py --events cfb=300
+    python mock_espn_server.py --logo-latency 0.05      # CDN-like delay on logo images
+    python mock_espn_server.py --record                 # save real ESPN payloads
+
+Then point the scripts at it:
+    ESPN_BASE_URL=http://127.0.0.1:8765/apis/site/v2/sports python emulator_ticker.py
+
+(On the hardware, add ESPN_BASE_URL to settings.toml and run the server with
+--host 0.0.0.0 so the board can reach it.)
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from email.utils import formatdate
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ESPN_BASE_URL = "https://site.api.espn.com/apis/site/v2/sports"
+API_PREFIX = "/apis/site/v2/sports"
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(SCRIPT_DIR, "fixtures", "espn")
+LOGO_BASE_PATH = os.path.join(SCRIPT_DIR, "sport_logos")
+
+# Same league tables as the ticker scripts
+SPORTS = {
+    "nfl": "football", "mlb": "baseball", "nhl": "hockey", "nba": "basketball",
+    "cfb": "football", "cbb": "basketball", "chk": "hockey",
+}
+ESPN_SLUGS = {
+    "nfl": "nfl", "mlb": "mlb", "nhl": "nhl", "nba": "nba",
+    "cfb": "college-football",
+    "cbb": "mens-college-basketball",
+    "chk": "mens-college-hockey",
+}
+FOLDERS = {
+    "nfl": "team0_logos", "mlb": "team1_logos", "nhl": "team2_logos", "nba": "team3_logos",
+    "cfb": "team4_logos", "cbb": "team5_logos", "chk": "team6_logos",
+}
+
+# Typical number of events on a generated scoreboard
+DEFAULT_EVENTS = {
+    "nfl": 14, "mlb": 15, "nhl": 12, "nba": 10,
+    "cfb": 60, "cbb": 150, "chk": 20,
+}
+
+LIVE_DETAILS = {
+    "football": "2nd 12:30", "baseball": "Top 5th",
+    "hockey": "2nd 8:14", "basketball": "3rd 5:42",
+}
+
+
+# ============================================================
+#  PAYLOAD GENERATION
+# ============================================================
+def espn_date(dt):
+    return dt.strftime("%Y-%m-%dT%H:%MZ")
+
+
+def make_competitor(event_id, side, abbr, score):
+    """Build an ESPN-style competitor with the usual bulk (links, records, leaders)."""
+    return {
+        "id": f"{event_id}{side}", "uid": f"s:20~l:23~t:{event_id}{side}", "type": "team",
+        "order": side, "homeAway": "home" if side == 0 else "away", "winner": False,
+        "team": {
+            "id": f"{event_id}{side}", "abbreviation": abbr,
+            "displayName": f"{abbr} Team Name", "shortDisplayName": abbr, "name": abbr,
+            "location": f"{abbr} Location", "color": "000000", "alternateColor": "ffffff",
+            "isActive": True, "venue": {"id": "1"},
+            "links": [{"rel": ["clubhouse", "desktop", "team"],
+                       "href": f"https://www.espn.com/team/_/id/{event_id}",
+                       "text": "Clubhouse", "isExternal": False, "isPremium": False}] * 3,
+            "logo": f"https://a.espncdn.com/i/teamlogos/500/{abbr}.png",
+        },
+        "score": str(score),
+        "linescores": [{"value": float(q)} for q in range(4)],
+        "statistics": [{"name": "points", "abbreviation": "PTS", "displayValue": str(score)}] * 4,
+        "records": [{"name": "overall", "abbreviation": "Any", "type": "total", "summary": "7-2"}] * 3,
+        "leaders": [{"name": "passingYards", "displayName": "Passing Leader",
+                     "leaders": [{"displayValue": "18/27, 231 YDS, 2 TD",
+                                  "athlete": {"id": "4432", "fullName": "Some Player",
+                                              "headshot": "https://a.espncdn.com/i/headshots/x.png"}}]}] * 3,
+    }
+
+
+def make_event(event_id, home, away, status="STATUS_IN_PROGRESS", detail="2nd 12:30",
+               date="2025-01-18T00:00Z", home_score=14, away_score=10):
+    """Build an ESPN-style scoreboard event, roughly the size of a real one."""
+    state = {"STATUS_IN_PROGRESS": "in", "STATUS_FINAL": "post"}.get(status, "pre")
+    status_block = {
+        "clock": 750.0, "displayClock": "12:30", "period": 2,
+        "type": {"id": "2", "name": status, "state": state, "completed": state == "post",
+                 "description": detail, "detail": detail, "shortDetail": detail},
+    }
+    return {
+        "id": str(event_id), "uid": f"s:20~l:23~e:{event_id}",
+        "date": date,
+        "name": f"{away} at {home}", "shortName": f"{away} @ {home}",
+        "season": {"year": 2025, "type": 2, "slug": "regular-season"},
+        "competitions": [{
+            "id": str(event_id), "date": date, "attendance": 0,
+            "venue": {"id": "1", "fullName": "Some Stadium",
+                      "address": {"city": "Somewhere", "state": "MA"}, "indoor": False},
+            "competitors": [
+                make_competitor(event_id, 0, home, home_score),
+                make_competitor(event_id, 1, away, away_score),
+            ],
+            "notes": [], "status": status_block,
+            "broadcasts": [{"market": "national", "names": ["ESPN"]}],
+            "odds": [{"provider": {"id": "58", "name": "ESPN BET"}, "details": f"{home} -3.5",
+                      "overUnder": 51.5}],
+        }],
+        "links": [{"language": "en-US", "rel": ["summary", "desktop", "event"],
+                   "href": f"https://www.espn.com/game/_/gameId/{event_id}",
+                   "text": "Gamecast", "shortText": "Gamecast"}] * 4,
+        "weather": {"displayValue": "Cloudy", "temperature": 55},
+        "status": status_block,
+    }
+
+
+def league_teams(league):
+    """Team abbreviations for a league, from its sport_logos folder."""
+    folder = os.path.join(LOGO_BASE_PATH, FOLDERS[league])
+    if not os.path.isdir(folder):
+        return [f"T{i}" for i in range(40)]
+    return sorted(f[:-4] for f in os.listdir(folder) if f.endswith(".bmp"))
+
+
+def make_scoreboard(league, count=None, seed=0):
+    """Generate a scoreboard: a third live, a third final, a third scheduled."""
+    count = DEFAULT_EVENTS[league] if count is None else count
+    rng = random.Random(f"{league}-{seed}")
+    teams = league_teams(league)
+    now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    events = []
+    for i in range(count):
+        home, away = rng.sample(teams, 2) if len(teams) >= 2 else ("AAA", "BBB")
+        kind = i % 3
+        if kind == 0:
+            status, detail = "STATUS_IN_PROGRESS", LIVE_DETAILS[SPORTS[league]]
+            date = now - timedelta(hours=1)
+        elif kind == 1:
+            status, detail = "STATUS_FINAL", "Final"
+            date = now - timedelta(hours=4)
+        else:
+            status, detail = "STATUS_SCHEDULED", "Scheduled"
+            date = now + timedelta(hours=1 + i % 6)
+        scored = status != "STATUS_SCHEDULED"
+        events.append(make_event(
+            event_id=f"{401000000 + list(SPORTS).index(league) * 100000 + i}",
+            home=home, away=away, status=status, detail=detail, date=espn_date(date),
+            home_score=rng.randint(0, 35) if scored else 0,
+            away_score=rng.randint(0, 35) if scored else 0,
+        ))
+    return {
+        "leagues": [{"id": "1", "name": league.upper(), "abbreviation": league.upper(),
+                     "calendar": [{"label": f"Week {w}", "startDate": "2025-09-01T07:00Z",
+                                   "endDate": "2025-09-08T06:59Z"} for w in range(16)]}],
+        "season": {"type": 2, "year": 2025},
+        "events": events,
+    }
+
+
+def make_teams(league, base_url):
+    """Generate a teams payload whose logo URLs point back at this server."""
+    teams = []
+    for abbr in league_teams(league):
+        teams.append({"team": {
+            "id": abbr, "abbreviation": abbr, "displayName": f"{abbr} Team Name",
+            "logos": [{"href": f"{base_url}/logos/{FOLDERS[league]}/{abbr}.bmp",
+                       "width": 32, "height": 32, "rel": ["full", "default"]}],
+        }})
+    return {"sports": [{"leagues": [{"teams": teams}]}]}
+
+
+def resize_events(payload, count):
+    """Grow (by cloning with new ids) or trim a scoreboard to count events."""
+    events = payload.get("events", [])
+    if not events:
+        return payload
+    resized = []
+    for i in range(count):
+        event = events[i % len(events)]
+        if i >= len(events):
+            event = json.loads(json.dumps(event))
+            event["id"] = f"{event['id']}{i}"
+        resized.append(event)
+    return dict(payload, events=resized)
+
+
+# ============================================================
+#  FIXTURES
+# ============================================================
+def fixture_path(league, kind):
+    return os.path.join(FIXTURE_DIR, f"{ESPN_SLUGS[league]}_{kind}.json")
+
+
+def load_fixture(league, kind):
+    """Recorded payload for a league, or None if there isn't one."""
+    path = fixture_path(league, kind)
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return json.load(f)
+
+
+def record_fixtures():
+    """Download real ESPN scoreboard and teams payloads into fixtures/espn/."""
+    import requests
+
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for league, sport in SPORTS.items():
+        slug = ESPN_SLUGS[league]
+        for kind, suffix in (("scoreboard", "scoreboard"), ("teams", "teams?limit=500")):
+            url = f"{ESPN_BASE_URL}/{sport}/{slug}/{suffix}"
+            print(f"Recording {league.upper()} {kind}...")
+            try:
+                resp = requests.get(url, timeout=15)
+                resp.raise_for_status()
+                with open(fixture_path(league, kind), "wb") as f:
+                    f.write(resp.content)
+                print(f"  {len(resp.content) / 1024:.0f}KB -> {fixture_path(league, kind)}")
+            except Exception as e:
+                print(f"  Error recording {league.upper()} {kind}: {e}")
+
+
+# ============================================================
+#  SERVER
+# ============================================================
+class MockConfig:
+    """Knobs for shaping the responses. Per-league values override defaults."""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0):
+        self.latency = latency          # seconds before every response
+        self.league_latency = {}        # league -> seconds
+        self.logo_latency = 0.0         # seconds before every logo image
+        self.jitter = jitter            # +/- random seconds added to latency
+        self.error_rate = error_rate    # chance (0-1) of a 503 response
+        self.fail_leagues = set()       # leagues that always return 500
+        self.event_counts = {}          # league -> events on the scoreboard
+        self.requests = 0               # requests served (for benchmarks)
+
+
+def make_handler(config):
+    slug_leagues = {slug: league for league, slug in ESPN_SLUGS.items()}
+    rng = random.Random()
+    cache = {}
+    lock = threading.Lock()
+
+    def payload_for(league, kind, base_url):
+        key = (league, kind, config.event_counts.get(league))
+        with lock:
+            if key not in cache:
+                payload = load_fixture(league, kind)
+                if kind == "teams":
+                    payload = payload or make_teams(league, base_url)
+                else:
+                    count = config.event_counts.get(league)
+                    if payload is None:
+                        payload = make_scoreboard(league, count)
+                    elif count is not None:
+                        payload = resize_events(payload, count)
+                cache[key] = json.dumps(payload).encode()
+            return cache[key]
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def send_body(self, status, body, content_type="application/json", headers=None):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            config.requests += 1
+            path = self.path.split("?")[0].rstrip("/")
+
+            # Logo images for the generated teams payloads, with an ETag and
+            # Last-Modified so conditional requests get a 304 like the CDN
+            if path.startswith("/logos/"):
+                if config.logo_latency > 0:
+                    time.sleep(config.logo_latency)
+                logo_path = os.path.join(LOGO_BASE_PATH, *path.split("/")[2:4])
+                if os.path.isfile(logo_path):
+                    with open(logo_path, "rb") as f:
+                        body = f.read()
+                    headers = {
+                        "ETag": f'"{hashlib.md5(body).hexdigest()}"',
+                        "Last-Modified": formatdate(os.path.getmtime(logo_path), usegmt=True),
+                    }
+                    if self.headers.get("If-None-Match") == headers["ETag"]:
+                        self.send_body(304, b"", "image/bmp", headers)
+                    else:
+                        self.send_body(200, body, "image/bmp", headers)
+                else:
+                    self.send_body(404, b"{}")
+                return
+
+            # /apis/site/v2/sports/{sport}/{slug}/{scoreboard|teams}
+            parts = path[len(API_PREFIX):].strip("/").split("/")
+            if not path.startswith(API_PREFIX) or len(parts) != 3 or parts[1] not in slug_leagues \
+                    or parts[2] not in ("scoreboard", "teams"):
+                self.send_body(404, b'{"code": 404, "message": "Not found"}')
+                return
+            league, kind = slug_leagues[parts[1]], parts[2]
+
+            delay = config.league_latency.get(league, config.latency)
+            if config.jitter:
+                delay += rng.uniform(-config.jitter, config.jitter)
+            if delay > 0:
+                time.sleep(delay)
+
+            if league in config.fail_leagues:
+                self.send_body(500, b'{"code": 500, "message": "Injected failure"}')
+                return
+            if config.error_rate and rng.random() < config.error_rate:
+                self.send_body(503, b'{"code": 503, "message": "Injected error"}')
+                return
+
+            host = self.headers.get("Host", f"127.0.0.1:{self.server.server_address[1]}")
+            self.send_body(200, payload_for(league, kind, f"http://{host}"))
+
+        def log_message(self, fmt, *args):
+            if self.server.verbose:
+                super().log_message(fmt, *args)
+
+    return Handler
+
+
+def start_server(config=None, host="127.0.0.1", port=0, verbose=False):
+    """Start the mock server on a background thread. Returns the server;
+    its base URL for ESPN_BASE_URL is base_url(server)."""
+    server = ThreadingHTTPServer((host, port), make_handler(config or MockConfig()))
+    server.daemon_threads = True
+    server.verbose = verbose
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def base_url(server):
+    host, port = server.server_address[:2]
+    if host == "0.0.0.0":
+        host = "127.0.0.1"
+    return f"http://{host}:{port}{API_PREFIX}"
+
+
+def parse_league_values(values, default_type=float):
+    """Split ["0.3", "cfb=2"] into (default, {"cfb": 2.0})."""
+    default = None
+    per_league = {}
+    for value in values or []:
+        if "=" in value:
+            league, amount = value.split("=", 1)
+            if league not in SPORTS:
+                raise SystemExit(f"Unknown league '{league}'. Choose from: {', '.join(SPORTS)}")
+            per_league[league] = default_type(amount)
+        else:
+            default = default_type(value)
+    return default, per_league
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the ESPN site API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", action="append", metavar="[LEAGUE=]SECONDS",
+                        help="response delay, for all leagues or one league (repeatable)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random +/- seconds on the delay")
+    parser.add_argument("--logo-latency", type=float, default=0.0, help="delay before every logo image")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="chance (0-1) of a 503")
+    parser.add_argument("--fail", action="append", default=[], metavar="LEAGUE",
+                        help="league that always returns 500 (repeatable)")
+    parser.add_argument("--events", action="append", metavar="[LEAGUE=]COUNT",
+                        help="events per scoreboard, for all leagues or one league (repeatable)")
+    parser.add_argument("--record", action="store_true", help="save real ESPN payloads as fixtures and exit")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures()
+        return
+
+    latency, league_latency = parse_league_values(args.latency)
+    config = MockConfig(latency=latency or 0.0, jitter=args.jitter, error_rate=args.error_rate)
+    config.league_latency = league_latency
+    config.logo_latency = args.logo_latency
+    config.fail_leagues = set(args.fail)
+    events, config.event_counts = parse_league_values(args.events, int)
+    if events is not None:
+        config.event_counts = dict({league: events for league in SPORTS}, **config.event_counts)
+
+    server = start_server(config, args.host, args.port, verbose=args.verbose)
+    print("=" * 50)
+    print("  MOCK ESPN SERVER")
+    print("=" * 50)
+    print(f"  ESPN_BASE_URL={base_url(server)}")
+    for league in SPORTS:
+        source = "recorded" if os.path.exists(fixture_path(league, "scoreboard")) else "generated"
+        count = config.event_counts.get(league, "fixture" if source == "recorded" else DEFAULT_EVENTS[league])
+        delay = config.league_latency.get(league, config.latency)
+        fail = "  FAIL" if league in config.fail_leagues else ""
+        print(f"  {league.upper():>4}: {source:>9} scoreboard, {count} events, {delay:.2f}s latency{fail}")
+    print("\nCtrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print(f"\nServed {config.requests} requests.")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
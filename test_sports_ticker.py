@@ -4,6 +4,7 @@ Tests the ESPN API calls and game parsing logic from the CircuitPython sports ti
 without needing any hardware. Run with: python test_sports_ticker.py
 """
 
+import os
 import requests
 from datetime import datetime, timedelta
 
@@ -35,8 +36,11 @@ filter_leagues = []
 # Uses ESPN abbreviations (run with no filters first to see them all)
 filter_teams = []
 
+# Set ESPN_BASE_URL to point at mock_espn_server.py for offline runs
+ESPN_BASE_URL = os.environ.get("ESPN_BASE_URL", "https://site.api.espn.com/apis/site/v2/sports")
+
 SPORT_URLS = [
-    f"https://site.api.espn.com/apis/site/v2/sports/{sport}/{espn_league_slugs[league]}/scoreboard"
+    f"{ESPN_BASE_URL}/{sport}/{espn_league_slugs[league]}/scoreboard"
     for sport, league in zip(sport_names, sport_leagues)
 ]
 
@@ -141,6 +145,21 @@ def fetch_all_games():
 
     return all_games
 
+# --- PER-LEAGUE SUMMARY ---
+def summarize_by_league(games):
+    """One pass over the games: {league: [total, live, final, scheduled]}."""
+    counts = {}
+    for g in games:
+        row = counts.setdefault(g["league"], [0, 0, 0, 0])
+        row[0] += 1
+        if g["is_live"]:
+            row[1] += 1
+        elif g["is_final"]:
+            row[2] += 1
+        elif g["is_scheduled"]:
+            row[3] += 1
+    return counts
+
 # --- SIMULATE DISPLAY ---
 def display_game(game, index, total):
     width = 50
@@ -172,6 +191,7 @@ if __name__ == "__main__":
     print("\n" + "=" * 50)
     print("  SPORTS TICKER - PC TEST")
     print(f"  Timezone: UTC{timezone_info[0]:+d} ({timezone_info[1]})")
+    print(f"  API: {ESPN_BASE_URL}")
     if filter_leagues:
         print(f"  Leagues: {', '.join(l.upper() for l in filter_leagues)}")
     if filter_teams:
@@ -191,13 +211,7 @@ if __name__ == "__main__":
         print(f"{'=' * 50}\n")
 
         # Summarize by league
-        leagues_found = {}
-        for g in games:
-            leagues_found[g["league"]] = leagues_found.get(g["league"], 0) + 1
-        for league, count in leagues_found.items():
-            live = sum(1 for g in games if g["league"] == league and g["is_live"])
-            final = sum(1 for g in games if g["league"] == league and g["is_final"])
-            sched = sum(1 for g in games if g["league"] == league and g["is_scheduled"])
+        for league, (count, live, final, sched) in summarize_by_league(games).items():
             print(f"  {league}: {count} games ({live} live, {final} final, {sched} scheduled)")
 
         print()
@@ -229,11 +243,13 @@ if __name__ == "__main__":
 
     print("\nTest complete! If you saw games above, the API + parsing logic works correctly.")
 
-    # Show what refresh rate the board would use
+    # Show what refresh rate the board would use for each league
     if games:
-        is_live = any(g["is_live"] for g in games)
-        print(f"\n  Smart refresh: {'30s (live games detected)' if is_live else '5min (no live games)'}")
-        print("  The board will automatically switch to 30s refresh when games go live,")
-        print("  and back to 5min when all games are final or scheduled.")
+        print("\n  Smart refresh (per league):")
+        for league, (count, live, final, sched) in sorted(summarize_by_league(games).items()):
+            is_live = live > 0
+            print(f"    {league}: {'30s (live games detected)' if is_live else '5min (no live games)'}")
+        print("  Each league switches to 30s refresh when one of its games goes live,")
+        print("  and back to 5min when its games are final or scheduled.")
 
     print("\nThe code is ready for your hardware.\n")